@@ -1,6 +1,8 @@
 """
 paystack-django: A complete Django integration for Paystack Payment Gateway
 """
+import importlib
+from typing import TYPE_CHECKING
 
 from .exceptions import (
     PaystackError,
@@ -8,8 +10,15 @@ from .exceptions import (
     PaystackValidationError,
     PaystackAuthenticationError,
     PaystackNetworkError,
+    PaystackTimeoutError,
 )
-from .client import PaystackClient
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import PaystackClient
+    from .async_client import AsyncPaystackClient
+    from .registry import get_client
+    from .deadline import paystack_deadline
+
 __version__ = '1.0.0'
 __author__ = 'Humming Byte'
 __email__ = 'dev@hummingbyte.org'
@@ -17,12 +26,38 @@ __license__ = 'MIT'
 
 default_app_config = 'djpaystack.apps.DjPaystackConfig'
 
+# Imported on first access so ``import djpaystack`` does not load requests,
+# httpx or the API modules
+_LAZY_ATTRIBUTES = {
+    'PaystackClient': '.client',
+    'AsyncPaystackClient': '.async_client',
+    'get_client': '.registry',
+    'paystack_deadline': '.deadline',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     'PaystackClient',
+    'AsyncPaystackClient',
+    'get_client',
+    'paystack_deadline',
     'PaystackError',
     'PaystackAPIError',
     'PaystackValidationError',
     'PaystackAuthenticationError',
     'PaystackNetworkError',
+    'PaystackTimeoutError',
 ]
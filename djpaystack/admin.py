@@ -6,6 +6,8 @@ from .models import (
     PaystackSubscription,
     PaystackPlan,
     PaystackTransfer,
+    PaystackCardBin,
+    PaystackAuditLog,
 )
 
 
@@ -67,3 +69,22 @@ class PaystackTransferAdmin(admin.ModelAdmin):
     readonly_fields = ['transfer_code',
                        'created_at', 'updated_at', 'raw_response']
     date_hierarchy = 'created_at'
+
+
+@admin.register(PaystackCardBin)
+class PaystackCardBinAdmin(admin.ModelAdmin):
+    list_display = ['bin', 'brand', 'card_type',
+                    'bank', 'country_code', 'updated_at']
+    list_filter = ['brand', 'card_type', 'country_code']
+    search_fields = ['bin', 'bank']
+    readonly_fields = ['created_at', 'updated_at', 'raw_response']
+
+
+@admin.register(PaystackAuditLog)
+class PaystackAuditLogAdmin(admin.ModelAdmin):
+    list_display = ['method', 'endpoint', 'status_code',
+                    'duration_ms', 'attempts', 'created_at']
+    list_filter = ['method', 'status_code', 'created_at']
+    search_fields = ['endpoint', 'error']
+    readonly_fields = ['created_at', 'updated_at', 'record']
+    date_hierarchy = 'created_at'
@@ -1,31 +1,79 @@
 """
 API endpoint modules
+
+Endpoint classes are imported on first access.
 """
-from .transactions import TransactionAPI
-from .splits import SplitAPI
-from .terminal import TerminalAPI
-from .virtual_terminal import VirtualTerminalAPI
-from .customers import CustomerAPI
-from .direct_debit import DirectDebitAPI
-from .dedicated_accounts import DedicatedAccountAPI
-from .apple_pay import ApplePayAPI
-from .subaccounts import SubaccountAPI
-from .plans import PlanAPI
-from .subscriptions import SubscriptionAPI
-from .products import ProductAPI
-from .pages import PageAPI
-from .payment_requests import PaymentRequestAPI
-from .settlements import SettlementAPI
-from .transfer_recipients import TransferRecipientAPI
-from .transfers import TransferAPI
-from .transfer_control import TransferControlAPI
-from .bulk_charges import BulkChargeAPI
-from .integration import IntegrationAPI
-from .charge import ChargeAPI
-from .disputes import DisputeAPI
-from .refunds import RefundAPI
-from .verification import VerificationAPI
-from .miscellaneous import MiscellaneousAPI
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .transactions import TransactionAPI
+    from .splits import SplitAPI
+    from .terminal import TerminalAPI
+    from .virtual_terminal import VirtualTerminalAPI
+    from .customers import CustomerAPI
+    from .direct_debit import DirectDebitAPI
+    from .dedicated_accounts import DedicatedAccountAPI
+    from .apple_pay import ApplePayAPI
+    from .subaccounts import SubaccountAPI
+    from .plans import PlanAPI
+    from .subscriptions import SubscriptionAPI
+    from .products import ProductAPI
+    from .pages import PageAPI
+    from .payment_requests import PaymentRequestAPI
+    from .settlements import SettlementAPI
+    from .transfer_recipients import TransferRecipientAPI
+    from .transfers import TransferAPI
+    from .transfer_control import TransferControlAPI
+    from .bulk_charges import BulkChargeAPI
+    from .integration import IntegrationAPI
+    from .charge import ChargeAPI
+    from .disputes import DisputeAPI
+    from .refunds import RefundAPI
+    from .verification import VerificationAPI
+    from .miscellaneous import MiscellaneousAPI
+
+_LAZY_ATTRIBUTES = {
+    'TransactionAPI': '.transactions',
+    'SplitAPI': '.splits',
+    'TerminalAPI': '.terminal',
+    'VirtualTerminalAPI': '.virtual_terminal',
+    'CustomerAPI': '.customers',
+    'DirectDebitAPI': '.direct_debit',
+    'DedicatedAccountAPI': '.dedicated_accounts',
+    'ApplePayAPI': '.apple_pay',
+    'SubaccountAPI': '.subaccounts',
+    'PlanAPI': '.plans',
+    'SubscriptionAPI': '.subscriptions',
+    'ProductAPI': '.products',
+    'PageAPI': '.pages',
+    'PaymentRequestAPI': '.payment_requests',
+    'SettlementAPI': '.settlements',
+    'TransferRecipientAPI': '.transfer_recipients',
+    'TransferAPI': '.transfers',
+    'TransferControlAPI': '.transfer_control',
+    'BulkChargeAPI': '.bulk_charges',
+    'IntegrationAPI': '.integration',
+    'ChargeAPI': '.charge',
+    'DisputeAPI': '.disputes',
+    'RefundAPI': '.refunds',
+    'VerificationAPI': '.verification',
+    'MiscellaneousAPI': '.miscellaneous',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     'TransactionAPI',
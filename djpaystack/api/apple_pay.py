@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class ApplePayAPI(BaseAPI):
@@ -10,6 +10,7 @@ class ApplePayAPI(BaseAPI):
         data = {'domainName': domainName}
         return self._post('apple-pay/domain', data=data)
 
+    @paginated
     def list_domains(self, use_cursor: bool = False, per_page: int = 50,
                      page: Optional[int] = None) -> Dict[str, Any]:
         """List Apple Pay domains"""
@@ -1,7 +1,33 @@
 """
 Base API class for all Paystack API endpoints
 """
-from typing import Dict, Any, Optional, List
+import asyncio
+import collections
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, Optional, List, Callable, Iterator, NamedTuple
+
+from .. import tracing
+from ..instrumentation import endpoint_template
+from ..response_cache import CachePolicy, current_policy, response_cache, use_policy
+from .sharding import ShardedFetch
+
+# Progress callback signature: progress(page_number, page_count)
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+# When set, _paginate describes the listing instead of fetching it
+_capture_pagination = contextvars.ContextVar('djpaystack_capture_pagination', default=False)
+
+
+class PaginationRequest(NamedTuple):
+    """Description of a paginated listing, as built by a list method"""
+    endpoint: str
+    params: Dict[str, Any]
+    per_page: int
+    page: Optional[int]
+    # Cache policy of a @cached list method, applied to streamed pages too
+    policy: Optional[CachePolicy] = None
 
 
 class BaseAPI:
@@ -19,7 +45,10 @@ class BaseAPI:
         self.client = client
 
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Make GET request"""
+        """Make GET request, through the response cache inside @cached methods"""
+        policy = current_policy()
+        if policy is not None:
+            return response_cache.get(self.client, policy, endpoint, params)
         return self.client.get(endpoint, params=params)
 
     def _post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -30,9 +59,11 @@ class BaseAPI:
         """Make PUT request"""
         return self.client.put(endpoint, data=data)
 
-    def _delete(self, endpoint: str) -> Dict[str, Any]:
+    def _delete(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make DELETE request"""
-        return self.client.delete(endpoint)
+        if data is None:
+            return self.client.delete(endpoint)
+        return self.client.delete(endpoint, data=data)
 
     def _paginate(
         self,
@@ -54,34 +85,345 @@ class BaseAPI:
             Response data with results
         """
         params = params or {}
+
+        if _capture_pagination.get():
+            return PaginationRequest(endpoint, params, per_page, page, current_policy())
+
         params['perPage'] = per_page
 
         if page is not None:
             params['page'] = page
             return self._get(endpoint, params=params)
 
-        # Fetch all pages if page is None
+        if self.client.is_async:
+            return self._apaginate(endpoint, params)
+
+        return self._paginate_all(endpoint, params)
+
+    @tracing.traced('paystack.paginate')
+    def _paginate_all(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch all pages for _paginate"""
+        tracing.set_attributes(endpoint=endpoint_template(endpoint))
         all_results = []
-        current_page = 1
 
-        while True:
-            params['page'] = current_page
-            response = self._get(endpoint, params=params)
+        if params.get('use_cursor'):
+            pages = self._iter_cursor_pages(endpoint, params)
+        else:
+            pages = self._iter_pages(endpoint, params)
 
+        for response in pages:
             data = response.get('data', [])
-            if isinstance(data, list):
-                all_results.extend(data)
-            else:
+            if not isinstance(data, list):
                 # Handle single object response
                 return response
+            all_results.extend(data)
+
+        tracing.set_attributes(items=len(all_results))
+
+        # Return combined results
+        return {
+            'status': True,
+            'message': 'Success',
+            'data': all_results
+        }
 
-            meta = response.get('meta', {})
-            if not meta or current_page >= meta.get('pageCount', 1):
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        start_page: int = 1,
+        progress: Optional[ProgressCallback] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield raw page responses one at a time
+
+        Only one page is held in memory, and stopping iteration stops
+        fetching.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters (including perPage)
+            start_page: First page to fetch
+            progress: Optional callback invoked as progress(page, page_count)
+
+        Yields:
+            Response dictionary for each page
+        """
+        params = dict(params)
+        current_page = start_page
+
+        while True:
+            params['page'] = current_page
+            response = self._get(endpoint, params=params)
+
+            meta = response.get('meta') or {}
+            if progress:
+                progress(current_page, meta.get('pageCount'))
+
+            yield response
+
+            if not isinstance(response.get('data'), list) or not meta \
+                    or current_page >= meta.get('pageCount', 1):
                 break
 
             current_page += 1
 
-        # Return combined results
+    def _iter_cursor_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        cursor: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield page responses of a cursor-paginated listing (``use_cursor``)
+
+        Follows ``meta.next`` until it is empty. Each response's
+        ``meta.next`` is a resumable token: pass it back as ``cursor`` to
+        continue an interrupted walk from the following page.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters (including perPage and use_cursor)
+            cursor: Cursor to resume from (None starts at the beginning)
+            progress: Optional callback invoked as progress(page, None)
+
+        Yields:
+            Response dictionary for each page
+        """
+        params = dict(params)
+        params.pop('page', None)
+        params['use_cursor'] = 'true'
+        page_number = 1
+
+        while True:
+            if cursor:
+                params['next'] = cursor
+            response = self._get(endpoint, params=params)
+
+            if progress:
+                progress(page_number, None)
+
+            yield response
+
+            cursor = next_cursor(response)
+            if not cursor or not isinstance(response.get('data'), list):
+                break
+
+            page_number += 1
+
+    def _iter_pages_concurrent(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        start_page: int = 1,
+        progress: Optional[ProgressCallback] = None,
+        workers: int = 4,
+        ordered: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield page responses, fetching pages concurrently on a thread pool
+
+        The first page is fetched alone to learn ``meta.pageCount``; the
+        remaining pages are fetched by at most ``workers`` threads, with no
+        more than ``2 * workers`` pages buffered at a time.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters (including perPage)
+            start_page: First page to fetch
+            progress: Optional callback invoked as progress(page, page_count)
+            workers: Maximum number of concurrent requests
+            ordered: Yield pages in page order; when False pages are yielded
+                as soon as they arrive
+
+        Yields:
+            Response dictionary for each page
+        """
+        first = self._get(endpoint, params={**params, 'page': start_page})
+        page_count = (first.get('meta') or {}).get('pageCount')
+        if progress:
+            progress(start_page, page_count)
+        yield first
+
+        if not isinstance(first.get('data'), list) or not page_count or start_page >= page_count:
+            return
+
+        remaining = iter(range(start_page + 1, page_count + 1))
+        window = workers * 2
+        pending = collections.OrderedDict()
+
+        def submit_next():
+            page = next(remaining, None)
+            if page is not None:
+                # Run in the caller's context so deadlines and cache policies apply
+                context = contextvars.copy_context()
+                future = executor.submit(context.run, self._get, endpoint, {**params, 'page': page})
+                pending[future] = page
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='djpaystack-page')
+        try:
+            for _ in range(window):
+                submit_next()
+
+            while pending:
+                if ordered:
+                    done = [next(iter(pending))]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    page = pending.pop(future)
+                    response = future.result()
+                    if progress:
+                        progress(page, page_count)
+                    yield response
+                    submit_next()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    async def _aiter_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        start_page: int = 1,
+        progress: Optional[ProgressCallback] = None
+    ):
+        """
+        Asynchronously yield raw page responses for an AsyncPaystackClient
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters (including perPage)
+            start_page: First page to fetch
+            progress: Optional callback invoked as progress(page, page_count)
+
+        Yields:
+            Response dictionary for each page
+        """
+        params = dict(params)
+        current_page = start_page
+
+        while True:
+            params['page'] = current_page
+            response = await self._get(endpoint, params=params)
+
+            meta = response.get('meta') or {}
+            if progress:
+                progress(current_page, meta.get('pageCount'))
+
+            yield response
+
+            if not isinstance(response.get('data'), list) or not meta \
+                    or current_page >= meta.get('pageCount', 1):
+                break
+
+            current_page += 1
+
+    async def _aiter_cursor_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        cursor: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None
+    ):
+        """
+        Async counterpart of _iter_cursor_pages
+        """
+        params = dict(params)
+        params.pop('page', None)
+        params['use_cursor'] = 'true'
+        page_number = 1
+
+        while True:
+            if cursor:
+                params['next'] = cursor
+            response = await self._get(endpoint, params=params)
+
+            if progress:
+                progress(page_number, None)
+
+            yield response
+
+            cursor = next_cursor(response)
+            if not cursor or not isinstance(response.get('data'), list):
+                break
+
+            page_number += 1
+
+    async def _aiter_pages_concurrent(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        start_page: int = 1,
+        progress: Optional[ProgressCallback] = None,
+        workers: int = 4,
+        ordered: bool = True
+    ):
+        """
+        Async counterpart of _iter_pages_concurrent using asyncio tasks
+        """
+        first = await self._get(endpoint, params={**params, 'page': start_page})
+        page_count = (first.get('meta') or {}).get('pageCount')
+        if progress:
+            progress(start_page, page_count)
+        yield first
+
+        if not isinstance(first.get('data'), list) or not page_count or start_page >= page_count:
+            return
+
+        remaining = iter(range(start_page + 1, page_count + 1))
+        pending = collections.OrderedDict()
+
+        def submit_next():
+            page = next(remaining, None)
+            if page is not None:
+                task = asyncio.ensure_future(self._get(endpoint, params={**params, 'page': page}))
+                pending[task] = page
+
+        try:
+            for _ in range(workers):
+                submit_next()
+
+            while pending:
+                if ordered:
+                    done = [next(iter(pending))]
+                    await done[0]
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    page = pending.pop(task)
+                    response = task.result()
+                    if progress:
+                        progress(page, page_count)
+                    yield response
+                    submit_next()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @tracing.traced('paystack.paginate')
+    async def _apaginate(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Async counterpart of _paginate_all"""
+        tracing.set_attributes(endpoint=endpoint_template(endpoint))
+        all_results = []
+
+        if params.get('use_cursor'):
+            pages = self._aiter_cursor_pages(endpoint, params)
+        else:
+            pages = self._aiter_pages(endpoint, params)
+
+        async for response in pages:
+            data = response.get('data', [])
+            if not isinstance(data, list):
+                return response
+            all_results.extend(data)
+
+        tracing.set_attributes(items=len(all_results))
+
         return {
             'status': True,
             'message': 'Success',
@@ -91,3 +433,236 @@ class BaseAPI:
     def _build_query_params(self, **kwargs) -> Dict[str, Any]:
         """Build query parameters, filtering out None values"""
         return {k: v for k, v in kwargs.items() if v is not None}
+
+
+def next_cursor(response: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the cursor token for the page after ``response``
+
+    Args:
+        response: Page response from a ``use_cursor`` listing
+
+    Returns:
+        Cursor token, or None on the last page
+    """
+    return (response.get('meta') or {}).get('next') or None
+
+
+def _iter_items(pages: Iterator[Dict[str, Any]]) -> Iterator[Any]:
+    """Flatten page responses into individual records"""
+    try:
+        for response in pages:
+            data = response.get('data', [])
+            if isinstance(data, list):
+                yield from data
+            else:
+                yield data
+    finally:
+        pages.close()
+
+
+async def _aiter_items(pages):
+    """Async counterpart of _iter_items"""
+    try:
+        async for response in pages:
+            data = response.get('data', [])
+            if isinstance(data, list):
+                for item in data:
+                    yield item
+            else:
+                yield data
+    finally:
+        await pages.aclose()
+
+
+def _iter_with_policy(policy: CachePolicy, pages: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Fetch the pages of a @cached listing through the response cache"""
+    try:
+        while True:
+            # Pages are fetched lazily, outside the list method's own call
+            with use_policy(policy):
+                try:
+                    response = next(pages)
+                except StopIteration:
+                    return
+            yield response
+    finally:
+        pages.close()
+
+
+async def _aiter_with_policy(policy: CachePolicy, pages):
+    """Async counterpart of _iter_with_policy"""
+    try:
+        while True:
+            with use_policy(policy):
+                try:
+                    response = await pages.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield response
+    finally:
+        await pages.aclose()
+
+
+class PaginatedMethod:
+    """
+    A list method bound to its API instance
+
+    Calling it behaves exactly like the undecorated method. ``iter_pages``
+    and ``iter_items`` accept the same arguments but stream the listing
+    instead of accumulating every page; pages of ``@cached`` list methods
+    are still read through the response cache.
+    """
+
+    def __init__(self, func: Callable, api: BaseAPI):
+        self._func = func
+        self._api = api
+        functools.update_wrapper(self, func)
+
+    def __call__(self, *args, **kwargs):
+        return self._func(self._api, *args, **kwargs)
+
+    def describe(self, *args, **kwargs) -> PaginationRequest:
+        """Return the endpoint and parameters the call would paginate over"""
+        token = _capture_pagination.set(True)
+        try:
+            return self._func(self._api, *args, **kwargs)
+        finally:
+            _capture_pagination.reset(token)
+
+    def iter_pages(
+        self,
+        *args,
+        progress: Optional[ProgressCallback] = None,
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        cursor: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Stream raw page responses
+
+        Args:
+            *args, **kwargs: Arguments of the list method; ``page`` sets the
+                first page to fetch
+            progress: Optional callback invoked as progress(page, page_count)
+            workers: Fetch pages concurrently with up to this many requests
+                in flight once ``meta.pageCount`` is known
+            ordered: In concurrent mode, yield pages in page order (default)
+                or as soon as each arrives
+            cursor: For ``use_cursor=True`` listings, the ``meta.next``
+                token to resume from
+
+        Returns:
+            Iterator (or async iterator for AsyncPaystackClient) of page
+            responses
+        """
+        request = self.describe(*args, **kwargs)
+        params = {**request.params, 'perPage': request.per_page}
+        start_page = request.page or 1
+        api = self._api
+
+        # Cursor listings can only be walked sequentially
+        if params.get('use_cursor'):
+            if api.client.is_async:
+                pages = api._aiter_cursor_pages(request.endpoint, params, cursor, progress)
+            else:
+                pages = api._iter_cursor_pages(request.endpoint, params, cursor, progress)
+        elif workers and workers > 1:
+            if api.client.is_async:
+                pages = api._aiter_pages_concurrent(
+                    request.endpoint, params, start_page, progress, workers, ordered)
+            else:
+                pages = api._iter_pages_concurrent(
+                    request.endpoint, params, start_page, progress, workers, ordered)
+        elif api.client.is_async:
+            pages = api._aiter_pages(request.endpoint, params, start_page, progress)
+        else:
+            pages = api._iter_pages(request.endpoint, params, start_page, progress)
+
+        if request.policy is None:
+            return pages
+        if api.client.is_async:
+            return _aiter_with_policy(request.policy, pages)
+        return _iter_with_policy(request.policy, pages)
+
+    def iter_items(
+        self,
+        *args,
+        progress: Optional[ProgressCallback] = None,
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        cursor: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Stream individual records, fetching pages as they are consumed
+
+        Takes the same arguments as iter_pages.
+        """
+        pages = self.iter_pages(*args, progress=progress, workers=workers, ordered=ordered,
+                                cursor=cursor, **kwargs)
+
+        if self._api.client.is_async:
+            return _aiter_items(pages)
+        return _iter_items(pages)
+
+    def iter_sharded(
+        self,
+        *args,
+        from_date,
+        to_date,
+        window='day',
+        workers: int = 4,
+        max_pages: int = 10,
+        ordered: bool = True,
+        **kwargs
+    ):
+        """
+        Stream records of a date range fetched as concurrent date windows
+
+        Only for list methods accepting ``from_date`` and ``to_date``. The
+        range is split into ``window`` sized shards ('day', 'hour' or a
+        timedelta); shards with more than ``max_pages`` pages are split
+        further. Records are deduplicated by ``id``/``reference``.
+
+        Args:
+            *args, **kwargs: Other arguments of the list method
+            from_date: Start of range (date, datetime or ISO string)
+            to_date: End of range (date, datetime or ISO string)
+            window: Initial shard size
+            workers: Maximum number of shards fetched concurrently
+            max_pages: Page count above which a shard is subdivided
+            ordered: Yield shards in chronological order (default) or as
+                soon as each completes
+
+        Returns:
+            Iterator (or async iterator for AsyncPaystackClient) of records
+        """
+        fetch = ShardedFetch(
+            self, args, kwargs, from_date, to_date,
+            window=window, workers=workers, max_pages=max_pages, ordered=ordered,
+        )
+        if self._api.client.is_async:
+            return fetch.__aiter__()
+        return iter(fetch)
+
+
+class paginated:
+    """
+    Decorator for list methods that return ``self._paginate(...)``
+
+    Adds ``iter_pages`` and ``iter_items`` streaming counterparts::
+
+        for txn in client.transactions.list.iter_items(status='success'):
+            ...
+    """
+
+    def __init__(self, func: Callable):
+        self._func = func
+        functools.update_wrapper(self, func)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return PaginatedMethod(self._func, instance)
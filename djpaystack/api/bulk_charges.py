@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, List
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class BulkChargeAPI(BaseAPI):
@@ -10,6 +10,7 @@ class BulkChargeAPI(BaseAPI):
         data = body
         return self._post('bulkcharge', data=data)
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              from_date: Optional[str] = None, to_date: Optional[str] = None) -> Dict[str, Any]:
         """List bulk charges"""
@@ -20,6 +21,7 @@ class BulkChargeAPI(BaseAPI):
         """Fetch bulk charge"""
         return self._get(f'bulkcharge/{id_or_code}')
 
+    @paginated
     def fetch_charges(self, id_or_code: str, status: Optional[str] = None,
                       per_page: int = 50, page: Optional[int] = None,
                       from_date: Optional[str] = None, to_date: Optional[str] = None) -> Dict[str, Any]:
@@ -3,7 +3,7 @@ Customers API
 https://paystack.com/docs/api/customer/
 """
 from typing import Dict, Any, Optional
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class CustomerAPI(BaseAPI):
@@ -45,6 +45,7 @@ class CustomerAPI(BaseAPI):
         )
         return self._post('customer', data=data)
     
+    @paginated
     def list(
         self,
         per_page: int = 50,
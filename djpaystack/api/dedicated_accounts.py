@@ -1,5 +1,6 @@
 from typing import Dict, Any, Optional
-from .base import BaseAPI
+from .base import BaseAPI, paginated
+from ..response_cache import cached
 
 
 class DedicatedAccountAPI(BaseAPI):
@@ -16,6 +17,7 @@ class DedicatedAccountAPI(BaseAPI):
         )
         return self._post('dedicated_account', data=data)
 
+    @paginated
     def list(self, active: Optional[bool] = None, currency: Optional[str] = None,
              per_page: int = 50, page: Optional[int] = None) -> Dict[str, Any]:
         """List dedicated accounts"""
@@ -49,6 +51,7 @@ class DedicatedAccountAPI(BaseAPI):
         data = {'account_number': account_number}
         return self._delete('dedicated_account/split', data=data)
 
+    @cached('dedicated_account_provider')
     def available_providers(self) -> Dict[str, Any]:
         """Get available dedicated account providers"""
         return self._get('dedicated_account/available_providers')
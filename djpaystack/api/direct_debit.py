@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class DirectDebitAPI(BaseAPI):
@@ -13,6 +13,7 @@ class DirectDebitAPI(BaseAPI):
         """Fetch mandate"""
         return self._get(f'mandate/{mandate_id}')
 
+    @paginated
     def list_mandates(self, per_page: int = 50, page: Optional[int] = None) -> Dict[str, Any]:
         """List mandates"""
         return self._paginate('mandate', per_page=per_page, page=page)
@@ -1,10 +1,11 @@
 from typing import Dict, Any, Optional
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class DisputeAPI(BaseAPI):
     """Disputes API"""
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              from_date: Optional[str] = None, to_date: Optional[str] = None,
              transaction: Optional[str] = None, status: Optional[str] = None) -> Dict[str, Any]:
@@ -1,10 +1,13 @@
 from typing import Dict, Any, Optional, List
-from .base import BaseAPI
+from .base import BaseAPI, paginated
+from ..response_cache import cached
 
 
 class MiscellaneousAPI(BaseAPI):
     """Miscellaneous API"""
 
+    @paginated
+    @cached('bank')
     def list_banks(self, country: str = 'nigeria', use_cursor: bool = False,
                    per_page: int = 50, page: Optional[int] = None,
                    pay_with_bank_transfer: Optional[bool] = None,
@@ -24,10 +27,12 @@ class MiscellaneousAPI(BaseAPI):
             pay_with_bank_transfer=pay_with_bank_transfer)
         return self._get('bank', params=params)
 
+    @cached('country')
     def list_countries(self) -> Dict[str, Any]:
         """List countries"""
         return self._get('country')
 
+    @cached('state')
     def list_states(self, country: Optional[int] = None) -> Dict[str, Any]:
         """List states"""
         params = self._build_query_params(country=country)
@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, List
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class PageAPI(BaseAPI):
@@ -15,6 +15,7 @@ class PageAPI(BaseAPI):
         )
         return self._post('page', data=data)
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              from_date: Optional[str] = None, to_date: Optional[str] = None) -> Dict[str, Any]:
         """List payment pages"""
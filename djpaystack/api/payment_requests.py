@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, List
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class PaymentRequestAPI(BaseAPI):
@@ -19,6 +19,7 @@ class PaymentRequestAPI(BaseAPI):
         )
         return self._post('paymentrequest', data=data)
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              customer: Optional[int] = None, status: Optional[str] = None,
              currency: Optional[str] = None, include_archive: Optional[bool] = None,
@@ -1,10 +1,12 @@
 from typing import Dict, Any, Optional
-from .base import BaseAPI
+from .base import BaseAPI, paginated
+from ..response_cache import cached, invalidates
 
 
 class PlanAPI(BaseAPI):
     """Plans API"""
 
+    @invalidates('plan')
     def create(self, name: str, amount: int, interval: str,
                description: Optional[str] = None, currency: Optional[str] = None,
                invoice_limit: Optional[int] = None, send_invoices: Optional[bool] = None,
@@ -17,6 +19,7 @@ class PlanAPI(BaseAPI):
         )
         return self._post('plan', data=data)
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              status: Optional[str] = None, interval: Optional[str] = None,
              amount: Optional[int] = None) -> Dict[str, Any]:
@@ -25,10 +28,12 @@ class PlanAPI(BaseAPI):
             status=status, interval=interval, amount=amount)
         return self._paginate('plan', params=params, per_page=per_page, page=page)
 
+    @cached('plan')
     def fetch(self, id_or_code: str) -> Dict[str, Any]:
         """Fetch plan"""
         return self._get(f'plan/{id_or_code}')
 
+    @invalidates('plan')
     def update(self, id_or_code: str, name: Optional[str] = None, amount: Optional[int] = None,
                interval: Optional[str] = None, description: Optional[str] = None,
                currency: Optional[str] = None, invoice_limit: Optional[int] = None,
@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class RefundAPI(BaseAPI):
@@ -15,6 +15,7 @@ class RefundAPI(BaseAPI):
         )
         return self._post('refund', data=data)
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              reference: Optional[str] = None, currency: Optional[str] = None,
              from_date: Optional[str] = None, to_date: Optional[str] = None) -> Dict[str, Any]:
@@ -1,10 +1,11 @@
 from typing import Dict, Any, Optional
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class SettlementAPI(BaseAPI):
     """Settlements API"""
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              from_date: Optional[str] = None, to_date: Optional[str] = None,
              subaccount: Optional[str] = None) -> Dict[str, Any]:
@@ -13,6 +14,7 @@ class SettlementAPI(BaseAPI):
             from_date=from_date, to_date=to_date, subaccount=subaccount)
         return self._paginate('settlement', params=params, per_page=per_page, page=page)
 
+    @paginated
     def fetch_transactions(self, id: str, per_page: int = 50, page: Optional[int] = None,
                            from_date: Optional[str] = None, to_date: Optional[str] = None) -> Dict[str, Any]:
         """Fetch settlement transactions"""
@@ -0,0 +1,268 @@
+"""
+Date-window sharded fetching for list endpoints that accept from/to dates
+"""
+import asyncio
+import collections
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from typing import Dict, Any, Optional, List, Tuple, Union, Callable, Iterator
+
+from django.utils.dateparse import parse_date, parse_datetime
+
+from ..exceptions import PaystackValidationError
+
+DateLike = Union[str, date, datetime]
+Window = Tuple[datetime, datetime]
+# A window to fetch and the page count of the window it was split from
+Shard = Tuple[Window, Optional[int]]
+
+WINDOW_SIZES = {
+    'day': timedelta(days=1),
+    'hour': timedelta(hours=1),
+}
+
+
+def to_datetime(value: DateLike) -> datetime:
+    """
+    Convert a date, datetime or ISO string to an aware UTC datetime
+
+    Naive values are assumed to be UTC.
+    """
+    if isinstance(value, str):
+        parsed = parse_datetime(value)
+        if parsed is None:
+            parsed_date = parse_date(value)
+            if parsed_date is None:
+                raise PaystackValidationError(f"Invalid date: {value}")
+            parsed = datetime.combine(parsed_date, time.min)
+        value = parsed
+    elif not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt_timezone.utc)
+    return value.astimezone(dt_timezone.utc)
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a datetime the way Paystack expects for from/to filters"""
+    return value.astimezone(dt_timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def split_range(start: datetime, end: datetime, size: timedelta) -> List[Window]:
+    """Split [start, end) into consecutive windows of at most ``size``"""
+    windows = []
+    while start < end:
+        window_end = min(start + size, end)
+        windows.append((start, window_end))
+        start = window_end
+    return windows
+
+
+def record_key(record: Any) -> Any:
+    """Default deduplication key: the record id, falling back to its reference"""
+    if not isinstance(record, dict):
+        return None
+    if record.get('id') is not None:
+        return ('id', record['id'])
+    if record.get('reference') is not None:
+        return ('reference', record['reference'])
+    return None
+
+
+class ShardedFetch:
+    """
+    Fetch a date range as independent windows and merge the results
+
+    Each window is listed page by page. A window whose first page reports
+    more than ``max_pages`` pages is split in half (down to ``min_window``)
+    so no single window turns into a long, shifting offset walk. A half
+    reporting as many pages as the window it came from is not split again,
+    since narrowing the range evidently does not shrink the result. Records
+    seen in more than one window are yielded once.
+    """
+
+    def __init__(
+        self,
+        method,
+        args: tuple,
+        kwargs: Dict[str, Any],
+        from_date: DateLike,
+        to_date: DateLike,
+        window: Union[str, timedelta] = 'day',
+        workers: int = 4,
+        max_pages: int = 10,
+        min_window: timedelta = timedelta(minutes=1),
+        ordered: bool = True,
+        key: Callable[[Any], Any] = record_key
+    ):
+        if isinstance(window, str):
+            if window not in WINDOW_SIZES:
+                raise PaystackValidationError(
+                    f"window must be one of {sorted(WINDOW_SIZES)} or a timedelta")
+            window = WINDOW_SIZES[window]
+
+        start, end = to_datetime(from_date), to_datetime(to_date)
+        if end <= start:
+            raise PaystackValidationError("to_date must be after from_date")
+
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.windows: List[Shard] = [(w, None) for w in split_range(start, end, window)]
+        self.workers = max(1, workers)
+        self.max_pages = max_pages
+        self.min_window = min_window
+        self.ordered = ordered
+        self.key = key
+
+    def _window_request(self, window: Window):
+        """Build endpoint and params for one window"""
+        request = self.method.describe(*self.args, **self.kwargs)
+        # Paystack's list endpoints filter on ``from`` and ``to``
+        params = {k: v for k, v in request.params.items() if k not in ('from_date', 'to_date')}
+        params.update({
+            'from': format_datetime(window[0]),
+            'to': format_datetime(window[1]),
+            'perPage': request.per_page,
+        })
+        return request.endpoint, params
+
+    def _split(self, window: Window, page_count: int, parent_pages: Optional[int]) -> Optional[List[Shard]]:
+        """Halve a window that is too dense, if it is still large enough"""
+        start, end = window
+        if page_count <= self.max_pages or end - start <= self.min_window \
+                or page_count == parent_pages:
+            return None
+        middle = start + (end - start) / 2
+        return [((start, middle), page_count), ((middle, end), page_count)]
+
+    def fetch_window(self, shard: Shard) -> Tuple[Optional[List[Shard]], List[Any]]:
+        """
+        Fetch every record of one window
+
+        Returns:
+            (sub-windows, []) if the window was split, else (None, records)
+        """
+        window, parent_pages = shard
+        api = self.method._api
+        endpoint, params = self._window_request(window)
+
+        first = api._get(endpoint, params={**params, 'page': 1})
+        page_count = (first.get('meta') or {}).get('pageCount') or 1
+
+        sub_windows = self._split(window, page_count, parent_pages)
+        if sub_windows:
+            return sub_windows, []
+
+        records = list(first.get('data') or [])
+        for page in range(2, page_count + 1):
+            response = api._get(endpoint, params={**params, 'page': page})
+            records.extend(response.get('data') or [])
+        return None, records
+
+    async def afetch_window(self, shard: Shard) -> Tuple[Optional[List[Shard]], List[Any]]:
+        """Async counterpart of fetch_window"""
+        window, parent_pages = shard
+        api = self.method._api
+        endpoint, params = self._window_request(window)
+
+        first = await api._get(endpoint, params={**params, 'page': 1})
+        page_count = (first.get('meta') or {}).get('pageCount') or 1
+
+        sub_windows = self._split(window, page_count, parent_pages)
+        if sub_windows:
+            return sub_windows, []
+
+        records = list(first.get('data') or [])
+        for page in range(2, page_count + 1):
+            response = await api._get(endpoint, params={**params, 'page': page})
+            records.extend(response.get('data') or [])
+        return None, records
+
+    def _dedupe(self, records: List[Any], seen: set) -> Iterator[Any]:
+        for record in records:
+            record_id = self.key(record)
+            if record_id is not None:
+                if record_id in seen:
+                    continue
+                seen.add(record_id)
+            yield record
+
+    def __iter__(self) -> Iterator[Any]:
+        queue = collections.deque(self.windows)
+        pending = collections.deque()
+        seen = set()
+
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='djpaystack-shard')
+
+        def submit(shard):
+            # Run in the caller's context so deadlines, spans and cache policies apply
+            context = contextvars.copy_context()
+            return executor.submit(context.run, self.fetch_window, shard)
+
+        try:
+            def fill():
+                while queue and len(pending) < self.workers * 2:
+                    pending.append(submit(queue.popleft()))
+
+            fill()
+            while pending:
+                if self.ordered:
+                    future = pending[0]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = next(iter(done))
+                pending.remove(future)
+
+                sub_windows, records = future.result()
+                if sub_windows and self.ordered:
+                    # Sub-windows take the place of the window they split
+                    pending.extendleft(submit(sub_window) for sub_window in reversed(sub_windows))
+                elif sub_windows:
+                    queue.extend(sub_windows)
+                else:
+                    yield from self._dedupe(records, seen)
+                fill()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    async def __aiter__(self):
+        queue = collections.deque(self.windows)
+        pending = collections.deque()
+        seen = set()
+
+        def fill():
+            while queue and len(pending) < self.workers:
+                window = queue.popleft()
+                pending.append(asyncio.ensure_future(self.afetch_window(window)))
+
+        try:
+            fill()
+            while pending:
+                if self.ordered:
+                    task = pending[0]
+                    await task
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    task = next(iter(done))
+                pending.remove(task)
+
+                sub_windows, records = task.result()
+                if sub_windows and self.ordered:
+                    pending.extendleft(
+                        asyncio.ensure_future(self.afetch_window(sub_window))
+                        for sub_window in reversed(sub_windows)
+                    )
+                elif sub_windows:
+                    queue.extend(sub_windows)
+                else:
+                    for record in self._dedupe(records, seen):
+                        yield record
+                fill()
+        finally:
+            for task in pending:
+                task.cancel()
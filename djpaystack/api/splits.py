@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, List
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class SplitAPI(BaseAPI):
@@ -27,6 +27,7 @@ class SplitAPI(BaseAPI):
         )
         return self._post('split', data=data)
 
+    @paginated
     def list(self, name: Optional[str] = None, active: Optional[bool] = None,
              sort_by: Optional[str] = None, per_page: int = 50,
              page: Optional[int] = None) -> Dict[str, Any]:
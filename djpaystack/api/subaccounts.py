@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class SubaccountAPI(BaseAPI):
@@ -19,6 +19,7 @@ class SubaccountAPI(BaseAPI):
         )
         return self._post('subaccount', data=data)
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              from_date: Optional[str] = None, to_date: Optional[str] = None) -> Dict[str, Any]:
         """List subaccounts"""
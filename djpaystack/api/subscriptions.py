@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class SubscriptionAPI(BaseAPI):
@@ -13,6 +13,7 @@ class SubscriptionAPI(BaseAPI):
         )
         return self._post('subscription', data=data)
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              customer: Optional[int] = None, plan: Optional[int] = None) -> Dict[str, Any]:
         """List subscriptions"""
@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, List
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class TerminalAPI(BaseAPI):
@@ -18,6 +18,7 @@ class TerminalAPI(BaseAPI):
         """Fetch terminal status"""
         return self._get(f'terminal/{terminal_id}/presence')
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None) -> Dict[str, Any]:
         """List terminals"""
         return self._paginate('terminal', per_page=per_page, page=page)
@@ -3,7 +3,7 @@ Transactions API
 https://paystack.com/docs/api/transaction/
 """
 from typing import Dict, Any, Optional, List
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class TransactionAPI(BaseAPI):
@@ -81,6 +81,7 @@ class TransactionAPI(BaseAPI):
         """
         return self._get(f'transaction/verify/{reference}')
 
+    @paginated
     def list(
         self,
         per_page: int = 50,
@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, List
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class TransferRecipientAPI(BaseAPI):
@@ -21,6 +21,7 @@ class TransferRecipientAPI(BaseAPI):
         data = {'batch': batch}
         return self._post('transferrecipient/bulk', data=data)
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              from_date: Optional[str] = None, to_date: Optional[str] = None) -> Dict[str, Any]:
         """List transfer recipients"""
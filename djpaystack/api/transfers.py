@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, List
-from .base import BaseAPI
+from .base import BaseAPI, paginated
 
 
 class TransferAPI(BaseAPI):
@@ -24,6 +24,7 @@ class TransferAPI(BaseAPI):
         data = {'source': source, 'transfers': transfers}
         return self._post('transfer/bulk', data=data)
 
+    @paginated
     def list(self, per_page: int = 50, page: Optional[int] = None,
              customer: Optional[int] = None, status: Optional[str] = None,
              from_date: Optional[str] = None, to_date: Optional[str] = None) -> Dict[str, Any]:
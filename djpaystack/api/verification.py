@@ -1,15 +1,83 @@
-from typing import Dict, Any, Optional
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Iterable, Tuple, Union
 from .base import BaseAPI
+from ..bin_cache import bin_cache
+from ..exceptions import PaystackError
+from ..response_cache import cached
+
+# (account_number, bank_code)
+AccountKey = Tuple[str, str]
 
 
 class VerificationAPI(BaseAPI):
     """Verification API"""
 
+    @cached('account_resolve', timeout='ACCOUNT_RESOLVE_CACHE_TIMEOUT',
+            negative_timeout='ACCOUNT_RESOLVE_NEGATIVE_TIMEOUT')
     def resolve_account_number(self, account_number: str, bank_code: str) -> Dict[str, Any]:
-        """Resolve account number"""
+        """
+        Resolve account number
+
+        Results are cached for ACCOUNT_RESOLVE_CACHE_TIMEOUT and "could not
+        resolve" errors for ACCOUNT_RESOLVE_NEGATIVE_TIMEOUT. Concurrent
+        lookups of the same account share one request.
+        """
         params = {'account_number': account_number, 'bank_code': bank_code}
         return self._get('bank/resolve', params=params)
 
+    def resolve_many(
+        self,
+        accounts: Iterable[AccountKey],
+        max_concurrency: int = 4
+    ) -> Dict[AccountKey, Union[Dict[str, Any], PaystackError]]:
+        """
+        Resolve several account numbers with bounded concurrency
+
+        Args:
+            accounts: (account_number, bank_code) pairs
+            max_concurrency: Maximum lookups in flight at once
+
+        Returns:
+            Response, or the PaystackError it raised, keyed by
+            (account_number, bank_code)
+        """
+        accounts = list(dict.fromkeys(accounts))
+        if self.client.is_async:
+            return self._aresolve_many(accounts, max_concurrency)
+
+        def resolve(account: AccountKey):
+            try:
+                return self.resolve_account_number(*account)
+            except PaystackError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency),
+                                thread_name_prefix='djpaystack-resolve') as executor:
+            # Each lookup runs in its own copy of the caller's context
+            # (deadline, tracing, cache policy)
+            futures = [executor.submit(contextvars.copy_context().run, resolve, account)
+                       for account in accounts]
+            return {account: future.result() for account, future in zip(accounts, futures)}
+
+    async def _aresolve_many(
+        self,
+        accounts: Iterable[AccountKey],
+        max_concurrency: int
+    ) -> Dict[AccountKey, Union[Dict[str, Any], PaystackError]]:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def resolve(account: AccountKey):
+            async with semaphore:
+                try:
+                    return await self.resolve_account_number(*account)
+                except PaystackError as e:
+                    return e
+
+        results = await asyncio.gather(*(resolve(account) for account in accounts))
+        return dict(zip(accounts, results))
+
     def validate_account(self, account_name: str, account_number: str,
                          account_type: str, bank_code: str, country_code: str,
                          document_type: str, document_number: Optional[str] = None) -> Dict[str, Any]:
@@ -22,5 +90,10 @@ class VerificationAPI(BaseAPI):
         return self._post('bank/validate', data=data)
 
     def resolve_card_bin(self, bin: str) -> Dict[str, Any]:
-        """Resolve card BIN"""
-        return self._get(f'decision/bin/{bin}')
+        """
+        Resolve card BIN
+
+        Answered from the BIN cache after the first lookup; accepts a BIN or
+        a full card number.
+        """
+        return bin_cache.get(self.client, bin)
@@ -0,0 +1,298 @@
+"""
+Asyncio Paystack API client
+
+Requires the optional ``httpx`` dependency::
+
+    pip install paystack-django[async]
+"""
+import asyncio
+import logging
+from typing import Dict, Any, Optional, AsyncIterator
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .client import BaseClient
+from .api.base import BaseAPI, _aiter_items
+from .settings import paystack_settings
+from . import codec, instrumentation, tracing
+from .audit import redact
+from .circuit_breaker import get_circuit_breaker
+from .deadline import check_deadline, endpoint_timeout, remaining
+from .ratelimit import get_rate_limiter
+from .exceptions import (
+    PaystackAPIError,
+    PaystackConfigurationError,
+    PaystackNetworkError,
+    PaystackTimeoutError,
+)
+
+logger = logging.getLogger('djpaystack')
+
+
+class AsyncPaystackClient(BaseClient):
+    """
+    Asyncio Paystack API client
+
+    Exposes the same API namespaces as PaystackClient (``transactions``,
+    ``customers``, ``transfers``, ...), but every endpoint method returns an
+    awaitable. Requests share one pooled ``httpx.AsyncClient``, so many calls
+    can be in flight on a single event loop::
+
+        async with AsyncPaystackClient() as client:
+            response = await client.transactions.verify(reference)
+    """
+
+    is_async = True
+
+    def _create_session(self) -> 'httpx.AsyncClient':
+        """Create pooled async HTTP client"""
+        if httpx is None:
+            raise PaystackConfigurationError(
+                "AsyncPaystackClient requires httpx. "
+                "Install it with: pip install paystack-django[async]"
+            )
+
+        limits = httpx.Limits(
+            max_connections=paystack_settings.ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                paystack_settings.ASYNC_MAX_KEEPALIVE_CONNECTIONS
+                if paystack_settings.KEEP_ALIVE else 0
+            ),
+        )
+        transport = httpx.AsyncHTTPTransport(
+            limits=limits,
+            verify=paystack_settings.VERIFY_SSL,
+        )
+        return httpx.AsyncClient(transport=transport, timeout=self.timeout)
+
+    @tracing.traced('paystack.request')
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to Paystack API
+
+        Failed attempts are retried according to ``self.retry_policy``.
+        Concurrent identical GETs share one in-flight request (COALESCE_GETS);
+        treat the returned data as read-only.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path
+            data: Request body data
+            params: URL query parameters
+            idempotency_key: Optional key sent as Idempotency-Key; does not by
+                itself make a POST safe to retry (see RetryPolicy.is_retry_safe)
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            Response data dictionary
+
+        Raises:
+            PaystackAPIError: If API returns error
+            PaystackNetworkError: If network request fails
+            PaystackRateLimitError: If the client-side rate limit has no capacity
+            PaystackCircuitOpenError: If the circuit breaker is open
+        """
+        tracing.tag_request(method, endpoint, data, params)
+        key = self._coalesce_key(method, endpoint, data, params, kwargs)
+        if key is not None:
+            return await self.coalescer.ado(
+                key, lambda: self._send(method, endpoint, data, params, idempotency_key))
+        return await self._send(method, endpoint, data, params, idempotency_key, **kwargs)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send a request, reporting it to instrumentation hooks"""
+        body = codec.dumps(data) if data is not None else None
+        call = instrumentation.start(method, endpoint, body)
+        try:
+            response_data = await self._transmit(
+                call, method, endpoint, body, data, params, idempotency_key, **kwargs)
+        except BaseException as e:
+            call.fail(e)
+            raise
+        call.finish()
+        return response_data
+
+    async def _transmit(
+        self,
+        call,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes],
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send a request, with retries, rate limiting and circuit breaking"""
+        url = self._build_url(endpoint)
+        headers = self._get_headers(idempotency_key)
+        retry = self.retry_policy.begin(method, endpoint, data, idempotency_key)
+
+        # Log request if enabled
+        if paystack_settings.LOG_REQUESTS:
+            logger.info(f"Paystack Request: {method} {url}")
+            if data and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Request Data: {redact(data)}")
+
+        breaker = get_circuit_breaker(endpoint)
+        hedge_family = self.hedge_policy.family(method, endpoint)
+
+        def send():
+            return self.session.request(
+                method,
+                url,
+                headers=headers,
+                content=body,
+                params=params,
+                timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+                **kwargs
+            )
+
+        async def admit_hedge():
+            # A hedge is a request of its own; it must not wait for a token
+            if limiter:
+                await limiter.acquire_async(endpoint, timeout=0)
+            if breaker:
+                breaker.allow()
+
+        while True:
+            check_deadline()
+
+            # Respect client-side rate limit without blocking the event loop
+            limiter = get_rate_limiter()
+            if limiter:
+                await limiter.acquire_async(endpoint)
+
+            timeout = endpoint_timeout(endpoint, self.timeout)
+
+            # Fail fast while Paystack is failing for this endpoint family.
+            # Checked last: a half-open probe admitted here must be sent.
+            if breaker:
+                breaker.allow()
+
+            call.attempt()
+
+            try:
+                if hedge_family:
+                    response = await self.hedge_policy.acall(hedge_family, send, admit_hedge)
+                else:
+                    response = await send()
+            except httpx.HTTPError as e:
+                if remaining() == 0:
+                    raise PaystackTimeoutError(f"Deadline exceeded during request: {str(e)}")
+                if breaker:
+                    breaker.record_failure()
+                delay = retry.next_delay(
+                    request_sent=not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)))
+                if delay is None:
+                    logger.error(f"Paystack network error: {str(e)}")
+                    raise PaystackNetworkError(f"Network request failed: {str(e)}")
+                logger.warning(f"Paystack network error, retrying in {delay:.2f}s: {str(e)}")
+                await asyncio.sleep(delay)
+                continue
+
+            if breaker:
+                breaker.record_status(response.status_code)
+
+            if response.status_code in self.retry_policy.retry_statuses:
+                delay = retry.next_delay(
+                    response.status_code, retry_after=response.headers.get('Retry-After'))
+                if delay is not None:
+                    logger.warning(
+                        f"Paystack returned {response.status_code}, retrying in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+                    continue
+
+            break
+
+        call.response(response)
+        tracing.set_attributes(status_code=response.status_code, attempts=retry.attempts)
+
+        # Log response if enabled
+        if paystack_settings.LOG_RESPONSES:
+            logger.info(f"Paystack Response: {response.status_code}")
+
+        # Parse JSON response
+        try:
+            response_data = codec.loads(response.content)
+        except ValueError:
+            raise PaystackAPIError(
+                f"Invalid JSON response from Paystack: {response.text}",
+                status_code=response.status_code,
+                response=response
+            )
+
+        if paystack_settings.LOG_RESPONSES and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Response Data: {redact(response_data)}")
+
+        return self._check_response(response_data, response.status_code)
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make GET request"""
+        return await self.request('GET', endpoint, params=params)
+
+    async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                   idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+        """Make POST request"""
+        return await self.request('POST', endpoint, data=data, idempotency_key=idempotency_key)
+
+    async def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make PUT request"""
+        return await self.request('PUT', endpoint, data=data)
+
+    async def delete(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make DELETE request"""
+        return await self.request('DELETE', endpoint, data=data)
+
+    async def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = 50
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every record of a paginated endpoint
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            per_page: Number of items per page
+
+        Yields:
+            Individual records, page by page
+        """
+        params = {**(params or {}), 'perPage': per_page}
+        pages = BaseAPI(self)._aiter_pages(endpoint, params)
+        async for item in _aiter_items(pages):
+            yield item
+
+    async def close(self):
+        """Close session"""
+        self.hedge_policy.close()
+        if self.session:
+            await self.session.aclose()
+
+    async def __aenter__(self) -> 'AsyncPaystackClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -0,0 +1,328 @@
+"""
+Structured audit log of Paystack traffic
+
+With AUDIT_LOG set to ``'file'`` or ``'db'``, every request made by a client
+is described by a JSON record (endpoint template, status, duration,
+attempts and the request/response bodies) and written to a rotating file
+(AUDIT_LOG_FILE) or the PaystackAuditLog table.
+
+The request thread samples the call (AUDIT_SAMPLE_RATE; failed calls are
+always kept), builds its record and queues it. Bodies larger than
+AUDIT_MAX_BODY_BYTES are recorded by size only, without being decoded, so
+big list pages cost the request thread nothing; smaller bodies are decoded
+and redacted before they are queued, so unredacted payloads are never held
+in the queue. Writing happens on a background writer thread. When the
+queue is full, records are dropped rather than slowing requests.
+
+Fields named in REDACT_FIELDS (and AUDIT_REDACT_FIELDS) are masked at any
+depth, as are Bearer tokens inside strings.
+"""
+import atexit
+import datetime
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from . import codec
+from .instrumentation import Counters, RequestCall, RequestHook
+from .settings import paystack_settings
+
+logger = logging.getLogger('djpaystack')
+
+REDACTED = '[REDACTED]'
+
+# Keys whose values never reach the audit log
+REDACT_FIELDS = frozenset([
+    'authorization_code',
+    'signature',
+    'secret_key',
+    'password',
+    'pin',
+    'otp',
+    'cvv',
+    'card_number',
+    'number',
+    'bvn',
+    'account_number',
+    'phone',
+    'birthday',
+])
+
+_BEARER = re.compile(r'(Bearer\s+)\S+', re.IGNORECASE)
+
+_STOP = object()
+
+
+def redact(value: Any, fields: Iterable[str] = REDACT_FIELDS) -> Any:
+    """
+    Copy a decoded payload with sensitive values masked
+
+    Args:
+        value: Decoded JSON value
+        fields: Keys to mask, matched case-insensitively at any depth
+
+    Returns:
+        Redacted copy
+    """
+    fields = fields if isinstance(fields, frozenset) else frozenset(f.lower() for f in fields)
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if str(key).lower() in fields and value[key] is not None
+            else redact(value[key], fields)
+            for key in value
+        }
+    if isinstance(value, list):
+        return [redact(item, fields) for item in value]
+    if isinstance(value, str):
+        return _BEARER.sub(r'\1' + REDACTED, value)
+    return value
+
+
+class AuditStats(Counters):
+    """Thread-safe audit log counters"""
+
+    FIELDS = (
+        'records',
+        'sampled_out',
+        'dropped',
+        'write_errors',
+    )
+
+
+class FileSink:
+    """Append records as JSON lines to a size-rotated file"""
+
+    def __init__(self, path: str, max_bytes: int, backup_count: int):
+        self.handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        self.handler.setFormatter(logging.Formatter('%(message)s'))
+
+    def write(self, records: List[Dict[str, Any]]):
+        for record in records:
+            line = codec.dumps(record, default=str).decode('utf-8')
+            self.handler.emit(logging.makeLogRecord({'msg': line, 'levelno': logging.INFO}))
+        self.handler.flush()
+
+    def close(self):
+        self.handler.close()
+
+
+class DatabaseSink:
+    """Insert records into the PaystackAuditLog table"""
+
+    def write(self, records: List[Dict[str, Any]]):
+        from django.db import close_old_connections
+        from .models import PaystackAuditLog
+
+        close_old_connections()
+        PaystackAuditLog.objects.bulk_create([
+            PaystackAuditLog(
+                method=record['method'],
+                endpoint=record['endpoint'],
+                status_code=record['status'],
+                duration_ms=record['duration_ms'],
+                attempts=record['attempts'],
+                error=record.get('error') or '',
+                record=record,
+            )
+            for record in records
+        ])
+
+    def close(self):
+        """Close the calling thread's connection (called on the writer thread)"""
+        from django.db import connection
+        connection.close()
+
+
+def _build_sink():
+    backend = paystack_settings.AUDIT_LOG
+    if backend == 'file':
+        return FileSink(
+            paystack_settings.AUDIT_LOG_FILE,
+            paystack_settings.AUDIT_LOG_MAX_BYTES,
+            paystack_settings.AUDIT_LOG_BACKUP_COUNT,
+        )
+    if backend == 'db':
+        return DatabaseSink()
+
+    from .exceptions import PaystackConfigurationError
+    raise PaystackConfigurationError(f"AUDIT_LOG must be 'file', 'db' or None, got {backend!r}")
+
+
+class AuditLogger(RequestHook):
+    """
+    Request hook that queues calls for the background audit writer
+    """
+
+    batch_size = 100
+
+    def __init__(self, sink=None, sample_rate: Optional[float] = None,
+                 max_body_bytes: Optional[int] = None, queue_size: Optional[int] = None,
+                 redact_fields: Optional[Iterable[str]] = None):
+        """
+        Initialize audit logger (defaults come from the AUDIT_* settings)
+
+        Args:
+            sink: Object with ``write(records)`` and ``close()``
+            sample_rate: Fraction of successful calls recorded
+            max_body_bytes: Longest request/response body kept per record
+            queue_size: Records waiting to be written before new ones are dropped
+            redact_fields: Keys masked in addition to REDACT_FIELDS
+        """
+        self.sink = sink
+        self.sample_rate = paystack_settings.AUDIT_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.max_body_bytes = paystack_settings.AUDIT_MAX_BODY_BYTES \
+            if max_body_bytes is None else max_body_bytes
+        self.queue_size = paystack_settings.AUDIT_QUEUE_SIZE if queue_size is None else queue_size
+        extra = paystack_settings.AUDIT_REDACT_FIELDS if redact_fields is None else redact_fields
+        self.redact_fields = frozenset(f.lower() for f in REDACT_FIELDS | frozenset(extra))
+        self.stats = AuditStats()
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    # Request thread
+
+    def _ensure_writer(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            # A writer thread does not survive fork; start one per process
+            if self._pid != os.getpid():
+                if self.sink is None:
+                    self.sink = _build_sink()
+                self._queue = queue.Queue(maxsize=self.queue_size)
+                self._thread = threading.Thread(
+                    target=self._run, name='djpaystack-audit', daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+
+    def _submit(self, call: RequestCall):
+        if call.error is None and self.sample_rate < 1 and random.random() >= self.sample_rate:
+            self.stats.incr('sampled_out')
+            return
+
+        self._ensure_writer()
+        if self._queue.full():
+            self.stats.incr('dropped')
+            return
+        record = self.build_record(datetime.datetime.now(datetime.timezone.utc), call)
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.stats.incr('dropped')
+
+    after_response = _submit
+    on_error = _submit
+
+    def _body(self, content: Optional[bytes]) -> Any:
+        if not content:
+            return None
+        # Checked before decoding, so an oversized body is never parsed
+        if len(content) > self.max_body_bytes:
+            return {'truncated': True, 'bytes': len(content)}
+        try:
+            return redact(codec.loads(content), self.redact_fields)
+        except ValueError:
+            return redact(content.decode('utf-8', 'replace'))
+
+    def build_record(self, timestamp: datetime.datetime, call: RequestCall) -> Dict[str, Any]:
+        """Describe a call as a redacted, size-capped JSON-ready record"""
+        record = {
+            'timestamp': timestamp.isoformat(),
+            'method': call.method,
+            'endpoint': call.template,
+            'status': call.status,
+            'duration_ms': round(call.duration * 1000) if call.duration is not None else None,
+            'attempts': call.attempts,
+            'request_bytes': call.request_bytes,
+            'response_bytes': call.response_bytes,
+            'request': self._body(call.request_body),
+            'response': self._body(call.response_body),
+        }
+        if call.error is not None:
+            record['error'] = redact(f"{type(call.error).__name__}: {call.error}")
+        return record
+
+    # Writer thread
+
+    def _write(self, records):
+        try:
+            self.sink.write(records)
+            self.stats.incr('records', len(records))
+        except Exception as e:
+            self.stats.incr('write_errors', len(records))
+            logger.warning(f"Paystack audit log write failed: {str(e)}")
+
+    def _run(self):
+        pending = self._queue
+        try:
+            while True:
+                item = pending.get()
+                if item is _STOP:
+                    break
+                items = [item]
+                while len(items) < self.batch_size:
+                    try:
+                        item = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        self._write(items)
+                        return
+                    items.append(item)
+                self._write(items)
+        finally:
+            # On this thread, so the sink releases what the writes opened
+            # (Django database connections are per thread)
+            self.sink.close()
+
+    def close(self, timeout: float = 5.0):
+        """Write queued records, then stop the writer thread and close the sink"""
+        with self._lock:
+            if self._pid != os.getpid() or self._thread is None:
+                return
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._pid = None
+            self._thread = None
+
+
+_audit_logger: Optional[AuditLogger] = None
+_audit_lock = threading.Lock()
+
+
+def get_audit_logger() -> Optional[AuditLogger]:
+    """Get the process-wide audit logger, or None if AUDIT_LOG is not set"""
+    global _audit_logger
+
+    if not paystack_settings.AUDIT_LOG:
+        return None
+    if _audit_logger is None:
+        with _audit_lock:
+            if _audit_logger is None:
+                _audit_logger = AuditLogger()
+    return _audit_logger
+
+
+def close_audit_logger():
+    if _audit_logger is not None:
+        _audit_logger.close()
+
+
+def _after_fork():
+    # The lock may have been held by another thread at fork time
+    if _audit_logger is not None:
+        _audit_logger._lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
+
+atexit.register(close_audit_logger)
@@ -0,0 +1,200 @@
+"""
+Concurrent batch execution of API calls
+
+Run many independent calls on a bounded pool::
+
+    with client.batch(max_concurrency=8) as batch:
+        futures = {code: batch.customers.fetch(code) for code in codes}
+
+    results = batch.results()  # response or exception per call
+
+Any namespace method can be called through the batch (``batch.<namespace>.
+<method>(...)``) or submitted directly with ``batch.submit(fn, ...)``. Calls
+still go through the client, so its rate limit, retry policy and circuit
+breaker apply to each of them. With ``deadline`` set, calls that have not
+started when it passes fail with PaystackTimeoutError instead of running
+(async batches also cancel calls still in flight).
+"""
+import asyncio
+import contextvars
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+from .exceptions import PaystackTimeoutError
+
+
+class _BatchNamespace:
+    """Proxy for an API namespace whose method calls are submitted to a batch"""
+
+    def __init__(self, batch, api):
+        self._batch = batch
+        self._api = api
+
+    def __getattr__(self, name):
+        method = getattr(self._api, name)
+        if not callable(method):
+            return method
+
+        def submit(*args, **kwargs):
+            return self._batch.submit(method, *args, **kwargs)
+        return submit
+
+
+class BaseBatch:
+    """Shared bookkeeping of sync and async batches"""
+
+    def __init__(self, client, max_concurrency: int = 8, deadline: Optional[float] = None):
+        """
+        Initialize batch
+
+        Args:
+            client: Client whose API methods are called
+            max_concurrency: Maximum calls in flight at once
+            deadline: Seconds from now after which unstarted calls are failed
+        """
+        self.client = client
+        self.max_concurrency = max(1, max_concurrency)
+        self.deadline = None if deadline is None else time.monotonic() + deadline
+        self._futures: List[Any] = []
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _BatchNamespace(self, getattr(self.client, name))
+
+    def _check_deadline(self):
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise PaystackTimeoutError("Batch deadline exceeded before the call started")
+
+    def _remaining(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    @staticmethod
+    def _outcome(future) -> Any:
+        if future.cancelled():
+            return PaystackTimeoutError("Batch call cancelled")
+        error = future.exception()
+        return error if error is not None else future.result()
+
+
+class Batch(BaseBatch):
+    """
+    Run API calls of a sync client on a bounded thread pool
+    """
+
+    def __init__(self, client, max_concurrency: int = 8, deadline: Optional[float] = None):
+        super().__init__(client, max_concurrency, deadline)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix='djpaystack-batch')
+
+    def _run(self, fn: Callable, args, kwargs):
+        self._check_deadline()
+        return fn(*args, **kwargs)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Schedule ``fn(*args, **kwargs)``
+
+        Returns:
+            Future resolving to the call's result or exception
+        """
+        # Run in the caller's context so context-scoped settings apply
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, self._run, fn, args, kwargs)
+        self._futures.append(future)
+        return future
+
+    def map(self, fn: Callable, items: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Call ``fn(item)`` for every item and wait for all of them
+
+        Returns:
+            Result, or the exception raised, keyed by item
+        """
+        futures = {item: self.submit(fn, item) for item in items}
+        self.wait()
+        return {item: self._outcome(future) for item, future in futures.items()}
+
+    def wait(self):
+        """Wait for submitted calls, failing unstarted ones at the deadline"""
+        done, pending = wait(self._futures, timeout=self._remaining())
+        for future in pending:
+            future.cancel()
+        wait(pending)
+
+    def results(self) -> List[Any]:
+        """Wait and return each call's result or exception in submission order"""
+        self.wait()
+        return [self._outcome(future) for future in self._futures]
+
+    def close(self):
+        """Wait for submitted calls and release the pool"""
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class AsyncBatch(BaseBatch):
+    """
+    Run API calls of an async client as tasks with bounded concurrency
+    """
+
+    def __init__(self, client, max_concurrency: int = 8, deadline: Optional[float] = None):
+        super().__init__(client, max_concurrency, deadline)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def _run(self, fn: Callable, args, kwargs):
+        async with self._semaphore:
+            self._check_deadline()
+            return await fn(*args, **kwargs)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> 'asyncio.Task':
+        """
+        Schedule ``await fn(*args, **kwargs)``
+
+        Returns:
+            Task resolving to the call's result or exception
+        """
+        task = asyncio.ensure_future(self._run(fn, args, kwargs))
+        self._futures.append(task)
+        return task
+
+    async def map(self, fn: Callable, items: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Async counterpart of Batch.map"""
+        tasks = {item: self.submit(fn, item) for item in items}
+        await self.wait()
+        return {item: self._outcome(task) for item, task in tasks.items()}
+
+    async def wait(self):
+        """Wait for submitted calls, cancelling unfinished ones at the deadline"""
+        if not self._futures:
+            return
+        done, pending = await asyncio.wait(self._futures, timeout=self._remaining())
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+    async def results(self) -> List[Any]:
+        """Wait and return each call's result or exception in submission order"""
+        await self.wait()
+        return [self._outcome(task) for task in self._futures]
+
+    async def close(self):
+        await self.wait()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -0,0 +1,246 @@
+"""
+Card BIN lookup cache
+
+BIN data (brand, card type, issuing bank and country of a card's first six
+digits) almost never changes, so lookups are answered from an in-process
+prefix index, backed by the PaystackCardBin table when ENABLE_MODELS is on
+so the index survives restarts and is shared by every process.
+
+Unknown BINs are fetched from ``decision/bin/{bin}`` on first use (one
+request per BIN however many callers ask at once). Entries older than
+BIN_CACHE_REFRESH_AFTER are still served immediately and refreshed in the
+background.
+"""
+import asyncio
+import collections
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .exceptions import PaystackValidationError
+from .instrumentation import Counters
+from .settings import paystack_settings
+from .singleflight import SingleFlight
+
+logger = logging.getLogger('djpaystack')
+
+BIN_LENGTH = 6
+
+
+def normalize_bin(value: str) -> str:
+    """
+    Get the BIN of a card number or BIN
+
+    Raises:
+        PaystackValidationError: If there are fewer than six digits
+    """
+    digits = ''.join(c for c in str(value) if c.isdigit())
+    if len(digits) < BIN_LENGTH:
+        raise PaystackValidationError(f"A card BIN needs at least {BIN_LENGTH} digits")
+    return digits[:BIN_LENGTH]
+
+
+class BinCacheStats(Counters):
+    """Thread-safe BIN cache counters"""
+
+    FIELDS = (
+        'hits',
+        'db_hits',
+        'misses',
+        'refreshes',
+        'refresh_errors',
+    )
+
+
+class BinCache:
+    """
+    In-process BIN index backed by the PaystackCardBin table
+    """
+
+    def __init__(self):
+        self.stats = BinCacheStats()
+        self.flights = SingleFlight()
+        self._entries: 'collections.OrderedDict[str, Tuple[Dict[str, Any], float]]' = \
+            collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+
+    # Memory tier
+
+    def _memory_get(self, bin: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        with self._lock:
+            entry = self._entries.get(bin)
+            if entry is not None:
+                self._entries.move_to_end(bin)
+            return entry
+
+    def _remember(self, bin: str, response: Dict[str, Any], fetched_at: float):
+        with self._lock:
+            self._entries[bin] = (response, fetched_at)
+            self._entries.move_to_end(bin)
+            while len(self._entries) > paystack_settings.BIN_CACHE_MAXSIZE:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Empty the in-process index"""
+        with self._lock:
+            self._entries.clear()
+
+    # Table tier
+
+    def _db_get(self, bin: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        if not paystack_settings.ENABLE_MODELS:
+            return None
+
+        from django.db import DatabaseError
+        from .models import PaystackCardBin
+
+        try:
+            row = PaystackCardBin.objects.filter(bin=bin).only('raw_response', 'updated_at').first()
+        except DatabaseError as e:
+            logger.warning(f"Card BIN table unavailable: {str(e)}")
+            return None
+        if row is None:
+            return None
+
+        entry = (row.raw_response, row.updated_at.timestamp())
+        self._remember(bin, *entry)
+        return entry
+
+    def _db_save(self, bin: str, response: Dict[str, Any]):
+        if not paystack_settings.ENABLE_MODELS:
+            return
+
+        from django.db import DatabaseError
+        from .models import PaystackCardBin
+
+        data = response.get('data') or {}
+        try:
+            PaystackCardBin.objects.update_or_create(
+                bin=bin,
+                defaults={
+                    'brand': data.get('brand'),
+                    'card_type': data.get('card_type'),
+                    'bank': data.get('bank'),
+                    'country_code': data.get('country_code'),
+                    'raw_response': response,
+                }
+            )
+        except DatabaseError as e:
+            logger.warning(f"Could not store card BIN {bin}: {str(e)}")
+
+    # Lookups
+
+    def _is_stale(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at > paystack_settings.BIN_CACHE_REFRESH_AFTER
+
+    def _claim_refresh(self, bin: str) -> bool:
+        with self._lock:
+            if bin in self._refreshing:
+                return False
+            self._refreshing.add(bin)
+            return True
+
+    def _release_refresh(self, bin: str):
+        with self._lock:
+            self._refreshing.discard(bin)
+
+    def _fetch(self, client, bin: str) -> Dict[str, Any]:
+        response = client.get(f'decision/bin/{bin}')
+        self._remember(bin, response, time.time())
+        self._db_save(bin, response)
+        return response
+
+    def _refresh(self, client, bin: str):
+        from django.db import connection
+
+        try:
+            self.stats.incr('refreshes')
+            self._fetch(client, bin)
+        except Exception as e:
+            self.stats.incr('refresh_errors')
+            logger.warning(f"Card BIN refresh failed for {bin}: {str(e)}")
+        finally:
+            self._release_refresh(bin)
+            connection.close()
+
+    def get(self, client, value: str) -> Dict[str, Any]:
+        """
+        Resolve a card BIN
+
+        Args:
+            client: PaystackClient used on a miss or refresh
+            value: BIN or card number
+
+        Returns:
+            Paystack ``decision/bin`` response
+        """
+        if client.is_async:
+            return self.aget(client, value)
+
+        bin = normalize_bin(value)
+        entry = self._memory_get(bin)
+        if entry is not None:
+            self.stats.incr('hits')
+        else:
+            entry = self._db_get(bin)
+            if entry is not None:
+                self.stats.incr('db_hits')
+
+        if entry is None:
+            self.stats.incr('misses')
+            return self.flights.do(bin, lambda: self._fetch(client, bin))
+
+        response, fetched_at = entry
+        if self._is_stale(fetched_at) and self._claim_refresh(bin):
+            threading.Thread(
+                target=self._refresh,
+                args=(client, bin),
+                name='djpaystack-bin-refresh',
+                daemon=True,
+            ).start()
+        return response
+
+    async def _afetch(self, client, bin: str) -> Dict[str, Any]:
+        from asgiref.sync import sync_to_async
+
+        response = await client.get(f'decision/bin/{bin}')
+        self._remember(bin, response, time.time())
+        await sync_to_async(self._db_save, thread_sensitive=False)(bin, response)
+        return response
+
+    async def _arefresh(self, client, bin: str):
+        try:
+            self.stats.incr('refreshes')
+            await self._afetch(client, bin)
+        except Exception as e:
+            self.stats.incr('refresh_errors')
+            logger.warning(f"Card BIN refresh failed for {bin}: {str(e)}")
+        finally:
+            self._release_refresh(bin)
+
+    async def aget(self, client, value: str) -> Dict[str, Any]:
+        """Async counterpart of get; table access runs off the event loop"""
+        from asgiref.sync import sync_to_async
+
+        bin = normalize_bin(value)
+        entry = self._memory_get(bin)
+        if entry is not None:
+            self.stats.incr('hits')
+        else:
+            entry = await sync_to_async(self._db_get, thread_sensitive=False)(bin)
+            if entry is not None:
+                self.stats.incr('db_hits')
+
+        if entry is None:
+            self.stats.incr('misses')
+            return await self.flights.ado(bin, lambda: self._afetch(client, bin))
+
+        response, fetched_at = entry
+        if self._is_stale(fetched_at) and self._claim_refresh(bin):
+            asyncio.ensure_future(self._arefresh(client, bin))
+        return response
+
+
+bin_cache = BinCache()
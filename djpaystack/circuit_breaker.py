@@ -0,0 +1,170 @@
+"""
+Circuit breaker for outbound Paystack requests
+
+One breaker exists per endpoint family and process. After
+CIRCUIT_BREAKER_FAILURE_THRESHOLD consecutive failures (network errors or
+5xx responses) the breaker opens and calls fail fast with
+PaystackCircuitOpenError. After CIRCUIT_BREAKER_RECOVERY_TIMEOUT seconds a
+single probe call is let through (half-open); its outcome closes or
+re-opens the breaker. Every transition sends the
+``paystack_circuit_state_changed`` signal.
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+from .endpoints import endpoint_family
+from .exceptions import PaystackCircuitOpenError
+from .settings import paystack_settings
+from .signals import paystack_circuit_state_changed
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed/open/half-open circuit breaker
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Initialize circuit breaker
+
+        Args:
+            name: Endpoint family the breaker protects
+            failure_threshold: Consecutive failures that open the breaker
+            recovery_timeout: Seconds to stay open before probing
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _transition(self, new_state: str):
+        """Change state; returns the old state if it changed (lock held)"""
+        old_state = self.state
+        if old_state == new_state:
+            return None
+        self.state = new_state
+        return old_state
+
+    def _notify(self, old_state: Optional[str], new_state: str):
+        if old_state is not None:
+            paystack_circuit_state_changed.send(
+                sender=self.__class__,
+                breaker=self,
+                family=self.name,
+                old_state=old_state,
+                new_state=new_state,
+            )
+
+    def allow(self):
+        """
+        Check that a call may proceed
+
+        Raises:
+            PaystackCircuitOpenError: If the breaker is open, or half-open
+                with a probe already in flight
+        """
+        with self._lock:
+            now = time.monotonic()
+            old_state = None
+
+            if self.state == self.CLOSED:
+                return
+
+            if self.state == self.OPEN:
+                remaining = self.recovery_timeout - (now - self._opened_at)
+                if remaining > 0:
+                    raise PaystackCircuitOpenError(
+                        f"Circuit breaker open for {self.name}",
+                        family=self.name,
+                        retry_after=remaining,
+                    )
+                old_state = self._transition(self.HALF_OPEN)
+                self._probe_started = now
+            elif self._probe_started is None or now - self._probe_started >= self.recovery_timeout:
+                # Half-open without a live probe (a lost probe expires)
+                self._probe_started = now
+            else:
+                raise PaystackCircuitOpenError(
+                    f"Circuit breaker half-open for {self.name}, probe in flight",
+                    family=self.name,
+                    retry_after=self.recovery_timeout - (now - self._probe_started),
+                )
+
+        self._notify(old_state, self.HALF_OPEN)
+
+    def record_success(self):
+        """Record a successful call"""
+        with self._lock:
+            self.failures = 0
+            self._probe_started = None
+            old_state = self._transition(self.CLOSED)
+        self._notify(old_state, self.CLOSED)
+
+    def record_failure(self):
+        """Record a failed call"""
+        with self._lock:
+            self.failures += 1
+            old_state = None
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._probe_started = None
+                old_state = self._transition(self.OPEN)
+        self._notify(old_state, self.OPEN)
+
+    def record_status(self, status_code: int):
+        """Record a call that got a response; only 5xx counts as a failure"""
+        if status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def reset(self):
+        """Force the breaker closed"""
+        self.record_success()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(endpoint: str) -> Optional[CircuitBreaker]:
+    """
+    Get the process-wide breaker for an endpoint's family
+
+    Args:
+        endpoint: API endpoint path
+
+    Returns:
+        CircuitBreaker, or None if CIRCUIT_BREAKER_ENABLED is False
+    """
+    if not paystack_settings.CIRCUIT_BREAKER_ENABLED:
+        return None
+
+    family = endpoint_family(endpoint, paystack_settings.CIRCUIT_BREAKER_FAMILIES)
+    breaker = _breakers.get(family)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(family)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    family,
+                    failure_threshold=paystack_settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                    recovery_timeout=paystack_settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+                )
+                _breakers[family] = breaker
+    return breaker
+
+
+def reset_circuit_breakers():
+    """Discard all breakers (e.g. between tests)"""
+    with _breakers_lock:
+        _breakers.clear()
@@ -1,217 +1,450 @@
 """
 Core Paystack API client
 """
+import importlib
 import logging
+import time
 import requests
+import urllib3
 from typing import Dict, Any, Optional
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from .settings import paystack_settings
+from . import codec, instrumentation, tracing
+from .audit import redact
+from .circuit_breaker import get_circuit_breaker
+from .deadline import check_deadline, endpoint_timeout, remaining
+from .hedging import HedgePolicy
+from .ratelimit import get_rate_limiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
 from .exceptions import (
     PaystackAPIError,
     PaystackAuthenticationError,
     PaystackNetworkError,
-)
-from .api import (
-    TransactionAPI,
-    SplitAPI,
-    TerminalAPI,
-    VirtualTerminalAPI,
-    CustomerAPI,
-    DirectDebitAPI,
-    DedicatedAccountAPI,
-    ApplePayAPI,
-    SubaccountAPI,
-    PlanAPI,
-    SubscriptionAPI,
-    ProductAPI,
-    PageAPI,
-    PaymentRequestAPI,
-    SettlementAPI,
-    TransferRecipientAPI,
-    TransferAPI,
-    TransferControlAPI,
-    BulkChargeAPI,
-    IntegrationAPI,
-    ChargeAPI,
-    DisputeAPI,
-    RefundAPI,
-    VerificationAPI,
-    MiscellaneousAPI,
+    PaystackTimeoutError,
 )
 
 logger = logging.getLogger('djpaystack')
 
 
-class PaystackClient:
+def _request_not_sent(error: requests.exceptions.RequestException) -> bool:
     """
-    Main Paystack API client with all service endpoints
+    Check whether a failed request provably never reached Paystack
+
+    Matches httpx's ConnectError/ConnectTimeout in the async client: the
+    connection could not be established (timeout, refusal, DNS failure).
+    Errors after connecting, such as a reset while reading, do not qualify.
     """
-    
-    def __init__(self, secret_key: Optional[str] = None, public_key: Optional[str] = None):
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        reason = getattr(error.args[0], 'reason', error.args[0])
+        return isinstance(reason, (urllib3.exceptions.NewConnectionError,
+                                   urllib3.exceptions.ConnectTimeoutError))
+    return False
+
+
+class LazyNamespace:
+    """
+    API namespace built on first access
+
+    Clients only import and instantiate the endpoint modules they use,
+    which keeps client construction and cold starts cheap.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        self.module = module
+        self.class_name = class_name
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+        module = importlib.import_module(f'djpaystack.api.{self.module}')
+        api = getattr(module, self.class_name)(client)
+        # Cached on the instance, which takes precedence from now on
+        client.__dict__[self.name] = api
+        return api
+
+
+class BaseClient:
+    """
+    Configuration and API endpoints shared by the sync and async clients
+    """
+
+    #: True for clients whose request methods return coroutines
+    is_async = False
+
+    # API endpoints
+    transactions = LazyNamespace('transactions', 'TransactionAPI')
+    splits = LazyNamespace('splits', 'SplitAPI')
+    terminal = LazyNamespace('terminal', 'TerminalAPI')
+    virtual_terminal = LazyNamespace('virtual_terminal', 'VirtualTerminalAPI')
+    customers = LazyNamespace('customers', 'CustomerAPI')
+    direct_debit = LazyNamespace('direct_debit', 'DirectDebitAPI')
+    dedicated_accounts = LazyNamespace('dedicated_accounts', 'DedicatedAccountAPI')
+    apple_pay = LazyNamespace('apple_pay', 'ApplePayAPI')
+    subaccounts = LazyNamespace('subaccounts', 'SubaccountAPI')
+    plans = LazyNamespace('plans', 'PlanAPI')
+    subscriptions = LazyNamespace('subscriptions', 'SubscriptionAPI')
+    products = LazyNamespace('products', 'ProductAPI')
+    pages = LazyNamespace('pages', 'PageAPI')
+    payment_requests = LazyNamespace('payment_requests', 'PaymentRequestAPI')
+    settlements = LazyNamespace('settlements', 'SettlementAPI')
+    transfer_recipients = LazyNamespace('transfer_recipients', 'TransferRecipientAPI')
+    transfers = LazyNamespace('transfers', 'TransferAPI')
+    transfer_control = LazyNamespace('transfer_control', 'TransferControlAPI')
+    bulk_charges = LazyNamespace('bulk_charges', 'BulkChargeAPI')
+    integration = LazyNamespace('integration', 'IntegrationAPI')
+    charge = LazyNamespace('charge', 'ChargeAPI')
+    disputes = LazyNamespace('disputes', 'DisputeAPI')
+    refunds = LazyNamespace('refunds', 'RefundAPI')
+    verification = LazyNamespace('verification', 'VerificationAPI')
+    miscellaneous = LazyNamespace('miscellaneous', 'MiscellaneousAPI')
+
+    def __init__(
+        self,
+        secret_key: Optional[str] = None,
+        public_key: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
         """
         Initialize Paystack client
-        
+
         Args:
             secret_key: Optional Paystack secret key (overrides settings)
             public_key: Optional Paystack public key (overrides settings)
+            retry_policy: Optional retry policy (defaults to one built from settings)
         """
         self.secret_key = secret_key or paystack_settings.SECRET_KEY
         self.public_key = public_key or paystack_settings.PUBLIC_KEY
         self.base_url = paystack_settings.BASE_URL
         self.timeout = paystack_settings.TIMEOUT
-        
+        self.retry_policy = retry_policy or RetryPolicy.from_settings()
+        self.coalescer = SingleFlight()
+        self.hedge_policy = HedgePolicy.from_settings()
+
         if not self.secret_key:
             raise PaystackAuthenticationError("Paystack secret key is required")
-        
-        # Setup session with retry logic
+        self._auth_header = paystack_settings.AUTH_HEADER \
+            if self.secret_key == paystack_settings.SECRET_KEY else f'Bearer {self.secret_key}'
+
+        # Setup HTTP session
         self.session = self._create_session()
-        
-        # Initialize API endpoints
-        self.transactions = TransactionAPI(self)
-        self.splits = SplitAPI(self)
-        self.terminal = TerminalAPI(self)
-        self.virtual_terminal = VirtualTerminalAPI(self)
-        self.customers = CustomerAPI(self)
-        self.direct_debit = DirectDebitAPI(self)
-        self.dedicated_accounts = DedicatedAccountAPI(self)
-        self.apple_pay = ApplePayAPI(self)
-        self.subaccounts = SubaccountAPI(self)
-        self.plans = PlanAPI(self)
-        self.subscriptions = SubscriptionAPI(self)
-        self.products = ProductAPI(self)
-        self.pages = PageAPI(self)
-        self.payment_requests = PaymentRequestAPI(self)
-        self.settlements = SettlementAPI(self)
-        self.transfer_recipients = TransferRecipientAPI(self)
-        self.transfers = TransferAPI(self)
-        self.transfer_control = TransferControlAPI(self)
-        self.bulk_charges = BulkChargeAPI(self)
-        self.integration = IntegrationAPI(self)
-        self.charge = ChargeAPI(self)
-        self.disputes = DisputeAPI(self)
-        self.refunds = RefundAPI(self)
-        self.verification = VerificationAPI(self)
-        self.miscellaneous = MiscellaneousAPI(self)
-    
+
+    def _create_session(self):
+        """Create the underlying HTTP session"""
+        raise NotImplementedError
+
+    def batch(self, max_concurrency: int = 8, deadline: Optional[float] = None):
+        """
+        Run many independent API calls concurrently
+
+        Args:
+            max_concurrency: Maximum calls in flight at once (keep within
+                POOL_MAXSIZE to reuse connections)
+            deadline: Seconds after which unstarted calls fail with
+                PaystackTimeoutError
+
+        Returns:
+            Batch (AsyncBatch for async clients), usable as a context manager
+        """
+        from .batch import AsyncBatch, Batch
+
+        batch_class = AsyncBatch if self.is_async else Batch
+        return batch_class(self, max_concurrency=max_concurrency, deadline=deadline)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Connection pool gauges (``in_use``, ``maxsize``) where the transport exposes them"""
+        return {}
+
+    def _get_headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
+        """Get request headers with authentication"""
+        headers = {
+            'Authorization': self._auth_header,
+            'Content-Type': 'application/json',
+        }
+        if idempotency_key:
+            headers['Idempotency-Key'] = idempotency_key
+        return headers
+
+    def _build_url(self, endpoint: str) -> str:
+        """Build absolute URL for an API endpoint"""
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _coalesce_key(self, method: str, endpoint: str, data, params, kwargs) -> Optional[bytes]:
+        """
+        Key under which concurrent identical requests share one call, or
+        None if the request must not be coalesced
+        """
+        if method.upper() != 'GET' or data is not None or kwargs \
+                or not paystack_settings.COALESCE_GETS:
+            return None
+        return codec.dumps([endpoint.strip('/'), sorted((params or {}).items())], default=str)
+
+    def _check_response(self, response_data: Dict[str, Any], status_code: int) -> Dict[str, Any]:
+        """
+        Raise PaystackAPIError for unsuccessful API responses
+
+        Args:
+            response_data: Parsed response body
+            status_code: HTTP status code
+
+        Returns:
+            Response data dictionary
+        """
+        if not response_data.get('status'):
+            error_message = response_data.get('message', 'Unknown error')
+            raise PaystackAPIError(
+                error_message,
+                status_code=status_code,
+                response=response_data
+            )
+
+        return response_data
+
+
+class PaystackClient(BaseClient):
+    """
+    Main Paystack API client with all service endpoints
+    """
+
     def _create_session(self) -> requests.Session:
-        """Create requests session with retry logic"""
+        """Create requests session; retries are handled by the retry policy"""
         session = requests.Session()
-        
-        retry_strategy = Retry(
-            total=paystack_settings.MAX_RETRIES,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT"]
+
+        adapter = HTTPAdapter(
+            pool_connections=paystack_settings.POOL_CONNECTIONS,
+            pool_maxsize=paystack_settings.POOL_MAXSIZE,
+            pool_block=paystack_settings.POOL_BLOCK,
+            max_retries=0,
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
-        
+
+        if not paystack_settings.KEEP_ALIVE:
+            session.headers['Connection'] = 'close'
+
         return session
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with authentication"""
-        return {
-            'Authorization': f'Bearer {self.secret_key}',
-            'Content-Type': 'application/json',
-        }
-    
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Connections checked out of, and allowed in, the session's urllib3 pools"""
+        in_use = maxsize = 0
+        adapters = {id(adapter): adapter for adapter in self.session.adapters.values()}
+        for adapter in adapters.values():
+            pools = getattr(adapter, 'poolmanager', None)
+            if pools is None:
+                continue
+            for key in list(pools.pools.keys()):
+                pool = pools.pools.get(key)
+                if pool is None or pool.pool is None:
+                    continue
+                maxsize += pool.pool.maxsize
+                in_use += pool.pool.maxsize - pool.pool.qsize()
+        return {'in_use': in_use, 'maxsize': maxsize}
+
+    @tracing.traced('paystack.request')
     def request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
         Make HTTP request to Paystack API
-        
+
+        Failed attempts are retried according to ``self.retry_policy``.
+        Concurrent identical GETs share one in-flight request (COALESCE_GETS);
+        treat the returned data as read-only.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint path
             data: Request body data
             params: URL query parameters
+            idempotency_key: Optional key sent as Idempotency-Key; does not by
+                itself make a POST safe to retry (see RetryPolicy.is_retry_safe)
             **kwargs: Additional arguments for requests
-            
+
         Returns:
             Response data dictionary
-            
+
         Raises:
             PaystackAPIError: If API returns error
             PaystackNetworkError: If network request fails
+            PaystackRateLimitError: If the client-side rate limit has no capacity
+            PaystackCircuitOpenError: If the circuit breaker is open
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = self._get_headers()
-        
+        tracing.tag_request(method, endpoint, data, params)
+        key = self._coalesce_key(method, endpoint, data, params, kwargs)
+        if key is not None:
+            return self.coalescer.do(
+                key, lambda: self._send(method, endpoint, data, params, idempotency_key))
+        return self._send(method, endpoint, data, params, idempotency_key, **kwargs)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send a request, reporting it to instrumentation hooks"""
+        body = codec.dumps(data) if data is not None else None
+        call = instrumentation.start(method, endpoint, body)
+        try:
+            response_data = self._transmit(
+                call, method, endpoint, body, data, params, idempotency_key, **kwargs)
+        except BaseException as e:
+            call.fail(e)
+            raise
+        call.finish()
+        return response_data
+
+    def _transmit(
+        self,
+        call,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes],
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send a request, with retries, rate limiting and circuit breaking"""
+        url = self._build_url(endpoint)
+        headers = self._get_headers(idempotency_key)
+        retry = self.retry_policy.begin(method, endpoint, data, idempotency_key)
+
         # Log request if enabled
         if paystack_settings.LOG_REQUESTS:
             logger.info(f"Paystack Request: {method} {url}")
-            if data:
-                logger.debug(f"Request Data: {data}")
-        
-        try:
-            response = self.session.request(
+            if data and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Request Data: {redact(data)}")
+
+        breaker = get_circuit_breaker(endpoint)
+        hedge_family = self.hedge_policy.family(method, endpoint)
+
+        def send():
+            return self.session.request(
                 method=method,
                 url=url,
                 headers=headers,
-                json=data,
+                data=body,
                 params=params,
-                timeout=self.timeout,
+                timeout=timeout,
                 verify=paystack_settings.VERIFY_SSL,
                 **kwargs
             )
-            
-            # Log response if enabled
-            if paystack_settings.LOG_RESPONSES:
-                logger.info(f"Paystack Response: {response.status_code}")
-                logger.debug(f"Response Data: {response.text}")
-            
-            # Parse JSON response
+
+        def admit_hedge():
+            # A hedge is a request of its own; it must not wait for a token
+            if limiter:
+                limiter.acquire(endpoint, timeout=0)
+            if breaker:
+                breaker.allow()
+
+        while True:
+            check_deadline()
+
+            # Respect client-side rate limit
+            limiter = get_rate_limiter()
+            if limiter:
+                limiter.acquire(endpoint)
+
+            timeout = endpoint_timeout(endpoint, self.timeout)
+
+            # Fail fast while Paystack is failing for this endpoint family.
+            # Checked last: a half-open probe admitted here must be sent.
+            if breaker:
+                breaker.allow()
+
+            call.attempt()
+
             try:
-                response_data = response.json()
-            except ValueError:
-                raise PaystackAPIError(
-                    f"Invalid JSON response from Paystack: {response.text}",
-                    status_code=response.status_code,
-                    response=response
-                )
-            
-            # Check for errors
-            if not response_data.get('status'):
-                error_message = response_data.get('message', 'Unknown error')
-                raise PaystackAPIError(
-                    error_message,
-                    status_code=response.status_code,
-                    response=response_data
-                )
-            
-            return response_data
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Paystack network error: {str(e)}")
-            raise PaystackNetworkError(f"Network request failed: {str(e)}")
-    
+                if hedge_family:
+                    response = self.hedge_policy.call(hedge_family, send, admit_hedge)
+                else:
+                    response = send()
+            except requests.exceptions.RequestException as e:
+                if remaining() == 0:
+                    raise PaystackTimeoutError(f"Deadline exceeded during request: {str(e)}")
+                if breaker:
+                    breaker.record_failure()
+                delay = retry.next_delay(request_sent=not _request_not_sent(e))
+                if delay is None:
+                    logger.error(f"Paystack network error: {str(e)}")
+                    raise PaystackNetworkError(f"Network request failed: {str(e)}")
+                logger.warning(f"Paystack network error, retrying in {delay:.2f}s: {str(e)}")
+                time.sleep(delay)
+                continue
+
+            if breaker:
+                breaker.record_status(response.status_code)
+
+            if response.status_code in self.retry_policy.retry_statuses:
+                delay = retry.next_delay(
+                    response.status_code, retry_after=response.headers.get('Retry-After'))
+                if delay is not None:
+                    logger.warning(
+                        f"Paystack returned {response.status_code}, retrying in {delay:.2f}s")
+                    time.sleep(delay)
+                    continue
+
+            break
+
+        call.response(response)
+        tracing.set_attributes(status_code=response.status_code, attempts=retry.attempts)
+
+        # Log response if enabled
+        if paystack_settings.LOG_RESPONSES:
+            logger.info(f"Paystack Response: {response.status_code}")
+
+        # Parse JSON response
+        try:
+            response_data = codec.loads(response.content)
+        except ValueError:
+            raise PaystackAPIError(
+                f"Invalid JSON response from Paystack: {response.text}",
+                status_code=response.status_code,
+                response=response
+            )
+
+        if paystack_settings.LOG_RESPONSES and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Response Data: {redact(response_data)}")
+
+        # Check for errors
+        return self._check_response(response_data, response.status_code)
+
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make GET request"""
         return self.request('GET', endpoint, params=params)
     
-    def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
+             idempotency_key: Optional[str] = None) -> Dict[str, Any]:
         """Make POST request"""
-        return self.request('POST', endpoint, data=data)
+        return self.request('POST', endpoint, data=data, idempotency_key=idempotency_key)
     
     def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make PUT request"""
         return self.request('PUT', endpoint, data=data)
     
-    def delete(self, endpoint: str) -> Dict[str, Any]:
+    def delete(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make DELETE request"""
-        return self.request('DELETE', endpoint)
+        return self.request('DELETE', endpoint, data=data)
     
     def close(self):
         """Close session"""
+        self.hedge_policy.close()
         if self.session:
             self.session.close()
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Pluggable JSON codec
+
+The JSON_CODEC setting selects the library used for request bodies,
+responses, webhook payloads and model JSONFields:
+
+* ``'auto'`` (default): orjson, then ujson, then the standard library
+* ``'orjson'``, ``'ujson'`` or ``'json'``: that library, falling back to the
+  standard library (with a warning) if it is not installed
+
+Every codec raises ValueError for invalid input, like ``json.loads``.
+"""
+import json
+import logging
+from typing import Any, Callable, Optional, Union
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .exceptions import PaystackConfigurationError
+from .settings import paystack_settings
+
+logger = logging.getLogger('djpaystack')
+
+
+class JSONCodec:
+    """Standard library codec"""
+
+    name = 'json'
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Serialize to compact UTF-8 JSON"""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=default).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Deserialize JSON bytes or text"""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson codec"""
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        option = self._orjson.OPT_NON_STR_KEYS
+        if default is not None:
+            # Let the caller's default format dates, like the stdlib codec
+            option |= self._orjson.OPT_PASSTHROUGH_DATETIME
+        return self._orjson.dumps(obj, default=default, option=option)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """ujson codec"""
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False, default=default).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+
+CODECS = {
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+    'json': JSONCodec,
+}
+
+_codec: Optional[JSONCodec] = None
+_codec_name: Optional[str] = None
+
+
+def _build_codec(name: str) -> JSONCodec:
+    if name == 'auto':
+        for candidate in ('orjson', 'ujson'):
+            try:
+                return CODECS[candidate]()
+            except ImportError:
+                continue
+        return JSONCodec()
+
+    if name not in CODECS:
+        raise PaystackConfigurationError(
+            f"JSON_CODEC must be 'auto' or one of {sorted(CODECS)}, got {name!r}")
+
+    try:
+        return CODECS[name]()
+    except ImportError:
+        logger.warning(f"JSON_CODEC {name!r} is not installed, using the standard library")
+        return JSONCodec()
+
+
+def get_codec() -> JSONCodec:
+    """Get the codec selected by the JSON_CODEC setting"""
+    global _codec, _codec_name
+
+    name = paystack_settings.JSON_CODEC
+    if _codec is None or name != _codec_name:
+        _codec = _build_codec(name)
+        _codec_name = name
+    return _codec
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize with the configured codec"""
+    return get_codec().dumps(obj, default=default)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize with the configured codec"""
+    return get_codec().loads(data)
+
+
+class PaystackJSONEncoder(DjangoJSONEncoder):
+    """
+    JSONField encoder that serializes with the configured codec
+
+    Types the codec cannot handle natively (dates, Decimal, UUID) go through
+    DjangoJSONEncoder.default.
+    """
+
+    def encode(self, o):
+        return dumps(o, default=self.default).decode('utf-8')
+
+
+class PaystackJSONDecoder(json.JSONDecoder):
+    """JSONField decoder that parses with the configured codec"""
+
+    def decode(self, s, *args, **kwargs):
+        return loads(s)
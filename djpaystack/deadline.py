@@ -0,0 +1,93 @@
+"""
+Deadline propagation and per-endpoint timeouts
+
+A deadline bounds the total time spent on Paystack calls inside it,
+across retries, rate limit waits and pagination::
+
+    with paystack_deadline(2.0):
+        client.transactions.verify(reference)
+
+Attempt timeouts are shortened to the time left, retries that could not
+finish in time are not attempted, and calls starting after the deadline
+raise PaystackTimeoutError. Deadlines nest (the earliest wins) and follow
+the context into threads started by the package and into asyncio tasks.
+"""
+import contextlib
+import contextvars
+import time
+from typing import Iterator, Optional, Tuple
+
+from .endpoints import endpoint_family
+from .exceptions import PaystackTimeoutError
+from .settings import paystack_settings
+
+_deadline = contextvars.ContextVar('djpaystack_deadline', default=None)
+
+
+@contextlib.contextmanager
+def paystack_deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound the total time of Paystack calls made inside the block
+
+    Args:
+        seconds: Latency budget from now
+    """
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None without one"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def check_deadline(what: str = "Paystack call"):
+    """
+    Raises:
+        PaystackTimeoutError: If the current deadline has passed
+    """
+    if remaining() == 0:
+        raise PaystackTimeoutError(f"Deadline exceeded before the {what} could complete")
+
+
+def endpoint_timeout(endpoint: str, default: Optional[float] = None) -> Tuple[float, float]:
+    """
+    Get the (connect, read) timeout of an endpoint
+
+    TIMEOUTS maps endpoint families to a read timeout or a (connect, read)
+    pair; other endpoints use CONNECT_TIMEOUT and TIMEOUT. Both are capped
+    by the time left before the current deadline.
+
+    Args:
+        endpoint: API endpoint path
+        default: Read timeout overriding TIMEOUT
+    """
+    profiles = paystack_settings.TIMEOUT_PROFILES
+    read = default if default is not None else paystack_settings.TIMEOUT
+    connect = paystack_settings.CONNECT_TIMEOUT
+
+    if profiles:
+        profile = profiles.get(endpoint_family(endpoint, profiles))
+        if profile is not None:
+            profile_connect, read = profile
+            if profile_connect is not None:
+                connect = profile_connect
+
+    if connect is None:
+        connect = read
+
+    left = remaining()
+    if left is not None:
+        connect, read = min(connect, left), min(read, left)
+    return connect, read
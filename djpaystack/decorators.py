@@ -1,7 +1,8 @@
+import math
 
 from functools import wraps
 from django.http import JsonResponse
-from .exceptions import PaystackError
+from .exceptions import PaystackError, PaystackCircuitOpenError, PaystackTimeoutError
 
 
 def handle_paystack_errors(func):
@@ -12,6 +13,19 @@ def handle_paystack_errors(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
+        except PaystackCircuitOpenError as e:
+            response = JsonResponse({
+                'status': 'error',
+                'message': 'Payment service temporarily unavailable',
+            }, status=503)
+            if e.retry_after:
+                response['Retry-After'] = str(max(1, math.ceil(e.retry_after)))
+            return response
+        except PaystackTimeoutError:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Payment service did not respond in time',
+            }, status=504)
         except PaystackError as e:
             return JsonResponse({
                 'status': 'error',
@@ -0,0 +1,87 @@
+"""
+Import-time benchmark
+
+Measures ``import djpaystack`` (and optionally a full client) in fresh
+interpreters, so startup regressions show up as numbers::
+
+    python -m djpaystack.dev.import_benchmark
+    python -m djpaystack.dev.import_benchmark --statement "djpaystack.PaystackClient" --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+
+def _import_times(code: str) -> List[Tuple[int, str]]:
+    """Cumulative import time (us) and indented name of every module ``code`` imports"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True,
+    )
+
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.append((int(cumulative), name[1:].rstrip()))
+    return modules
+
+
+def _run(statement: str, startup: set) -> Tuple[float, List[Tuple[int, str]]]:
+    """Time one import in a fresh interpreter"""
+    code = f"import djpaystack\n{statement}" if statement else "import djpaystack"
+    modules = [(us, name) for us, name in _import_times(code) if name.strip() not in startup]
+
+    # Top-level imports are not indented; their cumulative times add up
+    total = sum(us for us, name in modules if not name.startswith(' '))
+    return total / 1e6, modules
+
+
+def benchmark(statement: str = '', runs: int = 10) -> dict:
+    """
+    Import djpaystack ``runs`` times in fresh interpreters
+
+    Args:
+        statement: Extra code run after ``import djpaystack``
+        runs: Number of interpreters
+
+    Returns:
+        Median and best time in seconds and the slowest modules of the last run
+    """
+    # Modules the interpreter imports at startup are not ours to count
+    startup = {name.strip() for _, name in _import_times('pass')}
+
+    times = []
+    modules = []
+    for _ in range(runs):
+        seconds, modules = _run(statement, startup)
+        times.append(seconds)
+
+    slowest = sorted(modules, reverse=True)[:10]
+    return {
+        'median': statistics.median(times),
+        'best': min(times),
+        'slowest': [(name.strip(), us / 1e6) for us, name in slowest],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--statement', default='', help='Code to run after import djpaystack')
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    result = benchmark(args.statement, args.runs)
+    print(f"import djpaystack{'; ' + args.statement if args.statement else ''}")
+    print(f"  median {result['median'] * 1000:.1f} ms, best {result['best'] * 1000:.1f} ms "
+          f"over {args.runs} runs")
+    print("  slowest modules (cumulative):")
+    for name, seconds in result['slowest']:
+        print(f"    {seconds * 1000:8.1f} ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Helpers for classifying Paystack API endpoints
+"""
+from typing import Iterable, Optional
+
+
+def endpoint_path(endpoint: str) -> str:
+    """Normalize an endpoint to a path without leading/trailing slashes or query"""
+    return endpoint.split('?', 1)[0].strip('/')
+
+
+def endpoint_family(endpoint: str, families: Iterable[str] = ()) -> str:
+    """
+    Get the family an endpoint belongs to
+
+    The longest configured family that prefixes the endpoint path wins
+    (matching on whole path segments), so ``transaction/verify`` can be
+    configured separately from ``transaction``. Without a configured match
+    the first path segment is used.
+
+    Args:
+        endpoint: API endpoint path, e.g. ``transaction/verify/ref_123``
+        families: Configured family prefixes
+
+    Returns:
+        Family name, e.g. ``transaction/verify`` or ``transfer``
+    """
+    path = endpoint_path(endpoint)
+    match: Optional[str] = None
+
+    for family in families:
+        prefix = family.strip('/')
+        if path == prefix or path.startswith(prefix + '/'):
+            if match is None or len(prefix) > len(match):
+                match = prefix
+
+    return match if match is not None else path.split('/', 1)[0]
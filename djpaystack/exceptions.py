@@ -35,6 +35,20 @@ class PaystackNetworkError(PaystackError):
     pass
 
 
+class PaystackTimeoutError(PaystackNetworkError):
+    """Raised when a deadline passes before a call could complete"""
+    pass
+
+
+class PaystackCircuitOpenError(PaystackNetworkError):
+    """Raised when calls are short-circuited because Paystack is failing"""
+
+    def __init__(self, message, family=None, retry_after=None, response=None):
+        super().__init__(message, response)
+        self.family = family
+        self.retry_after = retry_after
+
+
 class PaystackWebhookError(PaystackError):
     """Raised when webhook validation or processing fails"""
     pass
@@ -43,3 +57,11 @@ class PaystackWebhookError(PaystackError):
 class PaystackConfigurationError(PaystackError):
     """Raised when configuration is invalid or missing"""
     pass
+
+
+class PaystackRateLimitError(PaystackError):
+    """Raised when the client-side rate limit has no capacity in time"""
+
+    def __init__(self, message, retry_after=None, response=None):
+        super().__init__(message, response)
+        self.retry_after = retry_after
@@ -0,0 +1,241 @@
+"""
+Hedged requests for latency-critical idempotent reads
+
+For endpoint families listed in HEDGE_ENDPOINTS, a GET that has not been
+answered within the family's HEDGE_PERCENTILE latency (learned from recent
+requests) is sent a second time; whichever answer arrives first is used.
+A budget of HEDGE_BUDGET_RATIO hedges per request caps the extra load, and
+a hedge is only sent if the rate limiter and circuit breaker admit it.
+"""
+import asyncio
+import collections
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Optional
+
+from .endpoints import endpoint_family
+from .exceptions import PaystackError
+from .instrumentation import Counters
+from .retry import RetryBudget
+from .settings import paystack_settings
+
+
+class HedgeStats(Counters):
+    """Thread-safe hedging counters"""
+
+    FIELDS = (
+        'requests',
+        'hedges',
+        'hedge_wins',
+        'budget_exhausted',
+        'refused',
+    )
+
+
+class LatencyTracker:
+    """
+    Sliding window of recent latencies per endpoint family
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, collections.deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, family: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(family)
+            if samples is None:
+                samples = self._samples[family] = collections.deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, family: str, percentile: float, min_samples: int = 20) -> Optional[float]:
+        """Get a latency percentile, or None until enough samples exist"""
+        with self._lock:
+            samples = sorted(self._samples.get(family, ()))
+        if len(samples) < min_samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * percentile / 100))
+        return samples[index]
+
+
+class HedgePolicy:
+    """
+    Decides whether and when to hedge a request
+    """
+
+    def __init__(
+        self,
+        families: Iterable[str] = (),
+        percentile: float = 95,
+        default_delay: float = 1.0,
+        min_delay: float = 0.05,
+        budget: Optional[RetryBudget] = None,
+        max_workers: int = 16,
+    ):
+        """
+        Initialize hedge policy
+
+        Args:
+            families: Endpoint families to hedge, e.g. ['transaction/verify']
+            percentile: Latency percentile after which a hedge is sent
+            default_delay: Hedge delay until enough latencies are recorded
+            min_delay: Lower bound of the hedge delay
+            budget: Caps hedges to a fraction of hedgeable requests
+            max_workers: Threads available to sync clients for hedged calls
+        """
+        self.families = [family.strip('/') for family in families]
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.budget = budget
+        self.max_workers = max_workers
+        self.latency = LatencyTracker()
+        self.stats = HedgeStats()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> 'HedgePolicy':
+        """Build the default policy from PAYSTACK settings"""
+        return cls(
+            families=paystack_settings.HEDGE_ENDPOINTS,
+            percentile=paystack_settings.HEDGE_PERCENTILE,
+            default_delay=paystack_settings.HEDGE_DEFAULT_DELAY,
+            budget=RetryBudget(ratio=paystack_settings.HEDGE_BUDGET_RATIO, min_tokens=5),
+            max_workers=paystack_settings.HEDGE_MAX_WORKERS,
+        )
+
+    def family(self, method: str, endpoint: str) -> Optional[str]:
+        """Get the hedged family of a request, or None if it is not hedged"""
+        if method.upper() != 'GET' or not self.families:
+            return None
+        family = endpoint_family(endpoint, self.families)
+        return family if family in self.families else None
+
+    def delay(self, family: str) -> float:
+        observed = self.latency.percentile(family, self.percentile)
+        return max(self.min_delay, self.default_delay if observed is None else observed)
+
+    def _allow_hedge(self, admit: Optional[Callable] = None) -> bool:
+        if self.budget and not self.budget.withdraw():
+            self.stats.incr('budget_exhausted')
+            return False
+        try:
+            if admit is not None:
+                admit()
+        except PaystackError:
+            self.stats.incr('refused')
+            return False
+        self.stats.incr('hedges')
+        return True
+
+    async def _aallow_hedge(self, admit: Optional[Callable] = None) -> bool:
+        if self.budget and not self.budget.withdraw():
+            self.stats.incr('budget_exhausted')
+            return False
+        try:
+            if admit is not None:
+                await admit()
+        except PaystackError:
+            self.stats.incr('refused')
+            return False
+        self.stats.incr('hedges')
+        return True
+
+    def _begin(self):
+        self.stats.incr('requests')
+        if self.budget:
+            self.budget.deposit()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='djpaystack-hedge')
+        return self._executor
+
+    def _timed(self, family: str, send: Callable):
+        start = time.monotonic()
+        result = send()
+        self.latency.record(family, time.monotonic() - start)
+        return result
+
+    async def _atimed(self, family: str, send: Callable):
+        start = time.monotonic()
+        result = await send()
+        self.latency.record(family, time.monotonic() - start)
+        return result
+
+    def _submit(self, family: str, send: Callable):
+        # Each attempt runs in its own copy of the caller's context
+        context = contextvars.copy_context()
+        return self._get_executor().submit(context.run, self._timed, family, send)
+
+    def call(self, family: str, send: Callable, admit: Optional[Callable] = None):
+        """
+        Run ``send()`` with a hedge if it is slow (sync clients)
+
+        Both attempts run on the thread pool and the first success is
+        returned. The losing call cannot be interrupted; it finishes in the
+        background and its response is discarded.
+
+        Args:
+            family: Hedged endpoint family
+            send: Makes one attempt
+            admit: Called before the hedge is sent (rate limit, circuit
+                breaker); raising PaystackError skips the hedge
+        """
+        self._begin()
+        primary = self._submit(family, send)
+        done, _ = wait([primary], timeout=self.delay(family))
+        if done or not self._allow_hedge(admit):
+            return primary.result()
+
+        hedge = self._submit(family, send)
+        pending = [primary, hedge]
+        error = None
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            # Prefer the primary when both finished together
+            for future in sorted(done, key=lambda future: future is hedge):
+                pending.remove(future)
+                if future.exception() is None:
+                    if future is hedge:
+                        self.stats.incr('hedge_wins')
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    async def acall(self, family: str, send: Callable, admit: Optional[Callable] = None):
+        """Async counterpart of call (``admit`` is awaited); the losing request is cancelled"""
+        self._begin()
+        primary = asyncio.ensure_future(self._atimed(family, send))
+        done, _ = await asyncio.wait([primary], timeout=self.delay(family))
+        if done or not await self._aallow_hedge(admit):
+            return await primary
+
+        hedge = asyncio.ensure_future(self._atimed(family, send))
+        pending = {primary, hedge}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.stats.incr('hedge_wins')
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
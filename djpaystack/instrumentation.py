@@ -0,0 +1,422 @@
+"""
+Request instrumentation hooks and a Prometheus metrics collector
+
+Hooks observe every logical request made by a client (retries included)::
+
+    from djpaystack.instrumentation import RequestHook, register_hook
+
+    class SlowCallLogger(RequestHook):
+        def after_response(self, call):
+            if call.duration > 2:
+                logger.warning(f"Slow Paystack call to {call.template}")
+
+    register_hook(SlowCallLogger())
+
+Hooks listed in REQUEST_HOOKS (dotted paths) are registered on first use.
+With METRICS_ENABLED the built-in ``collector`` is registered as well; it
+keeps per-endpoint counters and latency histograms, exported in Prometheus
+text format by ``djpaystack.views.paystack_metrics``.
+"""
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .endpoints import endpoint_path
+from .settings import paystack_settings
+
+logger = logging.getLogger('djpaystack')
+
+# Placeholder names for dynamic segments following these path segments
+PLACEHOLDERS = {
+    'verify': 'reference',
+    'bin': 'bin',
+    'customer': 'code',
+    'plan': 'code',
+    'product': 'id',
+    'subscription': 'code',
+    'transfer': 'code',
+    'page': 'id',
+    'paymentrequest': 'code',
+    'dispute': 'id',
+    'refund': 'id',
+    'check_slug_availability': 'slug',
+}
+
+# Fixed path segments of each API resource; any other segment is dynamic
+STATIC_SEGMENTS = {
+    'address_verification': {'states'},
+    'apple-pay': {'domain'},
+    'balance': {'ledger'},
+    'bank': {'resolve', 'validate'},
+    'bulkcharge': {'pause', 'resume'},
+    'charge': {'submit_address', 'submit_birthday', 'submit_otp', 'submit_phone', 'submit_pin'},
+    'customer': {'deactivate_authorization', 'set_risk_action', 'identification'},
+    'decision': {'bin'},
+    'dedicated_account': {'available_providers', 'requery', 'split'},
+    'dispute': {'export', 'transaction', 'upload_url', 'evidence', 'resolve'},
+    'integration': {'payment_session_timeout'},
+    'mandate': {'activate', 'deactivate'},
+    'page': {'check_slug_availability', 'product'},
+    'paymentrequest': {'totals', 'verify', 'archive', 'finalize', 'notify'},
+    'split': {'subaccount', 'add', 'remove'},
+    'subscription': {'manage', 'link', 'email', 'disable', 'enable'},
+    'terminal': {'commission_device', 'decommission_device', 'event', 'presence'},
+    'transaction': {
+        'verify', 'timeline', 'totals', 'export', 'initialize', 'charge_authorization',
+        'check_authorization', 'partial_debit',
+    },
+    'transfer': {
+        'verify', 'bulk', 'disable_otp', 'disable_otp_finalize', 'enable_otp',
+        'finalize_transfer', 'resend_otp',
+    },
+    'transferrecipient': {'bulk'},
+    'virtual_terminal': {'event'},
+}
+
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Counters:
+    """
+    Thread-safe named counters
+
+    Subclasses list their counter names in ``FIELDS``.
+    """
+
+    FIELDS: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counts[name] += amount
+
+    def snapshot(self) -> Dict[str, int]:
+        """Get a copy of the current counters"""
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts = dict.fromkeys(self.FIELDS, 0)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Normalize an endpoint to a low-cardinality template
+
+    Segments after the resource that are not among its STATIC_SEGMENTS
+    (ids, codes, references, slugs, emails) are replaced by a placeholder,
+    e.g. ``transaction/verify/ref_1`` becomes ``transaction/verify/{reference}``.
+    """
+    segments = endpoint_path(endpoint).split('/')
+    template = segments[:1]
+    static = STATIC_SEGMENTS.get(segments[0], ())
+    for previous, segment in zip(segments, segments[1:]):
+        if segment in static and previous != 'verify':
+            template.append(segment)
+        else:
+            template.append('{%s}' % PLACEHOLDERS.get(previous, 'id'))
+    return '/'.join(template)
+
+
+class RequestCall:
+    """What hooks know about one logical request"""
+
+    __slots__ = (
+        'method', 'endpoint', 'template', 'started', 'duration',
+        'status', 'attempts', 'request_bytes', 'response_bytes', 'error',
+        'request_body', 'response_body',
+    )
+
+    def __init__(self, method: str, endpoint: str, request_body: Optional[bytes] = None):
+        self.method = method.upper()
+        self.endpoint = endpoint
+        self.template = endpoint_template(endpoint)
+        self.started = time.monotonic()
+        self.duration: Optional[float] = None
+        self.status: Optional[int] = None
+        self.attempts = 0
+        self.request_bytes = len(request_body or b'')
+        self.response_bytes = 0
+        self.error: Optional[BaseException] = None
+        self.request_body = request_body
+        self.response_body: Optional[bytes] = None
+
+
+class RequestHook:
+    """
+    Base class for request hooks; override the methods you need
+
+    Hooks run on the calling thread or event loop, so keep them cheap.
+    Exceptions raised by hooks are logged and ignored.
+    """
+
+    def before_request(self, call: RequestCall):
+        pass
+
+    def after_response(self, call: RequestCall):
+        pass
+
+    def on_error(self, call: RequestCall):
+        pass
+
+
+_hooks: List[RequestHook] = []
+_configured_hooks: List[RequestHook] = []
+_active_hooks: List[RequestHook] = []
+_hooks_config = None
+_hooks_lock = threading.Lock()
+
+
+def _activate():
+    # Replace rather than mutate, so requests in flight keep a stable list
+    global _active_hooks
+    _active_hooks = _hooks + _configured_hooks
+
+
+def register_hook(hook: RequestHook):
+    """Observe every request made by every client"""
+    with _hooks_lock:
+        if hook not in _hooks:
+            _hooks.append(hook)
+            _activate()
+
+
+def unregister_hook(hook: RequestHook):
+    with _hooks_lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+            _activate()
+
+
+def get_hooks() -> List[RequestHook]:
+    """
+    Get active hooks: registered ones, REQUEST_HOOKS, the metrics collector
+    (METRICS_ENABLED) and the audit logger (AUDIT_LOG)
+    """
+    global _configured_hooks, _hooks_config
+
+    config = (
+        tuple(paystack_settings.REQUEST_HOOKS),
+        paystack_settings.METRICS_ENABLED,
+        paystack_settings.AUDIT_LOG,
+    )
+    if config != _hooks_config:
+        from django.utils.module_loading import import_string
+        from .audit import get_audit_logger
+
+        with _hooks_lock:
+            if config != _hooks_config:
+                configured = [import_string(path)() for path in config[0]]
+                if config[1]:
+                    configured.append(collector)
+                if config[2]:
+                    configured.append(get_audit_logger())
+                _configured_hooks = configured
+                _activate()
+                _hooks_config = config
+    return _active_hooks
+
+
+class _Instrumented:
+    """Runs hooks for one request"""
+
+    def __init__(self, hooks: List[RequestHook], call: RequestCall):
+        self.hooks = hooks
+        self.call = call
+        self._dispatch('before_request')
+
+    def _dispatch(self, name: str):
+        for hook in self.hooks:
+            try:
+                getattr(hook, name)(self.call)
+            except Exception as e:
+                logger.warning(f"Paystack request hook {type(hook).__name__}.{name} failed: {str(e)}")
+
+    def attempt(self):
+        self.call.attempts += 1
+
+    def response(self, response):
+        self.call.status = response.status_code
+        self.call.response_body = response.content
+        self.call.response_bytes = len(response.content or b'')
+
+    def finish(self):
+        self.call.duration = time.monotonic() - self.call.started
+        self._dispatch('after_response')
+
+    def fail(self, error: BaseException):
+        self.call.duration = time.monotonic() - self.call.started
+        self.call.error = error
+        if self.call.status is None:
+            self.call.status = getattr(error, 'status_code', None)
+        self._dispatch('on_error')
+
+
+class _NotInstrumented:
+    """Stand-in when no hooks are registered"""
+
+    def attempt(self):
+        pass
+
+    def response(self, response):
+        pass
+
+    def finish(self):
+        pass
+
+    def fail(self, error: BaseException):
+        pass
+
+
+_NOT_INSTRUMENTED = _NotInstrumented()
+
+
+def start(method: str, endpoint: str, body: Optional[bytes] = None):
+    """Begin instrumenting a request"""
+    hooks = get_hooks()
+    if not hooks:
+        return _NOT_INSTRUMENTED
+    return _Instrumented(hooks, RequestCall(method, endpoint, body))
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus model"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+def _labels(**labels) -> str:
+    pairs = ','.join(
+        '%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+        for name, value in labels.items()
+    )
+    return '{%s}' % pairs
+
+
+class MetricsCollector(RequestHook):
+    """
+    Per-endpoint request counters, latency histograms and in-flight gauges
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests: Dict[Tuple[str, str, str], int] = {}
+            self.errors: Dict[Tuple[str, str, str], int] = {}
+            self.retries: Dict[Tuple[str, str], int] = {}
+            self.durations: Dict[Tuple[str, str], Histogram] = {}
+            self.request_bytes: Dict[Tuple[str, str], int] = {}
+            self.response_bytes: Dict[Tuple[str, str], int] = {}
+            self.in_flight = 0
+
+    def before_request(self, call: RequestCall):
+        with self._lock:
+            self.in_flight += 1
+
+    def _record(self, call: RequestCall):
+        key = (call.method, call.template)
+        status = str(call.status) if call.status is not None else 'none'
+        self.requests[key + (status,)] = self.requests.get(key + (status,), 0) + 1
+        if call.attempts > 1:
+            self.retries[key] = self.retries.get(key, 0) + call.attempts - 1
+        histogram = self.durations.get(key)
+        if histogram is None:
+            histogram = self.durations[key] = Histogram(self.buckets)
+        histogram.observe(call.duration)
+        self.request_bytes[key] = self.request_bytes.get(key, 0) + call.request_bytes
+        self.response_bytes[key] = self.response_bytes.get(key, 0) + call.response_bytes
+        self.in_flight -= 1
+
+    def after_response(self, call: RequestCall):
+        with self._lock:
+            self._record(call)
+
+    def on_error(self, call: RequestCall):
+        with self._lock:
+            self._record(call)
+            key = (call.method, call.template, type(call.error).__name__)
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    @staticmethod
+    def _pool_stats() -> List[Dict[str, int]]:
+        from .registry import registered_clients
+
+        return [client.pool_stats() for client in registered_clients()]
+
+    def render(self) -> str:
+        """Export metrics in Prometheus text exposition format"""
+        lines = []
+
+        def header(name, kind, help_text):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+
+        with self._lock:
+            header('paystack_requests_total', 'counter', 'Paystack API requests by final status')
+            for (method, template, status), value in sorted(self.requests.items()):
+                lines.append(f'paystack_requests_total{_labels(method=method, endpoint=template, status=status)} {value}')
+
+            header('paystack_request_errors_total', 'counter', 'Paystack API requests that raised')
+            for (method, template, error), value in sorted(self.errors.items()):
+                lines.append(f'paystack_request_errors_total{_labels(method=method, endpoint=template, error=error)} {value}')
+
+            header('paystack_request_retries_total', 'counter', 'Retried attempts')
+            for (method, template), value in sorted(self.retries.items()):
+                lines.append(f'paystack_request_retries_total{_labels(method=method, endpoint=template)} {value}')
+
+            header('paystack_request_duration_seconds', 'histogram', 'Request duration including retries')
+            for (method, template), histogram in sorted(self.durations.items()):
+                for bound, value in zip(histogram.buckets, histogram.counts):
+                    labels = _labels(method=method, endpoint=template, le=bound)
+                    lines.append(f'paystack_request_duration_seconds_bucket{labels} {value}')
+                labels = _labels(method=method, endpoint=template, le='+Inf')
+                lines.append(f'paystack_request_duration_seconds_bucket{labels} {histogram.count}')
+                labels = _labels(method=method, endpoint=template)
+                lines.append(f'paystack_request_duration_seconds_sum{labels} {histogram.sum}')
+                lines.append(f'paystack_request_duration_seconds_count{labels} {histogram.count}')
+
+            header('paystack_request_bytes_total', 'counter', 'Request body bytes sent')
+            for (method, template), value in sorted(self.request_bytes.items()):
+                lines.append(f'paystack_request_bytes_total{_labels(method=method, endpoint=template)} {value}')
+
+            header('paystack_response_bytes_total', 'counter', 'Response body bytes received')
+            for (method, template), value in sorted(self.response_bytes.items()):
+                lines.append(f'paystack_response_bytes_total{_labels(method=method, endpoint=template)} {value}')
+
+            header('paystack_requests_in_flight', 'gauge', 'Requests currently in progress')
+            lines.append(f'paystack_requests_in_flight {self.in_flight}')
+
+        pools = self._pool_stats()
+        for name, help_text in (
+            ('in_use', 'Pooled connections checked out by shared clients'),
+            ('maxsize', 'Pooled connections kept per host by shared clients'),
+        ):
+            header(f'paystack_pool_connections_{name}', 'gauge', help_text)
+            for index, stats in enumerate(pools):
+                if name in stats:
+                    lines.append(f'paystack_pool_connections_{name}{_labels(client=index)} {stats[name]}')
+
+        return '\n'.join(lines) + '\n'
+
+
+collector = MetricsCollector()
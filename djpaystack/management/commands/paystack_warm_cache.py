@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand
+from djpaystack.registry import get_client
+from djpaystack.response_cache import response_cache
+
+
+class Command(BaseCommand):
+    help = 'Fill the Paystack response cache with reference data'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--country',
+            action='append',
+            dest='countries',
+            help='Country to cache banks for (repeatable, default: nigeria)',
+        )
+        parser.add_argument(
+            '--plans',
+            action='store_true',
+            help='Also cache every plan',
+        )
+        parser.add_argument(
+            '--products',
+            action='store_true',
+            help='Also cache every product',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Refetch entries that are still fresh',
+        )
+
+    def handle(self, *args, **options):
+        client = get_client()
+
+        if options['force']:
+            # Only the namespaces this command fills again
+            namespaces = ['bank', 'country', 'dedicated_account_provider']
+            if options['plans']:
+                namespaces.append('plan')
+            if options['products']:
+                namespaces.append('product')
+            response_cache.invalidate(*namespaces)
+
+        for country in options['countries'] or ['nigeria']:
+            banks = client.miscellaneous.list_banks(country=country)
+            self.stdout.write(f"Cached {len(banks.get('data', []))} banks for {country}")
+
+        countries = client.miscellaneous.list_countries()
+        self.stdout.write(f"Cached {len(countries.get('data', []))} countries")
+
+        client.dedicated_accounts.available_providers()
+        self.stdout.write('Cached dedicated account providers')
+
+        if options['plans']:
+            cached = 0
+            for plan in client.plans.list.iter_items(per_page=100):
+                client.plans.fetch(plan['plan_code'])
+                cached += 1
+            self.stdout.write(f'Cached {cached} plans')
+
+        if options['products']:
+            cached = 0
+            for product in client.products.list.iter_items(per_page=100):
+                client.products.fetch(str(product['id']))
+                cached += 1
+            self.stdout.write(f'Cached {cached} products')
+
+        stats = response_cache.stats.snapshot()
+        self.stdout.write(self.style.SUCCESS(
+            'Cache warmed ({})'.format(', '.join(f'{k}={v}' for k, v in stats.items()))))
@@ -0,0 +1,90 @@
+import signal
+import threading
+import time
+from django.core.management.base import BaseCommand
+from djpaystack.webhooks.worker import WebhookWorker
+
+
+class Command(BaseCommand):
+    help = 'Process stored Paystack webhook events (WEBHOOK_FAST_ACK); run one or more per node'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='Events claimed per batch (default: WEBHOOK_WORKER_BATCH_SIZE)',
+        )
+        parser.add_argument(
+            '--lease',
+            type=float,
+            help='Seconds a claimed batch is held (default: WEBHOOK_WORKER_LEASE)',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait when no events are pending (default: 1)',
+        )
+        parser.add_argument(
+            '--report-interval',
+            type=float,
+            default=60.0,
+            help='Seconds between throughput and lag reports (default: 60)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process the pending backlog and exit',
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='Clear errors of failed events so they are processed again',
+        )
+
+    def handle(self, *args, **options):
+        worker = WebhookWorker(batch_size=options['batch_size'], lease_seconds=options['lease'])
+
+        if options['retry_failed']:
+            from djpaystack.models import PaystackWebhookEvent
+            retried = PaystackWebhookEvent.objects.filter(
+                processed=False, processing_error__isnull=False,
+            ).update(processing_error=None)
+            self.stdout.write(f"Retrying {retried} failed webhook events")
+
+        started = time.monotonic()
+        if options['once']:
+            while worker.run_once():
+                pass
+            self._report(worker, time.monotonic() - started, worker.stats.snapshot())
+            return
+
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop.set())
+
+        self.stdout.write(f"Webhook worker {worker.worker_id} started")
+        last = {'at': started, 'stats': worker.stats.snapshot()}
+
+        def on_batch(claimed):
+            now = time.monotonic()
+            if now - last['at'] >= options['report_interval']:
+                stats = worker.stats.snapshot()
+                self._report(worker, now - last['at'], stats, last['stats'])
+                last.update(at=now, stats=stats)
+
+        worker.run(interval=options['interval'], stop=stop, on_batch=on_batch)
+        self._report(worker, time.monotonic() - started, worker.stats.snapshot())
+        self.stdout.write(f"Webhook worker {worker.worker_id} stopped")
+
+    def _report(self, worker, seconds, stats, previous=None):
+        """Write throughput since ``previous``, the last batch's lag and the backlog"""
+        previous = previous or dict.fromkeys(stats, 0)
+        processed = stats['processed'] - previous['processed']
+        failed = stats['failed'] - previous['failed']
+        rate = (processed + failed) / seconds if seconds > 0 else 0.0
+        pending, oldest = worker.backlog()
+        self.stdout.write(
+            f"processed={processed} failed={failed} rate={rate:.1f}/s "
+            f"lag={worker.lag:.1f}s pending={pending} oldest={oldest:.1f}s"
+        )
@@ -1,6 +1,8 @@
 
+from datetime import timedelta
 from django.core.management.base import BaseCommand
-from djpaystack.client import PaystackClient
+from django.utils import timezone
+from djpaystack.registry import get_client
 from djpaystack.models import PaystackTransaction, PaystackCustomer
 
 
@@ -24,13 +26,19 @@ class Command(BaseCommand):
             default=30,
             help='Number of days to sync (default: 30)',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of date windows fetched concurrently (default: 4)',
+        )
 
     def handle(self, *args, **options):
-        client = PaystackClient()
+        client = get_client()
 
         if options['transactions']:
             self.stdout.write('Syncing transactions...')
-            self.sync_transactions(client, options['days'])
+            self.sync_transactions(client, options['days'], options['workers'])
 
         if options['customers']:
             self.stdout.write('Syncing customers...')
@@ -38,10 +46,16 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS('Sync completed successfully'))
 
-    def sync_transactions(self, client, days):
+    def sync_transactions(self, client, days, workers):
         """Sync transactions from Paystack"""
-        response = client.transactions.list(per_page=100)
-        transactions = response.get('data', [])
+        to_date = timezone.now()
+        transactions = client.transactions.list.iter_sharded(
+            per_page=100,
+            from_date=to_date - timedelta(days=days),
+            to_date=to_date,
+            window='day',
+            workers=workers,
+        )
 
         synced = 0
         for txn in transactions:
@@ -61,8 +75,8 @@ class Command(BaseCommand):
 
     def sync_customers(self, client):
         """Sync customers from Paystack"""
-        response = client.customers.list(per_page=100)
-        customers = response.get('data', [])
+        customers = client.customers.list.iter_items(
+            per_page=100, progress=self._report_progress)
 
         synced = 0
         for cust in customers:
@@ -78,3 +92,7 @@ class Command(BaseCommand):
             synced += 1
 
         self.stdout.write(f'Synced {synced} customers')
+
+    def _report_progress(self, page, page_count):
+        """Report pagination progress"""
+        self.stdout.write(f'  Page {page} of {page_count or "?"}')
@@ -1,6 +1,6 @@
 
 from django.core.management.base import BaseCommand
-from djpaystack.client import PaystackClient
+from djpaystack.registry import get_client
 from djpaystack.settings import paystack_settings
 
 
@@ -19,7 +19,7 @@ class Command(BaseCommand):
 
         # Test API connection
         try:
-            client = PaystackClient()
+            client = get_client()
             response = client.miscellaneous.list_banks()
 
             if response.get('status'):
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:13
+
+import djpaystack.codec
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djpaystack', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='paystackcustomer',
+            name='metadata',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystackcustomer',
+            name='raw_response',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystackplan',
+            name='metadata',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystackplan',
+            name='raw_response',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystacksubscription',
+            name='metadata',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystacksubscription',
+            name='raw_response',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystacktransaction',
+            name='fees_split',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystacktransaction',
+            name='metadata',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystacktransaction',
+            name='raw_response',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystacktransfer',
+            name='metadata',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystacktransfer',
+            name='raw_response',
+            field=models.JSONField(blank=True, decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder, null=True),
+        ),
+        migrations.AlterField(
+            model_name='paystackwebhookevent',
+            name='data',
+            field=models.JSONField(decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:18
+
+import djpaystack.codec
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djpaystack', '0002_json_codec'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaystackCardBin',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('bin', models.CharField(db_index=True, max_length=8, unique=True)),
+                ('brand', models.CharField(blank=True, max_length=50, null=True)),
+                ('card_type', models.CharField(blank=True, max_length=20, null=True)),
+                ('bank', models.CharField(blank=True, max_length=255, null=True)),
+                ('country_code', models.CharField(blank=True, max_length=2, null=True)),
+                ('raw_response', models.JSONField(decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder)),
+            ],
+            options={
+                'ordering': ['bin'],
+            },
+        ),
+    ]
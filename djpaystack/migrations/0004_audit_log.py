@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:30
+
+import djpaystack.codec
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djpaystack', '0003_card_bin'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaystackAuditLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('method', models.CharField(max_length=10)),
+                ('endpoint', models.CharField(db_index=True, max_length=255)),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('duration_ms', models.PositiveIntegerField(blank=True, null=True)),
+                ('attempts', models.PositiveSmallIntegerField(default=1)),
+                ('error', models.TextField(blank=True)),
+                ('record', models.JSONField(decoder=djpaystack.codec.PaystackJSONDecoder, encoder=djpaystack.codec.PaystackJSONEncoder)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['created_at'], name='djpaystack__created_f1607b_idx'), models.Index(fields=['status_code'], name='djpaystack__status__7aa6f3_idx')],
+            },
+        ),
+    ]
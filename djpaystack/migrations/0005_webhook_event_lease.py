@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djpaystack', '0004_audit_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paystackwebhookevent',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='paystackwebhookevent',
+            name='lease_owner',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='paystackwebhookevent',
+            index=models.Index(fields=['processed', 'created_at'], name='djpaystack__process_933abb_idx'),
+        ),
+    ]
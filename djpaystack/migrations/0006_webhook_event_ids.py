@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+def rekey_webhook_events(apps, schema_editor):
+    """Move events stored under the old reference-first ID to webhook_event_id"""
+    from djpaystack.webhooks.events import webhook_event_id
+
+    PaystackWebhookEvent = apps.get_model('djpaystack', 'PaystackWebhookEvent')
+    events = PaystackWebhookEvent.objects.only('pk', 'event_type', 'event_id', 'data')
+    for event in events.iterator(chunk_size=1000):
+        payload = event.data if isinstance(event.data, dict) else {}
+        event_id = webhook_event_id(event.event_type, payload.get('data') or {})
+        if event_id == event.event_id:
+            continue
+        # Two old rows can map to one ID; the first keeps it
+        if PaystackWebhookEvent.objects.filter(event_id=event_id).exists():
+            continue
+        PaystackWebhookEvent.objects.filter(pk=event.pk).update(event_id=event_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djpaystack', '0005_webhook_event_lease'),
+    ]
+
+    operations = [
+        migrations.RunPython(rekey_webhook_events, migrations.RunPython.noop),
+    ]
@@ -4,6 +4,8 @@ Django models for Paystack data
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from .codec import PaystackJSONEncoder, PaystackJSONDecoder
+
 
 class PaystackBaseModel(models.Model):
     """Base model for Paystack entities"""
@@ -43,10 +45,13 @@ class PaystackTransaction(PaystackBaseModel):
     ip_address = models.GenericIPAddressField(null=True, blank=True)
 
     fees = models.BigIntegerField(null=True, blank=True)
-    fees_split = models.JSONField(null=True, blank=True)
+    fees_split = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
 
-    metadata = models.JSONField(null=True, blank=True)
-    raw_response = models.JSONField(null=True, blank=True)
+    metadata = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
+    raw_response = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
 
     class Meta:
         ordering = ['-created_at']
@@ -72,8 +77,10 @@ class PaystackCustomer(PaystackBaseModel):
 
     risk_action = models.CharField(max_length=20, default='default')
 
-    metadata = models.JSONField(null=True, blank=True)
-    raw_response = models.JSONField(null=True, blank=True)
+    metadata = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
+    raw_response = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
 
     class Meta:
         ordering = ['-created_at']
@@ -88,17 +95,22 @@ class PaystackWebhookEvent(PaystackBaseModel):
     event_type = models.CharField(max_length=100, db_index=True)
     event_id = models.CharField(max_length=255, unique=True, db_index=True)
 
-    data = models.JSONField()
+    data = models.JSONField(encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
     processed = models.BooleanField(default=False, db_index=True)
     processing_error = models.TextField(null=True, blank=True)
 
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(null=True, blank=True)
 
+    # Claim held by a process_paystack_webhooks worker
+    lease_owner = models.CharField(max_length=255, blank=True, default='')
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['event_type', 'processed']),
+            models.Index(fields=['processed', 'created_at']),
         ]
 
     def __str__(self):
@@ -131,8 +143,10 @@ class PaystackSubscription(PaystackBaseModel):
     authorization_code = models.CharField(
         max_length=255, null=True, blank=True)
 
-    metadata = models.JSONField(null=True, blank=True)
-    raw_response = models.JSONField(null=True, blank=True)
+    metadata = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
+    raw_response = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
 
     class Meta:
         ordering = ['-created_at']
@@ -166,8 +180,10 @@ class PaystackPlan(PaystackBaseModel):
 
     is_active = models.BooleanField(default=True)
 
-    metadata = models.JSONField(null=True, blank=True)
-    raw_response = models.JSONField(null=True, blank=True)
+    metadata = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
+    raw_response = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
 
     class Meta:
         ordering = ['-created_at']
@@ -201,11 +217,54 @@ class PaystackTransfer(PaystackBaseModel):
 
     transferred_at = models.DateTimeField(null=True, blank=True)
 
-    metadata = models.JSONField(null=True, blank=True)
-    raw_response = models.JSONField(null=True, blank=True)
+    metadata = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
+    raw_response = models.JSONField(
+        null=True, blank=True, encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
 
     class Meta:
         ordering = ['-created_at']
 
     def __str__(self):
         return f"{self.transfer_code} - {self.status}"
+
+
+class PaystackCardBin(PaystackBaseModel):
+    """Cached card BIN resolution (see djpaystack.bin_cache)"""
+
+    bin = models.CharField(max_length=8, unique=True, db_index=True)
+    brand = models.CharField(max_length=50, null=True, blank=True)
+    card_type = models.CharField(max_length=20, null=True, blank=True)
+    bank = models.CharField(max_length=255, null=True, blank=True)
+    country_code = models.CharField(max_length=2, null=True, blank=True)
+
+    raw_response = models.JSONField(encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
+
+    class Meta:
+        ordering = ['bin']
+
+    def __str__(self):
+        return f"{self.bin} - {self.brand} {self.card_type}"
+
+
+class PaystackAuditLog(PaystackBaseModel):
+    """Redacted record of a Paystack API call (see djpaystack.audit)"""
+
+    method = models.CharField(max_length=10)
+    endpoint = models.CharField(max_length=255, db_index=True)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    duration_ms = models.PositiveIntegerField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=1)
+    error = models.TextField(blank=True)
+
+    record = models.JSONField(encoder=PaystackJSONEncoder, decoder=PaystackJSONDecoder)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+            models.Index(fields=['status_code']),
+        ]
+
+    def __str__(self):
+        return f"{self.method} {self.endpoint} - {self.status_code}"
@@ -0,0 +1,282 @@
+"""
+Client-side rate limiting for outbound Paystack requests
+
+Limits are configured per endpoint family::
+
+    PAYSTACK = {
+        'RATE_LIMIT': 50,  # default requests per second
+        'RATE_LIMITS': {'transaction/verify': 20, 'transfer': 5},
+        'RATE_LIMIT_BACKEND': 'cache',  # share limits across processes
+    }
+
+The ``local`` backend keeps a token bucket per family in this process. The
+``cache`` backend counts requests per one-second window (longer for rates
+below one per second) in the Django cache, so every process and node using
+the same cache shares the limit.
+"""
+import asyncio
+import math
+import threading
+import time
+from typing import Dict, Optional
+
+from .deadline import remaining
+from .endpoints import endpoint_family
+from .exceptions import (
+    PaystackConfigurationError,
+    PaystackRateLimitError,
+    PaystackTimeoutError,
+)
+from .settings import paystack_settings
+
+# Sentinel for "use the limiter's configured timeout"
+_DEFAULT_TIMEOUT = object()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, self.rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens if they are available
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds until they will
+            be available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+
+class CacheWindowCounter:
+    """
+    Request counter shared through the Django cache
+
+    Allows ``rate`` requests per one-second window; a rate below one per
+    second gets a window of ``1 / rate`` seconds admitting one request.
+    Relies on the cache's atomic ``add``/``incr`` (Redis, Memcached and
+    locmem are atomic; the file and database backends are best effort).
+    """
+
+    def __init__(self, family: str, rate: float, cache_alias: str = 'default'):
+        self.family = family
+        self.rate = float(rate)
+        self.cache_alias = cache_alias
+        self.window = max(1.0, 1.0 / self.rate)
+        self.allowed = self.rate * self.window
+
+    def try_acquire(self) -> float:
+        """
+        Count a request in the current window if it has room
+
+        Returns:
+            0.0 if the request may proceed, otherwise seconds until the
+            next window opens
+        """
+        from django.core.cache import caches
+
+        cache = caches[self.cache_alias]
+        now = time.time()
+        window = int(now // self.window)
+        key = f'djpaystack:ratelimit:{self.family}:{window}'
+        expires = math.ceil(self.window) + 1
+
+        cache.add(key, 0, timeout=expires)
+        try:
+            count = cache.incr(key)
+        except ValueError:
+            # Key expired between add() and incr()
+            cache.add(key, 1, timeout=expires)
+            count = 1
+
+        if count <= self.allowed:
+            return 0.0
+        return (window + 1) * self.window - now
+
+    async def atry_acquire(self) -> float:
+        """Async counterpart of try_acquire; the cache calls run off the event loop"""
+        from asgiref.sync import sync_to_async
+
+        return await sync_to_async(self.try_acquire, thread_sensitive=False)()
+
+
+class RateLimiter:
+    """
+    Per endpoint family rate limiter
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, float],
+        default: Optional[float] = None,
+        backend: str = 'local',
+        cache_alias: str = 'default',
+        timeout: Optional[float] = 10
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            limits: Requests per second keyed by endpoint family
+            default: Requests per second for families without their own limit
+            backend: 'local' (per process) or 'cache' (shared via Django cache)
+            cache_alias: Django cache alias for the cache backend
+            timeout: Seconds to wait for capacity; 0 fails fast, None waits
+                indefinitely
+        """
+        if backend not in ('local', 'cache'):
+            raise PaystackConfigurationError(
+                f"RATE_LIMIT_BACKEND must be 'local' or 'cache', got {backend!r}")
+
+        self.limits = {family.strip('/'): rate for family, rate in limits.items()}
+        self.default = default
+        self.backend = backend
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+        self._buckets: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, endpoint: str):
+        """Get the bucket limiting an endpoint, or None if it is unlimited"""
+        family = endpoint_family(endpoint, self.limits)
+        rate = self.limits.get(family, self.default)
+        if not rate:
+            return None
+
+        # Families without their own limit share the default bucket
+        key = family if family in self.limits else '*'
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    if self.backend == 'cache':
+                        bucket = CacheWindowCounter(key, rate, self.cache_alias)
+                    else:
+                        bucket = TokenBucket(rate)
+                    self._buckets[key] = bucket
+        return bucket
+
+    def _check_wait(self, endpoint: str, wait: float, deadline: Optional[float]):
+        """Raise if waiting ``wait`` seconds would pass the deadline"""
+        left = remaining()
+        if left is not None and wait >= left:
+            raise PaystackTimeoutError(
+                f"Deadline exceeded waiting for {endpoint_family(endpoint, self.limits)} capacity")
+        if deadline is not None and time.monotonic() + wait > deadline:
+            raise PaystackRateLimitError(
+                f"Client-side rate limit reached for {endpoint_family(endpoint, self.limits)}",
+                retry_after=wait,
+            )
+
+    def _deadline(self, timeout) -> Optional[float]:
+        timeout = self.timeout if timeout is _DEFAULT_TIMEOUT else timeout
+        return None if timeout is None else time.monotonic() + timeout
+
+    def acquire(self, endpoint: str, timeout=_DEFAULT_TIMEOUT):
+        """
+        Wait for capacity to call an endpoint
+
+        Args:
+            endpoint: API endpoint path
+            timeout: Override the limiter timeout (0 fails fast)
+
+        Raises:
+            PaystackRateLimitError: If no capacity is available in time
+        """
+        bucket = self._bucket(endpoint)
+        if bucket is None:
+            return
+
+        deadline = self._deadline(timeout)
+        while True:
+            wait = bucket.try_acquire()
+            if not wait:
+                return
+            self._check_wait(endpoint, wait, deadline)
+            time.sleep(wait)
+
+    async def acquire_async(self, endpoint: str, timeout=_DEFAULT_TIMEOUT):
+        """Async counterpart of acquire that does not block the event loop"""
+        bucket = self._bucket(endpoint)
+        if bucket is None:
+            return
+
+        deadline = self._deadline(timeout)
+        while True:
+            # Cache backend calls are network I/O; the local bucket is not
+            if isinstance(bucket, CacheWindowCounter):
+                wait = await bucket.atry_acquire()
+            else:
+                wait = bucket.try_acquire()
+            if not wait:
+                return
+            self._check_wait(endpoint, wait, deadline)
+            await asyncio.sleep(wait)
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_config = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Get the process-wide limiter configured by the RATE_LIMIT* settings
+
+    Returns:
+        RateLimiter, or None if rate limiting is disabled
+    """
+    global _limiter, _limiter_config
+
+    config = (
+        paystack_settings.RATE_LIMIT,
+        tuple(sorted((paystack_settings.RATE_LIMITS or {}).items())),
+        paystack_settings.RATE_LIMIT_BACKEND,
+        paystack_settings.RATE_LIMIT_CACHE,
+        paystack_settings.RATE_LIMIT_TIMEOUT,
+    )
+    if not config[0] and not config[1]:
+        return None
+
+    if config != _limiter_config:
+        with _limiter_lock:
+            if config != _limiter_config:
+                _limiter = RateLimiter(
+                    dict(config[1]),
+                    default=config[0],
+                    backend=config[2],
+                    cache_alias=config[3],
+                    timeout=config[4],
+                )
+                _limiter_config = config
+
+    return _limiter
@@ -0,0 +1,82 @@
+"""
+Process-wide PaystackClient registry
+
+``get_client()`` returns one shared client per secret key and process, so
+connection pools and TLS sessions are reused across calls::
+
+    from djpaystack import get_client
+
+    client = get_client()
+    client.transactions.verify(reference)
+
+Clients are thread-safe to share. The registry is cleared in a forked
+child (sockets inherited from the parent must not be reused) and closes
+its clients at interpreter exit.
+"""
+import atexit
+import os
+import threading
+from typing import Dict, List, Optional
+
+from .client import PaystackClient
+from .settings import paystack_settings
+
+_clients: Dict[str, PaystackClient] = {}
+_lock = threading.Lock()
+_pid = os.getpid()
+
+
+def _check_fork():
+    """Forget clients inherited from a parent process"""
+    global _lock, _pid
+    if _pid != os.getpid():
+        # The lock may have been held by another thread at fork time
+        _lock = threading.Lock()
+        _clients.clear()
+        _pid = os.getpid()
+
+
+def get_client(secret_key: Optional[str] = None) -> PaystackClient:
+    """
+    Get the shared client for a secret key
+
+    Args:
+        secret_key: Paystack secret key (defaults to PAYSTACK['SECRET_KEY'])
+
+    Returns:
+        PaystackClient reused for every call with the same key in this process
+    """
+    _check_fork()
+    secret_key = secret_key or paystack_settings.SECRET_KEY
+
+    client = _clients.get(secret_key)
+    if client is None:
+        with _lock:
+            client = _clients.get(secret_key)
+            if client is None:
+                client = PaystackClient(secret_key=secret_key)
+                _clients[secret_key] = client
+    return client
+
+
+def registered_clients() -> List[PaystackClient]:
+    """Get the clients shared in this process"""
+    _check_fork()
+    return list(_clients.values())
+
+
+def close_clients():
+    """Close and forget every registered client"""
+    _check_fork()
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        client.close()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_check_fork)
+
+atexit.register(close_clients)
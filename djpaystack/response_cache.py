@@ -0,0 +1,508 @@
+"""
+Read-through cache for reference-data endpoints
+
+API methods opt in with the ``cached`` decorator; their GETs are then
+served from a two-tier cache: an in-process LRU in front of the Django
+cache (CACHE_ALIAS). Entries go through three phases:
+
+* fresh for CACHE_TIMEOUT seconds: served from cache
+* stale for a further CACHE_STALE_TIMEOUT seconds: served from cache while
+  one background request refreshes them
+* expired for a further CACHE_STALE_IF_ERROR seconds: refetched, but served
+  if Paystack is unreachable or failing
+
+Methods may also cache "not found"-style 4xx errors for a short
+``negative_timeout``; cached errors are raised again on every hit.
+Concurrent misses for the same key share one upstream request.
+
+The local tier holds encoded entries, decoded on every hit, so callers
+are free to mutate the responses they get back.
+
+Each method belongs to a namespace (``'plan'``, ``'bank'``, ...).
+``invalidate('plan')`` drops a namespace everywhere: the local LRU at once,
+other processes' LRUs within CACHE_LOCAL_TIMEOUT.
+"""
+import asyncio
+import collections
+import contextlib
+import contextvars
+import functools
+import hashlib
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Set, Union
+
+from . import codec
+from .exceptions import (
+    PaystackAPIError,
+    PaystackNetworkError,
+    PaystackRateLimitError,
+)
+from .instrumentation import Counters
+from .settings import paystack_settings
+from .singleflight import SingleFlight
+
+logger = logging.getLogger('djpaystack')
+
+# Statuses that describe the caller's request rather than the integration's
+# access, so they are safe to cache negatively
+NEGATIVE_CACHE_EXCLUDED_STATUSES = frozenset([401, 403, 429])
+
+# Webhook event prefix (text before the first dot) -> namespaces to invalidate.
+# Extend with the CACHE_WEBHOOK_INVALIDATIONS setting.
+WEBHOOK_INVALIDATIONS = {
+    'plan': ('plan',),
+    'product': ('product',),
+}
+
+
+class CachePolicy(NamedTuple):
+    """
+    Cache declaration of an API method
+
+    Timeouts are seconds, or the name of the PAYSTACK setting holding them.
+    """
+    namespace: str
+    timeout: Union[float, str, None] = None
+    negative_timeout: Union[float, str, None] = None
+
+    def fresh_timeout(self) -> float:
+        return _resolve_timeout(self.timeout, paystack_settings.CACHE_TIMEOUT)
+
+    def error_timeout(self) -> Optional[float]:
+        return _resolve_timeout(self.negative_timeout, None)
+
+
+def _resolve_timeout(value, default):
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return getattr(paystack_settings, value)
+    return value
+
+
+# Set while a @cached method runs so BaseAPI._get reads through the cache
+_cache_policy = contextvars.ContextVar('djpaystack_cache_policy', default=None)
+
+
+def current_policy() -> Optional[CachePolicy]:
+    """Get the cache policy of the running API method, if any"""
+    return _cache_policy.get()
+
+
+class CacheStats(Counters):
+    """Thread-safe cache counters"""
+
+    FIELDS = (
+        'local_hits',
+        'shared_hits',
+        'negative_hits',
+        'misses',
+        'stale_served',
+        'stale_if_error',
+        'refreshes',
+        'refresh_errors',
+        'invalidations',
+    )
+
+
+def is_upstream_failure(error: Exception) -> bool:
+    """Check whether an error means Paystack could not answer (vs. rejected the request)"""
+    if isinstance(error, (PaystackNetworkError, PaystackRateLimitError)):
+        return True
+    return isinstance(error, PaystackAPIError) and (error.status_code or 0) >= 500
+
+
+def is_negative_cacheable(error: Exception) -> bool:
+    """Check whether an error is a definite answer about the requested resource"""
+    return (
+        isinstance(error, PaystackAPIError)
+        and error.status_code is not None
+        and 400 <= error.status_code < 500
+        and error.status_code not in NEGATIVE_CACHE_EXCLUDED_STATUSES
+    )
+
+
+class ResponseCache:
+    """
+    Two-tier read-through response cache
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+        self._local: 'collections.OrderedDict[str, tuple]' = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._versions: Dict[str, tuple] = {}
+        self._refreshing = set()
+        # Background refresh tasks, referenced until done so they are not
+        # garbage collected mid-flight
+        self._refresh_tasks: Set['asyncio.Task'] = set()
+        self.flights = SingleFlight()
+
+    # Keys
+
+    def _shared_cache(self):
+        from django.core.cache import caches
+        return caches[paystack_settings.CACHE_ALIAS]
+
+    @staticmethod
+    def _version_key(namespace: str) -> str:
+        return f'djpaystack:cache:{namespace}:version'
+
+    def _version(self, namespace: str, now: float) -> int:
+        """Current namespace version, re-read from the shared tier every CACHE_LOCAL_TIMEOUT"""
+        cached = self._versions.get(namespace)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+        version = self._shared_cache().get(self._version_key(namespace)) or 0
+        self._versions[namespace] = (version, now + paystack_settings.CACHE_LOCAL_TIMEOUT)
+        return version
+
+    @staticmethod
+    def _key(client, namespace: str, version: int, endpoint: str,
+             params: Optional[Dict[str, Any]]) -> str:
+        # Responses differ per integration, so the key includes the secret key
+        digest = hashlib.sha256(codec.dumps(
+            [client.secret_key, endpoint.strip('/'), sorted((params or {}).items())],
+            default=str,
+        )).hexdigest()[:32]
+        return f'djpaystack:cache:{namespace}:{version}:{digest}'
+
+    # Tiers
+
+    def _local_get(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._local.get(key)
+            if item is None:
+                return None
+            encoded, local_expires = item
+            if now >= local_expires:
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+        # Decoded per hit, so callers never share (and mutate) the cached data
+        return codec.loads(encoded)
+
+    def _local_set(self, key: str, entry: Dict[str, Any], now: float):
+        local_expires = min(now + paystack_settings.CACHE_LOCAL_TIMEOUT, entry['expires'])
+        encoded = codec.dumps(entry, default=str)
+        with self._lock:
+            self._local[key] = (encoded, local_expires)
+            self._local.move_to_end(key)
+            while len(self._local) > paystack_settings.CACHE_LOCAL_MAXSIZE:
+                self._local.popitem(last=False)
+
+    def _lookup(self, client, policy: CachePolicy, endpoint: str,
+                params: Optional[Dict[str, Any]]):
+        """Find an entry in either tier; returns (key, entry or None)"""
+        now = time.time()
+        key = self._key(client, policy.namespace, self._version(policy.namespace, now), endpoint, params)
+
+        entry = self._local_get(key, now)
+        if entry is not None:
+            self.stats.incr('local_hits')
+            return key, entry
+
+        entry = self._shared_cache().get(key)
+        if entry is not None:
+            self.stats.incr('shared_hits')
+            self._local_set(key, entry, now)
+        return key, entry
+
+    def _store(self, key: str, policy: CachePolicy, data: Dict[str, Any]):
+        now = time.time()
+        fresh_until = now + policy.fresh_timeout()
+        stale_until = fresh_until + paystack_settings.CACHE_STALE_TIMEOUT
+        expires = stale_until + paystack_settings.CACHE_STALE_IF_ERROR
+        entry = {
+            'data': data,
+            'fresh_until': fresh_until,
+            'stale_until': stale_until,
+            'expires': expires,
+        }
+        self._shared_cache().set(key, entry, timeout=int(expires - now) + 1)
+        self._local_set(key, entry, now)
+
+    def _store_error(self, key: str, policy: CachePolicy, error: PaystackAPIError):
+        """Cache an error response; it is never served stale"""
+        now = time.time()
+        expires = now + policy.error_timeout()
+        entry = {
+            'error': {
+                'message': str(error),
+                'status_code': error.status_code,
+                'response': error.response if isinstance(error.response, dict) else None,
+            },
+            'fresh_until': expires,
+            'stale_until': expires,
+            'expires': expires,
+        }
+        self._shared_cache().set(key, entry, timeout=int(expires - now) + 1)
+        self._local_set(key, entry, now)
+
+    def _serve(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a cached response, or raise a cached error"""
+        error = entry.get('error')
+        if error is not None:
+            self.stats.incr('negative_hits')
+            raise PaystackAPIError(
+                error['message'], status_code=error['status_code'], response=error['response'])
+        return entry['data']
+
+    def _fetch(self, client, key: str, policy: CachePolicy, endpoint: str,
+               params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fetch and cache a response (sync clients)"""
+        try:
+            data = client.get(endpoint, params=params)
+        except PaystackAPIError as e:
+            if policy.negative_timeout is not None and is_negative_cacheable(e):
+                self._store_error(key, policy, e)
+            raise
+        self._store(key, policy, data)
+        return data
+
+    async def _afetch(self, client, key: str, policy: CachePolicy, endpoint: str,
+                      params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fetch and cache a response (async clients)"""
+        from asgiref.sync import sync_to_async
+
+        try:
+            data = await client.get(endpoint, params=params)
+        except PaystackAPIError as e:
+            if policy.negative_timeout is not None and is_negative_cacheable(e):
+                await sync_to_async(self._store_error, thread_sensitive=False)(key, policy, e)
+            raise
+        await sync_to_async(self._store, thread_sensitive=False)(key, policy, data)
+        return data
+
+    # Read-through
+
+    def _claim_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _release_refresh(self, key: str):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def _refresh(self, client, key: str, policy: CachePolicy, endpoint: str,
+                 params: Optional[Dict[str, Any]]):
+        try:
+            self.stats.incr('refreshes')
+            self._store(key, policy, client.get(endpoint, params=params))
+        except Exception as e:
+            self.stats.incr('refresh_errors')
+            logger.warning(f"Paystack cache refresh failed for {endpoint}: {str(e)}")
+        finally:
+            self._release_refresh(key)
+
+    def get(self, client, policy: CachePolicy, endpoint: str,
+            params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Read a GET response through the cache
+
+        Args:
+            client: PaystackClient making the request on a miss
+            policy: Cache policy of the calling API method
+            endpoint: API endpoint path
+            params: URL query parameters
+
+        Returns:
+            Response data dictionary
+        """
+        if client.is_async:
+            return self.aget(client, policy, endpoint, params)
+
+        key, entry = self._lookup(client, policy, endpoint, params)
+        now = time.time()
+
+        if entry is not None and now < entry['fresh_until']:
+            return self._serve(entry)
+
+        if entry is not None and now < entry['stale_until']:
+            self.stats.incr('stale_served')
+            if self._claim_refresh(key):
+                threading.Thread(
+                    target=self._refresh,
+                    args=(client, key, policy, endpoint, params),
+                    name='djpaystack-cache-refresh',
+                    daemon=True,
+                ).start()
+            return entry['data']
+
+        self.stats.incr('misses')
+        try:
+            return self.flights.do(
+                key, lambda: self._fetch(client, key, policy, endpoint, params))
+        except Exception as e:
+            if entry is not None and is_upstream_failure(e):
+                self.stats.incr('stale_if_error')
+                logger.warning(f"Serving stale {endpoint} after Paystack error: {str(e)}")
+                return entry['data']
+            raise
+
+    async def _arefresh(self, client, key: str, policy: CachePolicy, endpoint: str,
+                        params: Optional[Dict[str, Any]]):
+        from asgiref.sync import sync_to_async
+
+        try:
+            self.stats.incr('refreshes')
+            data = await client.get(endpoint, params=params)
+            await sync_to_async(self._store, thread_sensitive=False)(key, policy, data)
+        except Exception as e:
+            self.stats.incr('refresh_errors')
+            logger.warning(f"Paystack cache refresh failed for {endpoint}: {str(e)}")
+        finally:
+            self._release_refresh(key)
+
+    async def aget(self, client, policy: CachePolicy, endpoint: str,
+                   params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Async counterpart of get; Django cache calls run off the event loop"""
+        from asgiref.sync import sync_to_async
+
+        key, entry = await sync_to_async(self._lookup, thread_sensitive=False)(
+            client, policy, endpoint, params)
+        now = time.time()
+
+        if entry is not None and now < entry['fresh_until']:
+            return self._serve(entry)
+
+        if entry is not None and now < entry['stale_until']:
+            self.stats.incr('stale_served')
+            if self._claim_refresh(key):
+                task = asyncio.ensure_future(self._arefresh(client, key, policy, endpoint, params))
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            return entry['data']
+
+        self.stats.incr('misses')
+        try:
+            return await self.flights.ado(
+                key, lambda: self._afetch(client, key, policy, endpoint, params))
+        except Exception as e:
+            if entry is not None and is_upstream_failure(e):
+                self.stats.incr('stale_if_error')
+                logger.warning(f"Serving stale {endpoint} after Paystack error: {str(e)}")
+                return entry['data']
+            raise
+
+    # Invalidation
+
+    def invalidate(self, *namespaces: str):
+        """Drop every cached response in the given namespaces"""
+        cache = self._shared_cache()
+        for namespace in namespaces:
+            version_key = self._version_key(namespace)
+            cache.add(version_key, 0, timeout=None)
+            try:
+                version = cache.incr(version_key)
+            except ValueError:
+                version = 1
+                cache.set(version_key, version, timeout=None)
+            self._versions[namespace] = (version, time.time() + paystack_settings.CACHE_LOCAL_TIMEOUT)
+
+            prefix = f'djpaystack:cache:{namespace}:'
+            with self._lock:
+                for key in [k for k in self._local if k.startswith(prefix)]:
+                    del self._local[key]
+            self.stats.incr('invalidations')
+
+    def clear_local(self):
+        """Empty the in-process tier"""
+        with self._lock:
+            self._local.clear()
+            self._versions.clear()
+
+
+response_cache = ResponseCache()
+
+
+def invalidate(*namespaces: str):
+    """Drop every cached response in the given namespaces"""
+    response_cache.invalidate(*namespaces)
+
+
+def invalidate_for_event(event_type: str):
+    """Invalidate the namespaces a webhook event affects"""
+    mapping = {**WEBHOOK_INVALIDATIONS, **paystack_settings.CACHE_WEBHOOK_INVALIDATIONS}
+    namespaces = mapping.get(event_type.split('.', 1)[0], ())
+    if namespaces:
+        response_cache.invalidate(*namespaces)
+
+
+@contextlib.contextmanager
+def use_policy(policy: Optional[CachePolicy]):
+    """Serve GETs made inside the block through the cache with ``policy``"""
+    token = _cache_policy.set(policy)
+    try:
+        yield
+    finally:
+        _cache_policy.reset(token)
+
+
+async def _with_policy(policy: CachePolicy, awaitable):
+    with use_policy(policy):
+        return await awaitable
+
+
+def cached(namespace: str, timeout: Union[float, str, None] = None,
+           negative_timeout: Union[float, str, None] = None):
+    """
+    Serve an API method's GET requests through the response cache
+
+    Args:
+        namespace: Cache namespace, used for invalidation
+        timeout: Freshness in seconds, or a setting name (defaults to
+            CACHE_TIMEOUT)
+        negative_timeout: Seconds, or a setting name, to cache 4xx errors
+            for (None to never cache errors)
+    """
+    policy = CachePolicy(namespace, timeout, negative_timeout)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not paystack_settings.CACHE_ENABLED:
+                return func(self, *args, **kwargs)
+
+            with use_policy(policy):
+                result = func(self, *args, **kwargs)
+
+            if inspect.isawaitable(result):
+                # Async clients: pages fetched later must still see the policy
+                return _with_policy(policy, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def invalidates(*namespaces: str):
+    """
+    Invalidate cache namespaces after a successful write
+
+    Args:
+        *namespaces: Namespaces the write affects
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            result = func(self, *args, **kwargs)
+            if inspect.isawaitable(result):
+                return _invalidate_after(result, namespaces)
+            response_cache.invalidate(*namespaces)
+            return result
+        return wrapper
+    return decorator
+
+
+async def _invalidate_after(awaitable, namespaces: Iterable[str]):
+    from asgiref.sync import sync_to_async
+
+    result = await awaitable
+    await sync_to_async(response_cache.invalidate, thread_sensitive=False)(*namespaces)
+    return result
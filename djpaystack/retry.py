@@ -0,0 +1,236 @@
+"""
+Retry policy for outbound Paystack requests
+"""
+import random
+import threading
+import time
+from typing import Dict, Any, Optional, Iterable
+
+from . import deadline as context_deadline
+from .instrumentation import Counters
+from .settings import paystack_settings
+
+# Methods that are safe to repeat by HTTP semantics
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+# Statuses worth retrying
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# POST endpoints where Paystack rejects a repeated client-supplied reference,
+# so a retried POST cannot create a second charge or transfer
+REFERENCE_IDEMPOTENT_ENDPOINTS = frozenset([
+    'transaction/initialize',
+    'transaction/charge_authorization',
+    'transaction/partial_debit',
+    'transfer',
+    'charge',
+])
+
+
+class RetryStats(Counters):
+    """Thread-safe retry counters"""
+
+    FIELDS = (
+        'requests',
+        'retries',
+        'gave_up',
+        'budget_exhausted',
+        'deadline_exceeded',
+        'unsafe_not_retried',
+    )
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of request volume
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one,
+    so sustained retries cannot exceed ``ratio`` of traffic. ``min_tokens``
+    keeps a small allowance for low-traffic processes.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.max_tokens = max(max_tokens, min_tokens)
+        self._tokens = float(min_tokens)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a retry token; False when the budget is exhausted"""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried
+
+    Subclass and pass an instance as ``PaystackClient(retry_policy=...)``
+    to customise retry behaviour.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        deadline: Optional[float] = 30.0,
+        budget: Optional[RetryBudget] = None,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        safe_post_endpoints: Iterable[str] = (),
+    ):
+        """
+        Initialize retry policy
+
+        Args:
+            max_retries: Maximum retries per request
+            base_delay: Minimum delay between attempts in seconds
+            max_delay: Maximum delay between attempts in seconds
+            deadline: Total seconds a request may spend including retries
+            budget: Shared retry budget (None for unlimited)
+            retry_statuses: HTTP statuses that trigger a retry
+            safe_post_endpoints: POST endpoints that are safe to repeat
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.budget = budget
+        self.retry_statuses = frozenset(retry_statuses)
+        self.safe_post_endpoints = frozenset(e.strip('/') for e in safe_post_endpoints)
+        self.stats = RetryStats()
+
+    @classmethod
+    def from_settings(cls) -> 'RetryPolicy':
+        """Build the default policy from PAYSTACK settings"""
+        ratio = paystack_settings.RETRY_BUDGET_RATIO
+        return cls(
+            max_retries=paystack_settings.MAX_RETRIES,
+            base_delay=paystack_settings.RETRY_BACKOFF_BASE,
+            max_delay=paystack_settings.RETRY_BACKOFF_MAX,
+            deadline=paystack_settings.RETRY_DEADLINE,
+            budget=RetryBudget(ratio=ratio) if ratio is not None else None,
+            safe_post_endpoints=paystack_settings.RETRY_SAFE_POST_ENDPOINTS,
+        )
+
+    def is_retry_safe(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether repeating a request cannot duplicate its side effects
+
+        An Idempotency-Key header alone does not make a POST safe: Paystack
+        does not document honouring it. POSTs are retried only on endpoints
+        that reject a repeated ``reference``, or on endpoints opted in with
+        ``safe_post_endpoints`` (RETRY_SAFE_POST_ENDPOINTS).
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            data: Request body
+            idempotency_key: Idempotency key sent with the request
+
+        Returns:
+            True if the request may be retried after it reached Paystack
+        """
+        if method.upper() in IDEMPOTENT_METHODS:
+            return True
+
+        endpoint = endpoint.strip('/')
+        if endpoint in self.safe_post_endpoints:
+            return True
+
+        return endpoint in REFERENCE_IDEMPOTENT_ENDPOINTS and bool((data or {}).get('reference'))
+
+    def begin(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None,
+              idempotency_key: Optional[str] = None) -> 'RetryState':
+        """Start tracking one logical request"""
+        self.stats.incr('requests')
+        if self.budget:
+            self.budget.deposit()
+        return RetryState(self, self.is_retry_safe(method, endpoint, data, idempotency_key))
+
+    def backoff(self, previous_delay: float) -> float:
+        """Decorrelated jitter: random delay between base and 3x the previous delay"""
+        upper = max(self.base_delay, previous_delay * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+
+class RetryState:
+    """Retry bookkeeping for a single logical request"""
+
+    def __init__(self, policy: RetryPolicy, retry_safe: bool):
+        self.policy = policy
+        self.retry_safe = retry_safe
+        self.attempts = 1
+        self.started = time.monotonic()
+        self._delay = 0.0
+
+    def next_delay(
+        self,
+        status_code: Optional[int] = None,
+        request_sent: bool = True,
+        retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt
+
+        Args:
+            status_code: Response status, or None for a network error
+            request_sent: False if the request provably never reached Paystack
+            retry_after: Value of the Retry-After response header
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        policy = self.policy
+        stats = policy.stats
+
+        if status_code is not None and status_code not in policy.retry_statuses:
+            return None
+
+        if self.attempts > policy.max_retries:
+            stats.incr('gave_up')
+            return None
+
+        if request_sent and not self.retry_safe:
+            stats.incr('unsafe_not_retried')
+            return None
+
+        delay = policy.backoff(self._delay)
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+
+        if policy.deadline is not None and \
+                time.monotonic() - self.started + delay > policy.deadline:
+            stats.incr('deadline_exceeded')
+            return None
+
+        # No retry if waiting would use up the paystack_deadline() budget
+        left = context_deadline.remaining()
+        if left is not None and delay >= left:
+            stats.incr('deadline_exceeded')
+            return None
+
+        if policy.budget and not policy.budget.withdraw():
+            stats.incr('budget_exhausted')
+            return None
+
+        stats.incr('retries')
+        self.attempts += 1
+        self._delay = delay
+        return delay
@@ -1,9 +1,152 @@
 """
 Configuration settings for paystack-django
+
+``settings.PAYSTACK`` is merged over DEFAULTS, validated and compiled once
+into a frozen CompiledSettings snapshot, with derived values (auth header,
+parsed webhook networks, timeout profiles) worked out up front. Its values
+are installed as plain attributes of ``paystack_settings``, so reads on
+the request and webhook paths are ordinary attribute loads. The snapshot
+is rebuilt when Django's ``setting_changed`` signal reports a new PAYSTACK
+(e.g. under ``override_settings``) or on ``paystack_settings.reload()``.
 """
+import ipaddress
+import numbers
+import threading
+from typing import Any, Dict, Optional, Tuple
+
 from django.conf import settings
+from django.core.signals import setting_changed
+
 from .exceptions import PaystackConfigurationError
 
+# Values checked when the settings are compiled
+_NON_NEGATIVE = (
+    'TIMEOUT', 'MAX_RETRIES', 'RETRY_BACKOFF_BASE', 'RETRY_BACKOFF_MAX', 'POOL_CONNECTIONS',
+    'POOL_MAXSIZE', 'CACHE_TIMEOUT', 'CACHE_STALE_TIMEOUT', 'CACHE_STALE_IF_ERROR',
+    'CACHE_LOCAL_TIMEOUT', 'CACHE_LOCAL_MAXSIZE', 'ACCOUNT_RESOLVE_CACHE_TIMEOUT',
+    'ACCOUNT_RESOLVE_NEGATIVE_TIMEOUT', 'BIN_CACHE_REFRESH_AFTER', 'BIN_CACHE_MAXSIZE',
+    'AUDIT_LOG_MAX_BYTES', 'AUDIT_LOG_BACKUP_COUNT', 'AUDIT_MAX_BODY_BYTES', 'AUDIT_QUEUE_SIZE',
+    'RATE_LIMIT_TIMEOUT', 'CIRCUIT_BREAKER_FAILURE_THRESHOLD', 'CIRCUIT_BREAKER_RECOVERY_TIMEOUT',
+    'HEDGE_DEFAULT_DELAY', 'HEDGE_MAX_WORKERS', 'ASYNC_MAX_CONNECTIONS',
+    'ASYNC_MAX_KEEPALIVE_CONNECTIONS', 'WEBHOOK_EXECUTOR_WORKERS',
+    'WEBHOOK_WORKER_BATCH_SIZE', 'WEBHOOK_WORKER_LEASE',
+)
+_OPTIONAL_NON_NEGATIVE = ('CONNECT_TIMEOUT', 'RETRY_DEADLINE', 'RETRY_BUDGET_RATIO', 'RATE_LIMIT')
+_FRACTIONS = ('AUDIT_SAMPLE_RATE', 'HEDGE_BUDGET_RATIO')
+_CHOICES = {
+    'JSON_CODEC': ('auto', 'orjson', 'ujson', 'json'),
+    'RATE_LIMIT_BACKEND': ('local', 'cache'),
+    'AUDIT_LOG': (None, 'file', 'db'),
+}
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def _compile_timeouts(profiles) -> Dict[str, Tuple[Optional[float], float]]:
+    """Normalise TIMEOUTS to ``{family: (connect or None, read)}``"""
+    compiled = {}
+    for family, profile in profiles.items():
+        if isinstance(profile, (list, tuple)) and len(profile) == 2 \
+                and all(_is_number(part) for part in profile):
+            compiled[family] = (profile[0], profile[1])
+        elif _is_number(profile):
+            compiled[family] = (None, profile)
+        else:
+            raise PaystackConfigurationError(
+                f"PAYSTACK['TIMEOUTS'][{family!r}] must be a number or a (connect, read) pair, "
+                f"got {profile!r}")
+    return compiled
+
+
+def _compile_networks(addresses) -> Tuple[Any, ...]:
+    """Parse ALLOWED_WEBHOOK_IPS entries (addresses or CIDR ranges)"""
+    try:
+        return tuple(ipaddress.ip_network(address, strict=False) for address in addresses)
+    except ValueError as e:
+        raise PaystackConfigurationError(f"PAYSTACK['ALLOWED_WEBHOOK_IPS']: {str(e)}")
+
+
+class CompiledSettings:
+    """
+    Frozen, validated snapshot of the Paystack settings
+
+    Holds every DEFAULTS key plus derived values:
+
+    - ``AUTH_HEADER``: ``Authorization`` header value for SECRET_KEY
+    - ``WEBHOOK_NETWORKS``: ALLOWED_WEBHOOK_IPS as ``ipaddress`` networks
+    - ``TIMEOUT_PROFILES``: TIMEOUTS as ``{family: (connect or None, read)}``
+    """
+
+    AUTH_HEADER: str
+    WEBHOOK_NETWORKS: Tuple[Any, ...]
+    TIMEOUT_PROFILES: Dict[str, Tuple[Optional[float], float]]
+
+    def __init__(self, values: Dict[str, Any]):
+        """
+        Args:
+            values: DEFAULTS merged with ``settings.PAYSTACK``
+
+        Raises:
+            PaystackConfigurationError: If a value is missing or invalid
+        """
+        self._validate(values)
+        compiled = dict(values)
+        compiled['AUTH_HEADER'] = f"Bearer {values['SECRET_KEY']}"
+        compiled['WEBHOOK_NETWORKS'] = _compile_networks(values['ALLOWED_WEBHOOK_IPS'])
+        compiled['TIMEOUT_PROFILES'] = _compile_timeouts(values['TIMEOUTS'])
+        object.__setattr__(self, '_values', compiled)
+        self.__dict__.update(compiled)
+
+    @staticmethod
+    def _validate(values: Dict[str, Any]):
+        if not values.get('SECRET_KEY'):
+            raise PaystackConfigurationError(
+                "PAYSTACK['SECRET_KEY'] is required in Django settings"
+            )
+
+        errors = []
+        for name in _NON_NEGATIVE:
+            if not _is_number(values[name]) or values[name] < 0:
+                errors.append(f"{name} must be a non-negative number, got {values[name]!r}")
+        for name in _OPTIONAL_NON_NEGATIVE:
+            value = values[name]
+            if value is not None and (not _is_number(value) or value < 0):
+                errors.append(f"{name} must be a non-negative number or None, got {value!r}")
+        for name in _FRACTIONS:
+            if not _is_number(values[name]) or not 0 <= values[name] <= 1:
+                errors.append(f"{name} must be between 0 and 1, got {values[name]!r}")
+        for name, choices in _CHOICES.items():
+            if values[name] not in choices:
+                errors.append(f"{name} must be one of {choices!r}, got {values[name]!r}")
+        if values['WEBHOOK_FAST_ACK'] and not values['ENABLE_MODELS']:
+            errors.append("WEBHOOK_FAST_ACK needs ENABLE_MODELS to store events")
+        rate_limits = values['RATE_LIMITS']
+        if not isinstance(rate_limits, dict):
+            errors.append(f"RATE_LIMITS must be a dict, got {rate_limits!r}")
+        else:
+            for family, rate in rate_limits.items():
+                if not _is_number(rate) or rate < 0:
+                    errors.append(
+                        f"RATE_LIMITS[{family!r}] must be a non-negative number, got {rate!r}")
+        if not isinstance(values['TIMEOUTS'], dict):
+            errors.append(f"TIMEOUTS must be a dict, got {values['TIMEOUTS']!r}")
+
+        if errors:
+            raise PaystackConfigurationError(
+                "Invalid PAYSTACK settings: " + "; ".join(errors))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{self.__class__.__name__}' is frozen")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{self.__class__.__name__}' is frozen")
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Copy of the settings and derived values"""
+        return dict(self._values)
+
 
 class PaystackSettings:
     """
@@ -14,55 +157,145 @@ class PaystackSettings:
         'SECRET_KEY': None,
         'PUBLIC_KEY': None,
         'BASE_URL': 'https://api.paystack.co',
-        'TIMEOUT': 30,
+        'TIMEOUT': 30,  # read timeout in seconds
+        'CONNECT_TIMEOUT': None,  # defaults to TIMEOUT
+        'TIMEOUTS': {},  # per family, e.g. {'transaction/verify': (3, 10), 'bulkcharge': 120}
         'MAX_RETRIES': 3,
+        'RETRY_BACKOFF_BASE': 0.5,  # seconds
+        'RETRY_BACKOFF_MAX': 10,  # seconds
+        'RETRY_DEADLINE': 60,  # total seconds across retries, None for no cap
+        'RETRY_BUDGET_RATIO': 0.1,  # retries as a fraction of requests, None for no budget
+        'RETRY_SAFE_POST_ENDPOINTS': [],
         'VERIFY_SSL': True,
+        'POOL_CONNECTIONS': 10,  # hosts to keep connection pools for
+        'POOL_MAXSIZE': 10,  # connections per host, size to your thread count
+        'POOL_BLOCK': False,  # wait for a free connection instead of opening extra ones
+        'KEEP_ALIVE': True,
+        'COALESCE_GETS': True,  # concurrent identical GETs share one request
         'WEBHOOK_SECRET': None,
         'CALLBACK_URL': None,
         'CURRENCY': 'NGN',
         'ENVIRONMENT': 'production',  # 'production' or 'test'
         'AUTO_VERIFY_TRANSACTIONS': True,
         'CACHE_TIMEOUT': 300,  # 5 minutes
+        'CACHE_ENABLED': True,
+        'CACHE_ALIAS': 'default',
+        'CACHE_STALE_TIMEOUT': 60,  # serve stale while refreshing in the background
+        'CACHE_STALE_IF_ERROR': 86400,  # serve stale while Paystack is failing
+        'CACHE_LOCAL_TIMEOUT': 30,  # in-process tier, bounds cross-process staleness
+        'CACHE_LOCAL_MAXSIZE': 1024,
+        'CACHE_WEBHOOK_INVALIDATIONS': {},  # e.g. {'subscription': ['plan']}
+        'ACCOUNT_RESOLVE_CACHE_TIMEOUT': 86400,  # resolved account names
+        'ACCOUNT_RESOLVE_NEGATIVE_TIMEOUT': 300,  # "could not resolve" answers
+        'BIN_CACHE_REFRESH_AFTER': 2592000,  # 30 days, refreshed in the background
+        'BIN_CACHE_MAXSIZE': 100000,
+        'JSON_CODEC': 'auto',  # 'auto', 'orjson', 'ujson' or 'json'
         'LOG_REQUESTS': False,
         'LOG_RESPONSES': False,
+        'REQUEST_HOOKS': [],  # dotted paths of RequestHook subclasses
+        'METRICS_ENABLED': False,  # collect metrics for djpaystack.views.paystack_metrics
+        'METRICS_TOKEN': None,  # bearer token required by the metrics view
+        'AUDIT_LOG': None,  # 'file' or 'db' to keep a redacted record of each call
+        'AUDIT_LOG_FILE': 'paystack_audit.log',
+        'AUDIT_LOG_MAX_BYTES': 10 * 1024 * 1024,  # rotate the file at this size
+        'AUDIT_LOG_BACKUP_COUNT': 5,
+        'AUDIT_SAMPLE_RATE': 1.0,  # fraction of successful calls recorded; errors always are
+        'AUDIT_MAX_BODY_BYTES': 4096,  # per request/response body
+        'AUDIT_QUEUE_SIZE': 10000,  # records waiting for the writer before new ones are dropped
+        'AUDIT_REDACT_FIELDS': [],  # extra keys to mask
+        'TRACING_ENABLED': True,  # OpenTelemetry spans, when opentelemetry-api is installed
         'ENABLE_SIGNALS': True,
         'ENABLE_MODELS': True,
         'ALLOWED_WEBHOOK_IPS': [],
+        'WEBHOOK_FAST_ACK': False,  # store and acknowledge webhooks, process them in the background
+        'WEBHOOK_EXECUTOR': 'thread',  # 'thread', 'db', 'celery' or a WebhookExecutor dotted path
+        'WEBHOOK_EXECUTOR_WORKERS': 4,  # threads for the 'thread' executor
+        'WEBHOOK_WORKER_BATCH_SIZE': 100,  # events claimed per batch by process_paystack_webhooks
+        'WEBHOOK_WORKER_LEASE': 300,  # seconds a claim holds before another worker may retry it
+        'RATE_LIMIT': None,  # default max requests per second, None to disable
+        'RATE_LIMITS': {},  # per endpoint family, e.g. {'transaction/verify': 20}
+        'RATE_LIMIT_BACKEND': 'local',  # 'local' or 'cache' (shared across processes)
+        'RATE_LIMIT_CACHE': 'default',
+        'RATE_LIMIT_TIMEOUT': 10,  # seconds to wait for capacity, 0 to fail fast
+        'CIRCUIT_BREAKER_ENABLED': True,
+        'CIRCUIT_BREAKER_FAILURE_THRESHOLD': 5,  # consecutive failures
+        'CIRCUIT_BREAKER_RECOVERY_TIMEOUT': 30,  # seconds before a probe call
+        'CIRCUIT_BREAKER_FAMILIES': [],  # extra family prefixes, e.g. ['transaction/verify']
+        'HEDGE_ENDPOINTS': [],  # GET families to hedge, e.g. ['transaction/verify']
+        'HEDGE_PERCENTILE': 95,  # hedge once a request is slower than this percentile
+        'HEDGE_DEFAULT_DELAY': 1.0,  # seconds, until enough latencies are recorded
+        'HEDGE_BUDGET_RATIO': 0.05,  # at most ~5% extra requests
+        'HEDGE_MAX_WORKERS': 16,
+        'ASYNC_MAX_CONNECTIONS': 100,
+        'ASYNC_MAX_KEEPALIVE_CONNECTIONS': 20,
     }
 
     def __init__(self):
-        self._settings = None
-
-    def _load_settings(self):
-        """Load settings from Django settings"""
-        if self._settings is not None:
-            return
+        self._lock = threading.Lock()
+        self._compiled = None
 
-        user_settings = getattr(settings, 'PAYSTACK', {})
-        self._settings = {**self.DEFAULTS, **user_settings}
-
-        # Validate required settings
-        if not self._settings.get('SECRET_KEY'):
-            raise PaystackConfigurationError(
-                "PAYSTACK['SECRET_KEY'] is required in Django settings"
-            )
+    def _load_settings(self) -> CompiledSettings:
+        """Compile settings from Django settings and install them as attributes"""
+        with self._lock:
+            if self._compiled is None:
+                user_settings = getattr(settings, 'PAYSTACK', {})
+                compiled = CompiledSettings({**self.DEFAULTS, **user_settings})
+                # Plain attributes: later reads do not reach __getattr__
+                self.__dict__.update(compiled.as_dict())
+                self._compiled = compiled
+            return self._compiled
 
     def __getattr__(self, name):
-        self._load_settings()
-        if name in self._settings:
-            return self._settings[name]
+        # Only reached before the settings are compiled, or for unknown names
+        if name.startswith('_'):
+            raise AttributeError(name)
+        compiled = self._load_settings()
+        if name in compiled._values:
+            return compiled._values[name]
         raise AttributeError(
             f"'{self.__class__.__name__}' has no attribute '{name}'")
 
+    @property
+    def compiled(self) -> CompiledSettings:
+        """The current frozen settings snapshot"""
+        return self._compiled or self._load_settings()
+
     def get(self, key, default=None):
         """Get a setting value with optional default"""
-        self._load_settings()
-        return self._settings.get(key, default)
+        return self.compiled._values.get(key, default)
+
+    def clear(self):
+        """Drop the compiled settings; they are rebuilt on next access"""
+        with self._lock:
+            compiled, self._compiled = self._compiled, None
+            if compiled is not None:
+                for name in compiled._values:
+                    self.__dict__.pop(name, None)
 
     def reload(self):
         """Reload settings from Django settings"""
-        self._settings = None
+        self.clear()
         self._load_settings()
 
 
 paystack_settings = PaystackSettings()
+
+
+def _settings_changed(setting, **kwargs):
+    if setting == 'PAYSTACK':
+        paystack_settings.clear()
+
+
+setting_changed.connect(_settings_changed)
+
+
+def override_paystack_settings(**overrides):
+    """
+    Override individual PAYSTACK settings, e.g. in tests
+
+    Works like Django's ``override_settings`` (as a decorator or context
+    manager); the compiled settings are rebuilt on entry and exit.
+    """
+    from django.test.utils import override_settings
+
+    return override_settings(PAYSTACK={**getattr(settings, 'PAYSTACK', {}), **overrides})
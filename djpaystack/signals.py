@@ -18,3 +18,6 @@ paystack_refund_processed = django.dispatch.Signal()
 # Dispute signals
 paystack_dispute_created = django.dispatch.Signal()
 paystack_dispute_resolved = django.dispatch.Signal()
+
+# Client signals
+paystack_circuit_state_changed = django.dispatch.Signal()
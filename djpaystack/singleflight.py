@@ -0,0 +1,119 @@
+"""
+Single-flight call deduplication
+
+Concurrent callers asking for the same key share one in-flight call and
+its outcome (result or exception) instead of each making their own.
+
+The shared call runs under the first caller's paystack_deadline(). Every
+other caller waits no longer than its own deadline allows, and one that
+still has time left when the first caller's deadline expires makes the
+call itself rather than share that timeout.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from .deadline import check_deadline, remaining
+from .exceptions import PaystackTimeoutError
+from .instrumentation import Counters
+
+
+class SingleFlightStats(Counters):
+    """Thread-safe single-flight counters"""
+
+    FIELDS = (
+        'calls',
+        'coalesced',
+    )
+
+    def dedup_ratio(self) -> float:
+        """Fraction of calls served by another caller's in-flight call"""
+        counts = self.snapshot()
+        return counts['coalesced'] / counts['calls'] if counts['calls'] else 0.0
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls by key, for threads and asyncio
+    """
+
+    def __init__(self):
+        self.stats = SingleFlightStats()
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, 'asyncio.Task'] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Call ``fn`` unless a call for ``key`` is already running, in which
+        case wait for it and share its outcome
+        """
+        self.stats.incr('calls')
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self.stats.incr('coalesced')
+            check_deadline("shared call")
+            if not call.event.wait(remaining()):
+                raise PaystackTimeoutError("Deadline exceeded while waiting for a shared call")
+            if call.error is not None:
+                if self._leader_timed_out(call.error):
+                    return fn()
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of do; calls are shared within one event loop"""
+        self.stats.incr('calls')
+        loop_key = (id(asyncio.get_running_loop()), key)
+
+        task = self._tasks.get(loop_key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[loop_key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(loop_key, None))
+            # Shield so one cancelled caller does not cancel the shared call
+            return await asyncio.shield(task)
+
+        self.stats.incr('coalesced')
+        check_deadline("shared call")
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), remaining())
+        except PaystackTimeoutError as e:
+            if self._leader_timed_out(e):
+                return await fn()
+            raise
+        except asyncio.TimeoutError:
+            raise PaystackTimeoutError("Deadline exceeded while waiting for a shared call")
+
+    @staticmethod
+    def _leader_timed_out(error) -> bool:
+        """Check whether a shared call failed on its leader's deadline while this caller has time"""
+        if not isinstance(error, PaystackTimeoutError):
+            return False
+        left = remaining()
+        return left is None or left > 0
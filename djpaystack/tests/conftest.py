@@ -1,6 +1,8 @@
 
+import json
 import pytest
 import django
+from unittest.mock import Mock
 from django.conf import settings
 
 
@@ -25,12 +27,51 @@ def pytest_configure():
             'ENVIRONMENT': 'test',
             'ENABLE_MODELS': True,
             'ENABLE_SIGNALS': True,
+            'RETRY_BACKOFF_BASE': 0,
         },
         USE_TZ=True,
     )
     django.setup()
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Start every test with closed circuit breakers"""
+    from djpaystack.circuit_breaker import reset_circuit_breakers
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+@pytest.fixture(autouse=True)
+def reset_response_cache():
+    """Start every test with an empty response cache"""
+    from django.core.cache import cache
+    from djpaystack.response_cache import response_cache
+    cache.clear()
+    response_cache.clear_local()
+    response_cache.stats.reset()
+    response_cache.flights.stats.reset()
+    from djpaystack.bin_cache import bin_cache
+    bin_cache.clear()
+    bin_cache.stats.reset()
+    yield
+
+
+def make_response(body, status_code=200):
+    """Build a mock requests response carrying a JSON body"""
+    response = Mock(status_code=status_code, headers={})
+    response.content = json.dumps(body).encode()
+    return response
+
+
+@pytest.fixture
+def client():
+    """Sync client with a test secret key"""
+    from djpaystack import PaystackClient
+    return PaystackClient(secret_key='sk_test_xxxxx')
+
+
 @pytest.fixture
 def mock_paystack_response():
     """Mock successful Paystack API response"""
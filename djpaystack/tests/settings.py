@@ -20,6 +20,7 @@ PAYSTACK = {
     'ENVIRONMENT': 'test',
     'ENABLE_MODELS': True,
     'ENABLE_SIGNALS': True,
+    'RETRY_BACKOFF_BASE': 0,
 }
 
 USE_TZ = True
@@ -0,0 +1,98 @@
+import asyncio
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from djpaystack import AsyncPaystackClient
+from djpaystack.exceptions import PaystackAPIError, PaystackNetworkError
+
+
+def make_client(handler):
+    """Create async client backed by a mock transport"""
+    client = AsyncPaystackClient(secret_key='sk_test_xxxxx')
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncPaystackClient:
+    """Test AsyncPaystackClient class"""
+
+    def test_verify_transaction(self, mock_paystack_response):
+        """Test awaitable namespace method"""
+        def handler(request):
+            assert request.url.path == '/transaction/verify/test_ref_123'
+            assert request.headers['Authorization'] == 'Bearer sk_test_xxxxx'
+            return httpx.Response(200, json=mock_paystack_response)
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.transactions.verify('test_ref_123')
+
+        response = asyncio.run(run())
+        assert response['data']['reference'] == 'test_ref_123'
+
+    def test_failed_request(self):
+        """Test API error is raised"""
+        def handler(request):
+            return httpx.Response(400, json={'status': False, 'message': 'Invalid key'})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.customers.fetch('CUS_xxxxx')
+
+        with pytest.raises(PaystackAPIError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.status_code == 400
+
+    def test_network_error(self):
+        """Test network error handling"""
+        def handler(request):
+            raise httpx.ConnectError('Connection failed')
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.transfers.fetch('TRF_xxxxx')
+
+        with pytest.raises(PaystackNetworkError):
+            asyncio.run(run())
+
+    def test_list_fetches_all_pages(self):
+        """Test async pagination through list methods and paginate()"""
+        def handler(request):
+            page = int(request.url.params['page'])
+            return httpx.Response(200, json={
+                'status': True,
+                'data': [{'id': page * 10 + i} for i in range(2)],
+                'meta': {'pageCount': 3},
+            })
+
+        async def run():
+            async with make_client(handler) as client:
+                listed = await client.transactions.list(per_page=2)
+                items = [item async for item in client.paginate('transaction', per_page=2)]
+                return listed, items
+
+        listed, items = asyncio.run(run())
+        assert [t['id'] for t in listed['data']] == [10, 11, 20, 21, 30, 31]
+        assert [t['id'] for t in items] == [10, 11, 20, 21, 30, 31]
+
+    def test_iter_items_is_async_iterator(self):
+        """Test streaming list counterparts on the async client"""
+        def handler(request):
+            page = int(request.url.params['page'])
+            return httpx.Response(200, json={
+                'status': True,
+                'data': [{'id': page}],
+                'meta': {'pageCount': 5},
+            })
+
+        async def run():
+            async with make_client(handler) as client:
+                ids = []
+                async for item in client.customers.list.iter_items(per_page=1):
+                    ids.append(item['id'])
+                    if len(ids) == 2:
+                        break
+                return ids
+
+        assert asyncio.run(run()) == [1, 2]
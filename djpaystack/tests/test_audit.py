@@ -0,0 +1,178 @@
+import json
+import os
+import queue
+import threading
+import pytest
+from unittest.mock import patch
+from djpaystack.audit import REDACTED, AuditLogger, FileSink, redact
+from djpaystack.exceptions import PaystackAPIError
+from djpaystack.instrumentation import RequestCall, register_hook, unregister_hook
+from djpaystack.tests.conftest import make_response
+
+
+class MemorySink:
+    def __init__(self):
+        self.records = []
+        self.closed = False
+
+    def write(self, records):
+        self.records.extend(records)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def audit():
+    audit = AuditLogger(sink=MemorySink(), sample_rate=1.0, max_body_bytes=4096,
+                        queue_size=100, redact_fields=['email'])
+    register_hook(audit)
+    yield audit
+    unregister_hook(audit)
+    audit.close()
+
+
+class TestRedact:
+    """Test payload redaction"""
+
+    def test_nested_fields(self):
+        payload = {
+            'reference': 'ref_1',
+            'authorization': {'authorization_code': 'AUTH_x', 'last4': '4081', 'signature': 'SIG'},
+            'items': [{'cvv': '123', 'amount': 100}],
+        }
+        result = redact(payload)
+        assert result['reference'] == 'ref_1'
+        assert result['authorization'] == {
+            'authorization_code': REDACTED, 'last4': '4081', 'signature': REDACTED}
+        assert result['items'] == [{'cvv': REDACTED, 'amount': 100}]
+        assert payload['authorization']['authorization_code'] == 'AUTH_x'
+
+    def test_bearer_tokens_in_strings(self):
+        assert redact('Authorization: Bearer sk_live_abc') == f'Authorization: Bearer {REDACTED}'
+
+    def test_extra_fields(self):
+        assert redact({'Email': 'a@b.com'}, ['email']) == {'Email': REDACTED}
+
+
+class TestAuditLogger:
+    """Test background audit logging of client calls"""
+
+    def test_records_successful_call(self, client, audit):
+        body = {'status': True, 'data': {'reference': 'ref_1',
+                                         'authorization': {'authorization_code': 'AUTH_x'}}}
+        with patch.object(client.session, 'request', return_value=make_response(body)):
+            client.transactions.verify('ref_1')
+        audit.close()
+
+        record, = audit.sink.records
+        assert record['method'] == 'GET'
+        assert record['endpoint'] == 'transaction/verify/{reference}'
+        assert record['status'] == 200
+        assert record['attempts'] == 1
+        assert record['response']['data']['authorization']['authorization_code'] == REDACTED
+        assert audit.sink.closed
+
+    def test_records_request_body_and_error(self, client, audit):
+        with patch.object(client.session, 'request',
+                          return_value=make_response({'status': False, 'message': 'Invalid'}, 400)):
+            with pytest.raises(PaystackAPIError):
+                client.transactions.initialize(email='jane@example.com', amount=5000)
+        audit.close()
+
+        record, = audit.sink.records
+        assert record['request']['email'] == REDACTED
+        assert record['request']['amount'] == 5000
+        assert record['error'] == 'PaystackAPIError: Invalid'
+
+    def test_large_bodies_are_not_decoded(self, client, audit):
+        audit.max_body_bytes = 64
+        body = {'status': True, 'data': [{'authorization_code': 'AUTH_secret', 'id': i} for i in range(50)]}
+        with patch.object(client.session, 'request', return_value=make_response(body)):
+            client.customers.list(page=1)
+        audit.close()
+
+        response = audit.sink.records[0]['response']
+        assert response == {'truncated': True, 'bytes': len(json.dumps(body).encode())}
+
+    def test_queue_holds_only_redacted_records(self):
+        """Test raw bodies are redacted and truncated before they are queued"""
+        audit = AuditLogger(sink=MemorySink(), sample_rate=1.0, max_body_bytes=4096, queue_size=10)
+        # Stand in for the writer thread so queued items stay inspectable
+        audit._queue = queue.Queue()
+        audit._pid = os.getpid()
+        call = RequestCall('POST', 'transaction/charge_authorization',
+                           b'{"authorization_code": "AUTH_secret", "amount": 100}')
+        call.response_body = b'{"status": true, "data": {"pin": "1234"}}'
+        audit.after_response(call)
+
+        record = audit._queue.get_nowait()
+        assert record['request'] == {'authorization_code': REDACTED, 'amount': 100}
+        assert record['response']['data']['pin'] == REDACTED
+        assert 'AUTH_secret' not in json.dumps(record)
+
+    def test_sampling_keeps_errors(self, client, audit):
+        audit.sample_rate = 0
+        with patch.object(client.session, 'request',
+                          return_value=make_response({'status': True, 'data': {}})):
+            client.customers.fetch('CUS_1')
+        with patch.object(client.session, 'request',
+                          return_value=make_response({'status': False, 'message': 'no'}, 404)):
+            with pytest.raises(PaystackAPIError):
+                client.customers.fetch('CUS_2')
+        audit.close()
+
+        assert [record['status'] for record in audit.sink.records] == [404]
+        assert audit.stats.snapshot()['sampled_out'] == 1
+
+    def test_full_queue_drops_instead_of_blocking(self, client):
+        release = threading.Event()
+
+        class SlowSink(MemorySink):
+            def write(self, records):
+                release.wait(5)
+                super().write(records)
+
+        audit = AuditLogger(sink=SlowSink(), sample_rate=1.0, queue_size=1)
+        register_hook(audit)
+        try:
+            with patch.object(client.session, 'request',
+                              return_value=make_response({'status': True, 'data': {}})):
+                for _ in range(5):
+                    client.customers.fetch('CUS_1')
+        finally:
+            unregister_hook(audit)
+            release.set()
+            audit.close()
+
+        stats = audit.stats.snapshot()
+        assert stats['dropped'] >= 3
+        assert stats['records'] + stats['dropped'] == 5
+
+    def test_sink_closed_on_writer_thread(self, client):
+        threads = []
+
+        class ThreadSink(MemorySink):
+            def close(self):
+                threads.append(threading.current_thread().name)
+
+        audit = AuditLogger(sink=ThreadSink(), sample_rate=1.0)
+        register_hook(audit)
+        try:
+            with patch.object(client.session, 'request',
+                              return_value=make_response({'status': True, 'data': {}})):
+                client.customers.fetch('CUS_1')
+        finally:
+            unregister_hook(audit)
+            audit.close()
+
+        assert threads == ['djpaystack-audit']
+
+    def test_file_sink(self, tmp_path):
+        path = tmp_path / 'audit.log'
+        sink = FileSink(str(path), max_bytes=1024 * 1024, backup_count=1)
+        sink.write([{'endpoint': 'customer/{code}', 'status': 200}, {'endpoint': 'bank', 'status': 200}])
+        sink.close()
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)['endpoint'] for line in lines] == ['customer/{code}', 'bank']
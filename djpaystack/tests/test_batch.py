@@ -0,0 +1,95 @@
+import asyncio
+import json
+import threading
+import pytest
+from unittest.mock import patch
+from djpaystack.exceptions import PaystackAPIError, PaystackTimeoutError
+from djpaystack.tests.conftest import make_response
+
+
+def respond(method, url, **kwargs):
+    code = url.rsplit('/', 1)[-1]
+    if code == 'CUS_missing':
+        return make_response({'status': False, 'message': 'Customer not found'}, 404)
+    return make_response({'status': True, 'data': {'customer_code': code}})
+
+
+class TestBatch:
+    """Test concurrent batch executor"""
+
+    def test_namespace_calls_return_futures(self, client):
+        """Test namespace methods called through the batch run concurrently"""
+        with patch.object(client.session, 'request', side_effect=respond):
+            with client.batch(max_concurrency=4) as batch:
+                futures = {code: batch.customers.fetch(code) for code in ('CUS_1', 'CUS_2', 'CUS_missing')}
+
+        assert futures['CUS_1'].result()['data']['customer_code'] == 'CUS_1'
+        assert isinstance(futures['CUS_missing'].exception(), PaystackAPIError)
+
+        results = batch.results()
+        assert results[1]['data']['customer_code'] == 'CUS_2'
+        assert isinstance(results[2], PaystackAPIError)
+
+    def test_map_reports_errors_per_item(self, client):
+        with patch.object(client.session, 'request', side_effect=respond):
+            with client.batch(max_concurrency=2) as batch:
+                results = batch.map(client.customers.fetch, ['CUS_1', 'CUS_missing'])
+
+        assert results['CUS_1']['status'] is True
+        assert isinstance(results['CUS_missing'], PaystackAPIError)
+
+    def test_concurrency_is_bounded(self, client):
+        """Test no more than max_concurrency calls run at once"""
+        lock = threading.Lock()
+        state = {'running': 0, 'peak': 0}
+
+        def tracked(*args, **kwargs):
+            with lock:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+            threading.Event().wait(0.01)
+            with lock:
+                state['running'] -= 1
+            return respond(*args, **kwargs)
+
+        with patch.object(client.session, 'request', side_effect=tracked):
+            with client.batch(max_concurrency=3) as batch:
+                batch.map(client.customers.fetch, [f'CUS_{i}' for i in range(12)])
+
+        assert state['peak'] <= 3
+
+    def test_deadline_fails_unstarted_calls(self, client):
+        release = threading.Event()
+
+        def slow(*args, **kwargs):
+            release.wait(5)
+            return respond(*args, **kwargs)
+
+        with patch.object(client.session, 'request', side_effect=slow):
+            batch = client.batch(max_concurrency=1, deadline=0.05)
+            first = batch.customers.fetch('CUS_1')
+            second = batch.customers.fetch('CUS_2')
+            threading.Timer(0.1, release.set).start()
+            batch.close()
+
+        assert first.result()['status'] is True
+        assert isinstance(batch.results()[1], PaystackTimeoutError)
+
+    def test_async_batch(self):
+        httpx = pytest.importorskip('httpx')
+        from djpaystack import AsyncPaystackClient
+
+        def handler(request):
+            code = request.url.path.rsplit('/', 1)[-1]
+            return httpx.Response(200, json={'status': True, 'data': {'customer_code': code}})
+
+        async def run():
+            async with AsyncPaystackClient(secret_key='sk_test_xxxxx') as client:
+                client.session._transport = httpx.MockTransport(handler)
+                async with client.batch(max_concurrency=2) as batch:
+                    for code in ('CUS_1', 'CUS_2', 'CUS_3'):
+                        batch.customers.fetch(code)
+                return await batch.results()
+
+        results = asyncio.run(run())
+        assert [r['data']['customer_code'] for r in results] == ['CUS_1', 'CUS_2', 'CUS_3']
@@ -0,0 +1,63 @@
+import time
+import pytest
+from unittest.mock import patch
+from djpaystack.bin_cache import BinCache, bin_cache, normalize_bin
+from djpaystack.exceptions import PaystackValidationError
+from djpaystack.settings import paystack_settings
+from djpaystack.tests.conftest import make_response
+
+BIN_RESPONSE = {
+    'status': True,
+    'message': 'Bin resolved',
+    'data': {'bin': '539983', 'brand': 'Mastercard', 'card_type': 'DEBIT',
+             'bank': 'Guaranty Trust Bank', 'country_code': 'NG'},
+}
+
+
+class TestBinCache:
+    """Test card BIN cache"""
+
+    def test_normalize_bin(self):
+        assert normalize_bin('5399 8312 3456 7890') == '539983'
+        assert normalize_bin('539983') == '539983'
+        with pytest.raises(PaystackValidationError):
+            normalize_bin('5399')
+
+    def test_repeat_lookups_use_index(self, client):
+        """Test only the first lookup of a BIN goes to the table and Paystack"""
+        with patch.object(client.session, 'request') as mock_request, \
+                patch.object(BinCache, '_db_get', return_value=None) as mock_db_get, \
+                patch.object(BinCache, '_db_save') as mock_save:
+            mock_request.return_value = make_response(BIN_RESPONSE)
+            client.verification.resolve_card_bin('539983')
+            result = client.verification.resolve_card_bin('5399831234567890')
+
+        assert result['data']['brand'] == 'Mastercard'
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.kwargs['url'].endswith('/decision/bin/539983')
+        mock_db_get.assert_called_once_with('539983')
+        mock_save.assert_called_once_with('539983', BIN_RESPONSE)
+        stats = bin_cache.stats.snapshot()
+        assert (stats['misses'], stats['hits'], stats['db_hits']) == (1, 1, 0)
+
+    def test_table_tier(self, client):
+        """Test BINs stored by another process are served without a request"""
+        with patch.object(client.session, 'request') as mock_request, \
+                patch.object(BinCache, '_db_get', return_value=(BIN_RESPONSE, time.time())):
+            assert client.verification.resolve_card_bin('539983') == BIN_RESPONSE
+        mock_request.assert_not_called()
+
+    def test_stale_entry_refreshed_in_background(self, client):
+        """Test old entries are served at once and refreshed off the request path"""
+        fetched_at = time.time() - paystack_settings.BIN_CACHE_REFRESH_AFTER - 1
+        with patch.object(client.session, 'request') as mock_request, \
+                patch.object(BinCache, '_db_get', return_value=(BIN_RESPONSE, fetched_at)), \
+                patch.object(BinCache, '_db_save'), \
+                patch('djpaystack.bin_cache.threading.Thread') as mock_thread:
+            mock_request.return_value = make_response(BIN_RESPONSE)
+            assert client.verification.resolve_card_bin('539983') == BIN_RESPONSE
+            mock_request.assert_not_called()
+
+            kwargs = mock_thread.call_args.kwargs
+            kwargs['target'](*kwargs['args'])
+            mock_request.assert_called_once()
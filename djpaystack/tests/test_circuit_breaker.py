@@ -0,0 +1,144 @@
+import json
+import time
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from djpaystack.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from djpaystack.client import PaystackClient
+from djpaystack.decorators import handle_paystack_errors
+from djpaystack.exceptions import PaystackCircuitOpenError, PaystackNetworkError, PaystackRateLimitError
+from djpaystack.settings import override_paystack_settings
+from djpaystack.signals import paystack_circuit_state_changed
+from djpaystack.tests.conftest import make_response
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state machine"""
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the breaker"""
+        breaker = CircuitBreaker('transaction', failure_threshold=2, recovery_timeout=30)
+
+        breaker.record_failure()
+        breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(PaystackCircuitOpenError) as exc_info:
+            breaker.allow()
+        assert exc_info.value.family == 'transaction'
+        assert 0 < exc_info.value.retry_after <= 30
+
+    def test_success_resets_failure_count(self):
+        """Test a success between failures keeps the breaker closed"""
+        breaker = CircuitBreaker('transaction', failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_status(200)
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_probe(self):
+        """Test a single probe is let through after the recovery timeout"""
+        breaker = CircuitBreaker('transfer', failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure()
+
+        breaker.allow()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        breaker.allow()
+        breaker.record_status(200)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_rejects_concurrent_calls(self):
+        """Test calls fail fast while the probe is in flight"""
+        breaker = CircuitBreaker('transfer', failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        breaker._opened_at -= 30
+
+        breaker.allow()
+        with pytest.raises(PaystackCircuitOpenError):
+            breaker.allow()
+
+    def test_transitions_send_signal(self):
+        """Test state changes are announced"""
+        received = []
+
+        def listener(sender, family, old_state, new_state, **kwargs):
+            received.append((family, old_state, new_state))
+
+        paystack_circuit_state_changed.connect(listener)
+        try:
+            breaker = CircuitBreaker('charge', failure_threshold=1, recovery_timeout=0)
+            breaker.record_failure()
+            breaker.allow()
+            breaker.record_success()
+        finally:
+            paystack_circuit_state_changed.disconnect(listener)
+
+        assert received == [
+            ('charge', 'closed', 'open'),
+            ('charge', 'open', 'half_open'),
+            ('charge', 'half_open', 'closed'),
+        ]
+
+    def test_disabled(self):
+        """Test no breaker is returned when disabled"""
+        with override_paystack_settings(CIRCUIT_BREAKER_ENABLED=False):
+            assert get_circuit_breaker('transaction') is None
+
+
+class TestClientCircuitBreaker:
+    """Test circuit breaker integration in the client"""
+
+    def test_fails_fast_per_family(self):
+        """Test an open breaker skips the network for its family only"""
+        with override_paystack_settings(MAX_RETRIES=0, CIRCUIT_BREAKER_FAILURE_THRESHOLD=2):
+            client = PaystackClient()
+
+        with override_paystack_settings(CIRCUIT_BREAKER_FAILURE_THRESHOLD=2), \
+                patch.object(client.session, 'request') as mock_request:
+            mock_request.side_effect = requests.exceptions.ConnectionError('down')
+            for _ in range(2):
+                with pytest.raises(PaystackNetworkError):
+                    client.get('transaction/verify/ref_1')
+
+            with pytest.raises(PaystackCircuitOpenError):
+                client.get('transaction/verify/ref_1')
+            assert mock_request.call_count == 2
+
+            mock_response = Mock(status_code=200, headers={})
+            mock_response.content = json.dumps({'status': True, 'data': []}).encode()
+            mock_request.side_effect = None
+            mock_request.return_value = mock_response
+            assert client.get('bank')['status'] is True
+
+    def test_rate_limited_call_does_not_take_the_probe(self, client):
+        """Test a call refused by the rate limiter leaves the half-open probe free"""
+        with override_paystack_settings(RATE_LIMITS={'transaction/verify': 1}, RATE_LIMIT_TIMEOUT=0), \
+                patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response({'status': True, 'data': {}})
+            client.get('transaction/verify/ref_1')
+
+            breaker = get_circuit_breaker('transaction/verify/ref_1')
+            breaker.state = breaker.OPEN
+            breaker._opened_at = time.monotonic() - breaker.recovery_timeout
+            with pytest.raises(PaystackRateLimitError):
+                client.get('transaction/verify/ref_1')
+
+            breaker.allow()
+            assert breaker.state == breaker.HALF_OPEN
+
+    def test_decorator_returns_503(self):
+        """Test views get 503 with Retry-After while the breaker is open"""
+        @handle_paystack_errors
+        def view(request):
+            raise PaystackCircuitOpenError('open', family='transfer', retry_after=4.2)
+
+        response = view(None)
+        assert response.status_code == 503
+        assert response['Retry-After'] == '5'
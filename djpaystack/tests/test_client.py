@@ -1,4 +1,5 @@
 
+import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from djpaystack import PaystackClient
@@ -72,7 +73,7 @@ class TestPaystackClient:
 
             with patch.object(client.session, 'request') as mock_request:
                 mock_response = Mock()
-                mock_response.json.return_value = mock_paystack_response
+                mock_response.content = json.dumps(mock_paystack_response).encode()
                 mock_response.status_code = 200
                 mock_request.return_value = mock_response
 
@@ -95,10 +96,10 @@ class TestPaystackClient:
 
             with patch.object(client.session, 'request') as mock_request:
                 mock_response = Mock()
-                mock_response.json.return_value = {
+                mock_response.content = json.dumps({
                     'status': False,
                     'message': 'Invalid parameters'
-                }
+                }).encode()
                 mock_response.status_code = 400
                 mock_request.return_value = mock_response
 
@@ -125,3 +126,175 @@ class TestPaystackClient:
 
                 with pytest.raises(PaystackNetworkError):
                     client.get('transaction')
+
+
+class TestRequestCoalescing:
+    """Test single-flight coalescing of identical GETs"""
+
+    @staticmethod
+    def _response():
+        response = Mock(status_code=200, headers={})
+        response.content = json.dumps({'status': True, 'data': {'status': 'success'}}).encode()
+        return response
+
+    def test_concurrent_gets_share_request(self):
+        """Test threads verifying the same reference share one request"""
+        import threading
+        import time
+
+        client = PaystackClient(secret_key='sk_test_xxxxx')
+        release = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            release.wait(5)
+            return self._response()
+
+        with patch.object(client.session, 'request', side_effect=slow_request) as mock_request:
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(client.transactions.verify('ref_1')))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            deadline = time.monotonic() + 5
+            while client.coalescer.stats.snapshot()['calls'] < 4 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        assert mock_request.call_count == 1
+        assert len(results) == 4
+        assert client.coalescer.stats.dedup_ratio() == pytest.approx(0.75)
+
+    def test_writes_and_distinct_params_not_coalesced(self):
+        """Test only identical GETs are keyed together"""
+        client = PaystackClient(secret_key='sk_test_xxxxx')
+
+        assert client._coalesce_key('GET', 'transaction', None, {'page': 1}, {}) == \
+            client._coalesce_key('GET', '/transaction/', None, {'page': 1}, {})
+        assert client._coalesce_key('GET', 'transaction', None, {'page': 1}, {}) != \
+            client._coalesce_key('GET', 'transaction', None, {'page': 2}, {})
+        assert client._coalesce_key('POST', 'transaction/initialize', {'amount': 1}, None, {}) is None
+
+    def test_async_tasks_share_request(self):
+        """Test asyncio tasks verifying the same reference share one request"""
+        import asyncio
+        httpx = pytest.importorskip('httpx')
+        from djpaystack import AsyncPaystackClient
+
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={'status': True, 'data': {}})
+
+        async def run():
+            async with AsyncPaystackClient(secret_key='sk_test_xxxxx') as client:
+                client.session._transport = httpx.MockTransport(handler)
+                return await asyncio.gather(*(client.transactions.verify('ref_1') for _ in range(3)))
+
+        results = asyncio.run(run())
+        assert len(results) == 3
+        assert calls == ['/transaction/verify/ref_1']
+
+    def test_waiter_bounded_by_own_deadline(self):
+        """Test a coalesced caller gives up on its own deadline, not the leader's"""
+        import threading
+        import time
+        from djpaystack.deadline import paystack_deadline
+        from djpaystack.exceptions import PaystackTimeoutError
+        from djpaystack.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return 'shared'
+
+        leader = threading.Thread(target=flight.do, args=('key', slow))
+        leader.start()
+        started.wait(5)
+        began = time.monotonic()
+        with paystack_deadline(0.05):
+            with pytest.raises(PaystackTimeoutError):
+                flight.do('key', lambda: 'own')
+        release.set()
+        leader.join()
+
+        assert time.monotonic() - began < 1
+
+    def test_waiter_with_time_left_does_not_share_leader_timeout(self):
+        """Test a caller outliving the leader's deadline makes the call itself"""
+        import threading
+        import time
+        from djpaystack.exceptions import PaystackTimeoutError
+        from djpaystack.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        results = []
+
+        def timed_out():
+            started.set()
+            release.wait(5)
+            raise PaystackTimeoutError('leader deadline')
+
+        def lead():
+            with pytest.raises(PaystackTimeoutError):
+                flight.do('key', timed_out)
+
+        leader = threading.Thread(target=lead)
+        follower = threading.Thread(target=lambda: results.append(flight.do('key', lambda: 'own')))
+        leader.start()
+        started.wait(5)
+        follower.start()
+        deadline = time.monotonic() + 5
+        while flight.stats.snapshot()['coalesced'] < 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert results == ['own']
+
+    def test_async_waiter_bounded_by_own_deadline(self):
+        """Test a coalesced task gives up on its own deadline and can fall back"""
+        import asyncio
+        from djpaystack.deadline import paystack_deadline
+        from djpaystack.exceptions import PaystackTimeoutError
+        from djpaystack.singleflight import SingleFlight
+
+        flight = SingleFlight()
+
+        async def run():
+            release = asyncio.Event()
+
+            async def slow():
+                await release.wait()
+                raise PaystackTimeoutError('leader deadline')
+
+            async def own():
+                return 'own'
+
+            async def wait_briefly():
+                with paystack_deadline(0.05):
+                    return await flight.ado('key', own)
+
+            leader = asyncio.ensure_future(flight.ado('key', slow))
+            await asyncio.sleep(0)
+            with pytest.raises(PaystackTimeoutError):
+                await wait_briefly()
+
+            follower = asyncio.ensure_future(flight.ado('key', own))
+            await asyncio.sleep(0)
+            release.set()
+            with pytest.raises(PaystackTimeoutError):
+                await leader
+            return await follower
+
+        assert asyncio.run(run()) == 'own'
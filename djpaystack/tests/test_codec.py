@@ -0,0 +1,45 @@
+import json
+import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+from djpaystack import codec
+from djpaystack.exceptions import PaystackConfigurationError
+
+
+class TestCodec:
+    """Test pluggable JSON codec"""
+
+    @pytest.mark.parametrize('name', ['json', 'orjson'])
+    def test_round_trip(self, name):
+        """Test codecs produce equivalent JSON"""
+        if name == 'orjson':
+            pytest.importorskip('orjson')
+        selected = codec.CODECS[name]()
+        payload = {'amount': 50000, 'metadata': {'note': 'café', 1: True}}
+
+        encoded = selected.dumps(payload)
+        assert isinstance(encoded, bytes)
+        assert selected.loads(encoded) == {'amount': 50000, 'metadata': {'note': 'café', '1': True}}
+
+    def test_invalid_json_raises_value_error(self):
+        """Test every codec signals bad input with ValueError"""
+        for selected in (codec.JSONCodec(), codec.get_codec()):
+            with pytest.raises(ValueError):
+                selected.loads(b'{not json')
+
+    def test_missing_codec_falls_back(self):
+        """Test an uninstalled codec falls back to the standard library"""
+        with patch.object(codec.UjsonCodec, '__init__', side_effect=ImportError):
+            assert codec._build_codec('ujson').name == 'json'
+
+    def test_unknown_codec(self):
+        with pytest.raises(PaystackConfigurationError):
+            codec._build_codec('simplejson')
+
+    def test_jsonfield_encoder(self):
+        """Test the model encoder keeps DjangoJSONEncoder formatting"""
+        value = {'paid_at': datetime(2024, 1, 15, 12, tzinfo=timezone.utc), 'fee': Decimal('7.50')}
+        encoded = json.dumps(value, cls=codec.PaystackJSONEncoder)
+        assert json.loads(encoded) == {'paid_at': '2024-01-15T12:00:00Z', 'fee': '7.50'}
+        assert json.loads(encoded, cls=codec.PaystackJSONDecoder) == json.loads(encoded)
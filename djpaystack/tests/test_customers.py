@@ -1,4 +1,5 @@
 
+import json
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 from djpaystack.client import PaystackClient
@@ -27,7 +28,7 @@ class TestCustomerAPI:
 
         with patch.object(client.session, 'request') as mock_request:
             mock_response = Mock()
-            mock_response.json.return_value = mock_paystack_response
+            mock_response.content = json.dumps(mock_paystack_response).encode()
             mock_response.status_code = 200
             mock_request.return_value = mock_response
 
@@ -49,7 +50,7 @@ class TestCustomerAPI:
 
         with patch.object(client.session, 'request') as mock_request:
             mock_response = Mock()
-            mock_response.json.return_value = mock_paystack_response
+            mock_response.content = json.dumps(mock_paystack_response).encode()
             mock_response.status_code = 200
             mock_request.return_value = mock_response
 
@@ -0,0 +1,137 @@
+import asyncio
+import time
+import pytest
+import requests
+from unittest.mock import patch
+from djpaystack.deadline import endpoint_timeout, paystack_deadline, remaining
+from djpaystack.exceptions import PaystackTimeoutError
+from djpaystack.ratelimit import RateLimiter
+from djpaystack.settings import override_paystack_settings
+from djpaystack.tests.conftest import make_response
+
+
+class TestDeadlineContext:
+    """Test the deadline context manager"""
+
+    def test_no_deadline(self):
+        assert remaining() is None
+
+    def test_nested_deadlines_keep_the_earliest(self):
+        with paystack_deadline(1.0):
+            with paystack_deadline(10.0):
+                assert remaining() <= 1.0
+            with paystack_deadline(0.5):
+                assert remaining() <= 0.5
+            assert 0.5 < remaining() <= 1.0
+        assert remaining() is None
+
+    def test_deadline_is_task_local(self):
+        async def inner():
+            with paystack_deadline(1.0):
+                await asyncio.sleep(0)
+                return remaining()
+
+        async def run():
+            left, _ = await asyncio.gather(inner(), asyncio.sleep(0))
+            return left, remaining()
+
+        left, outside = asyncio.run(run())
+        assert left <= 1.0
+        assert outside is None
+
+
+class TestTimeoutProfiles:
+    """Test per endpoint family timeouts"""
+
+    def test_defaults(self):
+        with override_paystack_settings(TIMEOUT=30, CONNECT_TIMEOUT=5):
+            assert endpoint_timeout('customer/CUS_1') == (5, 30)
+
+    def test_connect_defaults_to_read(self):
+        with override_paystack_settings(TIMEOUT=30, CONNECT_TIMEOUT=None):
+            assert endpoint_timeout('customer/CUS_1') == (30, 30)
+
+    def test_family_profiles(self):
+        profiles = {'transaction/verify': (2, 5), 'bulkcharge': 120}
+        with override_paystack_settings(TIMEOUTS=profiles, TIMEOUT=30, CONNECT_TIMEOUT=3):
+            assert endpoint_timeout('transaction/verify/ref_1') == (2, 5)
+            assert endpoint_timeout('bulkcharge') == (3, 120)
+            assert endpoint_timeout('transaction') == (3, 30)
+
+    def test_capped_by_deadline(self):
+        with override_paystack_settings(TIMEOUT=30, CONNECT_TIMEOUT=5):
+            with paystack_deadline(1.0):
+                connect, read = endpoint_timeout('customer')
+        assert connect <= 1.0
+        assert read <= 1.0
+
+    def test_client_sends_profile_timeout(self, client):
+        with override_paystack_settings(TIMEOUTS={'customer': (2, 7)}):
+            with patch.object(client.session, 'request',
+                              return_value=make_response({'status': True, 'data': {}})) as mock_request:
+                client.customers.fetch('CUS_1')
+
+        assert mock_request.call_args[1]['timeout'] == (2, 7)
+
+
+class TestClientDeadline:
+    """Test deadlines bound total request time"""
+
+    def test_expired_deadline_fails_before_sending(self, client):
+        with patch.object(client.session, 'request') as mock_request:
+            with paystack_deadline(0):
+                with pytest.raises(PaystackTimeoutError):
+                    client.customers.fetch('CUS_1')
+
+        mock_request.assert_not_called()
+
+    def test_retries_stop_at_deadline(self, client):
+        client.retry_policy.base_delay = 0.3
+        client.retry_policy.max_delay = 0.3
+
+        with patch.object(client.session, 'request',
+                          return_value=make_response({'status': False, 'message': 'down'}, 503)) as mock_request:
+            start = time.monotonic()
+            with paystack_deadline(0.5):
+                with pytest.raises(Exception):
+                    client.customers.fetch('CUS_1')
+            elapsed = time.monotonic() - start
+
+        assert mock_request.call_count == 2
+        assert elapsed < 0.5
+
+    def test_timeout_at_deadline_raises_timeout_error(self, client):
+        def stall(*args, **kwargs):
+            time.sleep(kwargs['timeout'][1])
+            raise requests.exceptions.ReadTimeout('timed out')
+
+        with patch.object(client.session, 'request', side_effect=stall):
+            with paystack_deadline(0.2):
+                with pytest.raises(PaystackTimeoutError):
+                    client.customers.fetch('CUS_1')
+
+    def test_deadline_bounds_pagination(self, client):
+        calls = []
+
+        def respond(*args, **kwargs):
+            calls.append(1)
+            time.sleep(0.1)
+            return make_response({
+                'status': True,
+                'data': [{'id': len(calls)}],
+                'meta': {'page': len(calls), 'pageCount': 10},
+            })
+
+        with patch.object(client.session, 'request', side_effect=respond):
+            with paystack_deadline(0.25):
+                with pytest.raises(PaystackTimeoutError):
+                    list(client.customers.list.iter_items())
+
+        assert len(calls) < 10
+
+    def test_rate_limit_wait_respects_deadline(self):
+        limiter = RateLimiter({}, default=1, timeout=10)
+        limiter.acquire('customer')
+        with paystack_deadline(0.1):
+            with pytest.raises(PaystackTimeoutError):
+                limiter.acquire('customer')
@@ -0,0 +1,221 @@
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from djpaystack import PaystackClient
+from djpaystack.hedging import HedgePolicy, LatencyTracker
+from djpaystack.retry import RetryBudget
+from djpaystack.settings import override_paystack_settings
+from djpaystack.tests.conftest import make_response
+
+
+@pytest.fixture
+def client():
+    client = PaystackClient(secret_key='sk_test_xxxxx')
+    client.hedge_policy = HedgePolicy(families=['transaction/verify'], default_delay=0.05)
+    yield client
+    client.close()
+
+
+class TestLatencyTracker:
+    """Test latency percentiles"""
+
+    def test_percentile_needs_samples(self):
+        tracker = LatencyTracker()
+        for _ in range(5):
+            tracker.record('transaction', 0.1)
+        assert tracker.percentile('transaction', 95) is None
+
+    def test_percentile(self):
+        tracker = LatencyTracker()
+        for i in range(100):
+            tracker.record('transaction', i / 100)
+        assert tracker.percentile('transaction', 95) == 0.95
+        assert tracker.percentile('transaction', 50) == 0.5
+
+    def test_window_drops_old_samples(self):
+        tracker = LatencyTracker(window=20)
+        for _ in range(20):
+            tracker.record('transaction', 5.0)
+        for _ in range(20):
+            tracker.record('transaction', 0.1)
+        assert tracker.percentile('transaction', 95) == 0.1
+
+
+class TestHedgePolicy:
+    """Test which requests are hedged"""
+
+    def test_only_configured_gets_are_hedged(self):
+        policy = HedgePolicy(families=['transaction/verify'])
+        assert policy.family('GET', 'transaction/verify/ref_1') == 'transaction/verify'
+        assert policy.family('POST', 'transaction/verify/ref_1') is None
+        assert policy.family('GET', 'transaction/ref_1') is None
+        assert HedgePolicy().family('GET', 'transaction/verify/ref_1') is None
+
+    def test_delay_follows_observed_latency(self):
+        policy = HedgePolicy(families=['bank'], default_delay=1.0, min_delay=0.01)
+        assert policy.delay('bank') == 1.0
+        for _ in range(50):
+            policy.latency.record('bank', 0.2)
+        assert policy.delay('bank') == 0.2
+
+
+class TestHedgedRequests:
+    """Test hedged requests in the sync client"""
+
+    def test_fast_response_is_not_hedged(self, client):
+        with patch.object(client.session, 'request',
+                          return_value=make_response({'status': True, 'data': {}})) as mock_request:
+            client.transactions.verify('ref_1')
+
+        assert mock_request.call_count == 1
+        assert client.hedge_policy.stats.snapshot()['hedges'] == 0
+
+    def test_slow_primary_loses_to_hedge(self, client):
+        """Test the first answer wins when the primary is slow"""
+        calls = []
+
+        def respond(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(1.5)
+                return make_response({'status': True, 'data': {'attempt': 'primary'}})
+            return make_response({'status': True, 'data': {'attempt': 'hedge'}})
+
+        with patch.object(client.session, 'request', side_effect=respond):
+            start = time.monotonic()
+            response = client.transactions.verify('ref_1')
+            elapsed = time.monotonic() - start
+
+        assert response['data']['attempt'] == 'hedge'
+        assert elapsed < 1
+        stats = client.hedge_policy.stats.snapshot()
+        assert stats['hedges'] == 1
+        assert stats['hedge_wins'] == 1
+
+    def test_primary_answering_first_is_not_a_hedge_win(self, client):
+        """Test a hedge that loses the race is not counted as a win"""
+        calls = []
+
+        def respond(*args, **kwargs):
+            calls.append(1)
+            attempt = len(calls)
+            time.sleep(0.1 if attempt == 1 else 0.5)
+            return make_response({'status': True, 'data': {'attempt': attempt}})
+
+        with patch.object(client.session, 'request', side_effect=respond):
+            response = client.transactions.verify('ref_1')
+
+        assert response['data']['attempt'] == 1
+        stats = client.hedge_policy.stats.snapshot()
+        assert stats['hedges'] == 1
+        assert stats['hedge_wins'] == 0
+
+    def test_failed_attempt_waits_for_the_other(self, client):
+        import requests
+
+        calls = []
+
+        def respond(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                raise requests.exceptions.ConnectionError('reset')
+            time.sleep(0.3)
+            return make_response({'status': True, 'data': {'attempt': 'hedge'}})
+
+        with patch.object(client.session, 'request', side_effect=respond):
+            response = client.transactions.verify('ref_1')
+
+        assert response['data']['attempt'] == 'hedge'
+
+    def test_budget_caps_hedges(self, client):
+        client.hedge_policy.budget = RetryBudget(ratio=0, min_tokens=1)
+
+        def respond(*args, **kwargs):
+            time.sleep(0.1)
+            return make_response({'status': True, 'data': {}})
+
+        with patch.object(client.session, 'request', side_effect=respond) as mock_request:
+            client.transactions.verify('ref_1')
+            client.transactions.verify('ref_2')
+
+        stats = client.hedge_policy.stats.snapshot()
+        assert stats['hedges'] == 1
+        assert stats['budget_exhausted'] == 1
+        assert mock_request.call_count == 3
+
+
+    def test_hedge_needs_a_rate_limit_token(self, client):
+        """Test the hedge is not sent when the rate limiter has no capacity"""
+        def respond(*args, **kwargs):
+            time.sleep(0.2)
+            return make_response({'status': True, 'data': {}})
+
+        with override_paystack_settings(RATE_LIMITS={'transaction/verify': 1}), \
+                patch.object(client.session, 'request', side_effect=respond) as mock_request:
+            client.transactions.verify('ref_1')
+
+        assert mock_request.call_count == 1
+        stats = client.hedge_policy.stats.snapshot()
+        assert stats['hedges'] == 0
+        assert stats['refused'] == 1
+
+    def test_hedge_respects_half_open_breaker(self, client):
+        """Test the hedge is not sent alongside a half-open probe"""
+        from djpaystack.circuit_breaker import get_circuit_breaker, reset_circuit_breakers
+
+        def respond(*args, **kwargs):
+            time.sleep(0.2)
+            return make_response({'status': True, 'data': {}})
+
+        reset_circuit_breakers()
+        try:
+            with override_paystack_settings(CIRCUIT_BREAKER_ENABLED=True):
+                breaker = get_circuit_breaker('transaction/verify/ref_1')
+                breaker.state = breaker.OPEN
+                breaker._opened_at = time.monotonic() - breaker.recovery_timeout
+                with patch.object(client.session, 'request', side_effect=respond) as mock_request:
+                    client.transactions.verify('ref_1')
+        finally:
+            reset_circuit_breakers()
+
+        assert mock_request.call_count == 1
+        assert client.hedge_policy.stats.snapshot()['refused'] == 1
+
+
+class TestAsyncHedgedRequests:
+    """Test hedged requests in the async client"""
+
+    def test_slow_primary_is_cancelled(self):
+        pytest.importorskip('httpx')
+        from djpaystack import AsyncPaystackClient
+
+        async def run():
+            client = AsyncPaystackClient(secret_key='sk_test_xxxxx')
+            client.hedge_policy = HedgePolicy(families=['transaction/verify'], default_delay=0.05)
+            cancelled = []
+            calls = []
+
+            async def respond(*args, **kwargs):
+                calls.append(1)
+                if len(calls) == 1:
+                    try:
+                        await asyncio.sleep(5)
+                    except asyncio.CancelledError:
+                        cancelled.append(1)
+                        raise
+                return make_response({'status': True, 'data': {'attempt': len(calls)}})
+
+            with patch.object(client.session, 'request', side_effect=respond):
+                response = await client.transactions.verify('ref_1')
+                await asyncio.sleep(0)
+            with patch.object(client.hedge_policy, 'close') as close_policy:
+                await client.close()
+            return response, cancelled, close_policy
+
+        response, cancelled, close_policy = asyncio.run(run())
+        assert response['data']['attempt'] == 2
+        assert cancelled == [1]
+        close_policy.assert_called_once_with()
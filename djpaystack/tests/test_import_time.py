@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import pytest
+from djpaystack import PaystackClient
+from djpaystack.client import LazyNamespace
+
+
+def loaded_modules(code: str) -> set:
+    """Modules loaded by ``code`` in a fresh interpreter"""
+    script = f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    """Keep ``import djpaystack`` cheap"""
+
+    def test_import_loads_no_http_or_api_modules(self):
+        modules = loaded_modules('import djpaystack')
+        heavy = {'requests', 'httpx', 'urllib3', 'django.db', 'djpaystack.client', 'djpaystack.api'}
+        assert not heavy & modules
+
+    def test_lazy_attributes(self):
+        import djpaystack
+        from djpaystack import client, registry
+
+        assert djpaystack.PaystackClient is client.PaystackClient
+        assert djpaystack.get_client is registry.get_client
+        assert 'AsyncPaystackClient' in dir(djpaystack)
+        with pytest.raises(AttributeError):
+            djpaystack.NotAThing
+
+    def test_api_classes_are_lazy(self):
+        from djpaystack.api import TransactionAPI
+        from djpaystack.api.transactions import TransactionAPI as direct
+
+        assert TransactionAPI is direct
+
+
+class TestLazyNamespaces:
+    """Test API namespaces are built on first access"""
+
+    def test_namespace_is_built_once(self):
+        client = PaystackClient(secret_key='sk_test_xxxxx')
+        assert 'transactions' not in client.__dict__
+
+        transactions = client.transactions
+        assert client.transactions is transactions
+        assert transactions.client is client
+        assert isinstance(PaystackClient.transactions, LazyNamespace)
+
+    def test_client_construction_imports_no_api_modules(self):
+        code = (
+            "import django\n"
+            "from django.conf import settings\n"
+            "settings.configure(PAYSTACK={'SECRET_KEY': 'sk_test_xxxxx'})\n"
+            "django.setup()\n"
+            "from djpaystack import PaystackClient\n"
+            "PaystackClient().transactions\n"
+        )
+        api_modules = {m for m in loaded_modules(code) if m.startswith('djpaystack.api.')}
+        assert 'djpaystack.api.transactions' in api_modules
+        assert 'djpaystack.api.customers' not in api_modules
@@ -0,0 +1,162 @@
+import json
+import pytest
+import requests
+from unittest.mock import patch
+from django.http import Http404
+from django.test import RequestFactory
+from djpaystack.exceptions import PaystackAPIError, PaystackNetworkError
+from djpaystack.instrumentation import (
+    MetricsCollector,
+    RequestHook,
+    endpoint_template,
+    register_hook,
+    unregister_hook,
+)
+from djpaystack.settings import override_paystack_settings
+from djpaystack.views import paystack_metrics
+from djpaystack.tests.conftest import make_response
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, call):
+        self.events.append(('before', call.template))
+
+    def after_response(self, call):
+        self.events.append(('after', call.template, call.status, call.attempts, call.response_bytes))
+
+    def on_error(self, call):
+        self.events.append(('error', call.template, call.status, call.attempts, type(call.error)))
+
+
+@pytest.fixture
+def hook():
+    hook = RecordingHook()
+    register_hook(hook)
+    yield hook
+    unregister_hook(hook)
+
+
+class TestEndpointTemplate:
+    """Test endpoint normalization"""
+
+    @pytest.mark.parametrize('endpoint,template', [
+        ('transaction/verify/ref_123', 'transaction/verify/{reference}'),
+        ('/customer/CUS_abc123/', 'customer/{code}'),
+        ('customer/jane@example.com', 'customer/{code}'),
+        ('transaction/4099260516/timeline', 'transaction/{id}/timeline'),
+        ('decision/bin/539983', 'decision/bin/{bin}'),
+        ('bank/resolve?account_number=0001234567', 'bank/resolve'),
+        ('transaction/initialize', 'transaction/initialize'),
+        ('/page/my-slug', 'page/{id}'),
+        ('page/summer_sale', 'page/{id}'),
+        ('page/check_slug_availability/summer_sale', 'page/check_slug_availability/{slug}'),
+        ('/transaction/verify/abcref', 'transaction/verify/{reference}'),
+        ('transaction/timeline/abcref', 'transaction/timeline/{id}'),
+        ('subscription/sub_code/manage/link', 'subscription/{code}/manage/link'),
+        ('refund/abcref', 'refund/{id}'),
+    ])
+    def test_templates(self, endpoint, template):
+        assert endpoint_template(endpoint) == template
+
+
+class TestHooks:
+    """Test hook dispatch from the client"""
+
+    def test_successful_request(self, client, hook):
+        with patch.object(client.session, 'request',
+                          return_value=make_response({'status': True, 'data': {}})):
+            client.transactions.verify('ref_1')
+
+        size = len(json.dumps({'status': True, 'data': {}}))
+        assert hook.events == [
+            ('before', 'transaction/verify/{reference}'),
+            ('after', 'transaction/verify/{reference}', 200, 1, size),
+        ]
+
+    def test_api_error_reports_status(self, client, hook):
+        with patch.object(client.session, 'request',
+                          return_value=make_response({'status': False, 'message': 'Not found'}, 404)):
+            with pytest.raises(PaystackAPIError):
+                client.customers.fetch('CUS_missing')
+
+        assert hook.events[-1] == ('error', 'customer/{code}', 404, 1, PaystackAPIError)
+
+    def test_attempts_include_retries(self, client, hook):
+        responses = [
+            make_response({'status': False, 'message': 'down'}, 503),
+            make_response({'status': True, 'data': {}}),
+        ]
+        with patch.object(client.session, 'request', side_effect=responses):
+            client.customers.fetch('CUS_1')
+
+        assert hook.events[-1][3] == 2
+
+    def test_network_error(self, client, hook):
+        client.retry_policy.max_retries = 0
+        with patch.object(client.session, 'request',
+                          side_effect=requests.exceptions.ConnectionError('reset')):
+            with pytest.raises(PaystackNetworkError):
+                client.customers.fetch('CUS_1')
+
+        assert hook.events[-1] == ('error', 'customer/{code}', None, 1, PaystackNetworkError)
+
+    def test_failing_hook_does_not_break_requests(self, client):
+        class Broken(RequestHook):
+            def before_request(self, call):
+                raise RuntimeError('boom')
+
+        broken = Broken()
+        register_hook(broken)
+        try:
+            with patch.object(client.session, 'request',
+                              return_value=make_response({'status': True, 'data': {}})):
+                assert client.customers.fetch('CUS_1')['status'] is True
+        finally:
+            unregister_hook(broken)
+
+
+class TestMetricsCollector:
+    """Test metrics collection and Prometheus export"""
+
+    def test_render(self, client):
+        collector = MetricsCollector(buckets=(0.1, 1.0))
+        register_hook(collector)
+        try:
+            with patch.object(client.session, 'request',
+                              return_value=make_response({'status': True, 'data': {}})):
+                client.transactions.verify('ref_1')
+                client.transactions.verify('ref_2')
+            with patch.object(client.session, 'request',
+                              return_value=make_response({'status': False, 'message': 'no'}, 400)):
+                with pytest.raises(PaystackAPIError):
+                    client.transactions.verify('ref_3')
+        finally:
+            unregister_hook(collector)
+
+        text = collector.render()
+        labels = 'method="GET",endpoint="transaction/verify/{reference}"'
+        assert f'paystack_requests_total{{{labels},status="200"}} 2' in text
+        assert f'paystack_requests_total{{{labels},status="400"}} 1' in text
+        assert f'paystack_request_errors_total{{{labels},error="PaystackAPIError"}} 1' in text
+        assert f'paystack_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+        assert f'paystack_request_duration_seconds_count{{{labels}}} 3' in text
+        assert 'paystack_requests_in_flight 0' in text
+        assert '# TYPE paystack_pool_connections_in_use gauge' in text
+
+    def test_metrics_view(self):
+        factory = RequestFactory()
+
+        with override_paystack_settings(METRICS_ENABLED=False):
+            with pytest.raises(Http404):
+                paystack_metrics(factory.get('/metrics/'))
+
+        with override_paystack_settings(METRICS_ENABLED=True, METRICS_TOKEN='s3cret'):
+            assert paystack_metrics(factory.get('/metrics/')).status_code == 401
+            response = paystack_metrics(factory.get('/metrics/', HTTP_AUTHORIZATION='Bearer s3cret'))
+
+        assert response.status_code == 200
+        assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+        assert b'# TYPE paystack_requests_total counter' in response.content
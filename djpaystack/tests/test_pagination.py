@@ -0,0 +1,267 @@
+import json
+import pytest
+from unittest.mock import Mock, patch
+from djpaystack import PaystackClient
+
+
+def page_responses(page_count, per_page=2):
+    """Build a side_effect returning successive mock pages"""
+    def request(method, url, params=None, **kwargs):
+        page = params['page']
+        response = Mock()
+        response.status_code = 200
+        response.content = json.dumps({
+            'status': True,
+            'data': [{'id': page * 100 + i} for i in range(per_page)],
+            'meta': {'page': page, 'pageCount': page_count},
+        }).encode()
+        return response
+    return request
+
+
+class TestStreamingPagination:
+    """Test iter_pages / iter_items on list methods"""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client"""
+        return PaystackClient(secret_key='sk_test_xxxxx')
+
+    def test_list_still_accumulates(self, client):
+        """Test calling the list method keeps its behaviour"""
+        with patch.object(client.session, 'request', side_effect=page_responses(3)):
+            response = client.transactions.list(per_page=2)
+
+        assert response['status'] is True
+        assert len(response['data']) == 6
+
+    def test_iter_items_streams_lazily(self, client):
+        """Test records are yielded as pages arrive and iteration can stop early"""
+        with patch.object(client.session, 'request', side_effect=page_responses(400)) as mock_request:
+            items = client.transactions.list.iter_items(per_page=2, status='success')
+            assert mock_request.call_count == 0
+
+            first_three = [next(items)['id'] for _ in range(3)]
+
+        assert first_three == [100, 101, 200]
+        assert mock_request.call_count == 2
+        assert mock_request.call_args[1]['params']['status'] == 'success'
+
+    def test_iter_pages_reports_progress(self, client):
+        """Test progress callback receives page N of pageCount"""
+        progress = []
+
+        with patch.object(client.session, 'request', side_effect=page_responses(3)):
+            pages = list(client.customers.list.iter_pages(
+                per_page=2, progress=lambda page, count: progress.append((page, count))))
+
+        assert len(pages) == 3
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    def test_iter_pages_starts_at_page(self, client):
+        """Test page argument sets the first page"""
+        with patch.object(client.session, 'request', side_effect=page_responses(3)):
+            ids = [item['id'] for item in client.settlements.fetch_transactions.iter_items(
+                'SET_xxxxx', per_page=2, page=3)]
+
+        assert ids == [300, 301]
+
+
+class TestConcurrentPagination:
+    """Test concurrent page fetching"""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client"""
+        return PaystackClient(secret_key='sk_test_xxxxx')
+
+    def test_ordered_concurrent_pages(self, client):
+        """Test concurrent mode keeps records in page order"""
+        with patch.object(client.session, 'request', side_effect=page_responses(20)) as mock_request:
+            ids = [item['id'] for item in client.transfers.list.iter_items(per_page=2, workers=4)]
+
+        assert ids == [page * 100 + i for page in range(1, 21) for i in range(2)]
+        assert mock_request.call_count == 20
+
+    def test_unordered_concurrent_pages(self, client):
+        """Test unordered mode yields every page exactly once"""
+        progress = []
+
+        with patch.object(client.session, 'request', side_effect=page_responses(10)):
+            pages = list(client.customers.list.iter_pages(
+                per_page=2, workers=3, ordered=False,
+                progress=lambda page, count: progress.append(page)))
+
+        assert len(pages) == 10
+        assert sorted(progress) == list(range(1, 11))
+
+    def test_concurrent_early_termination(self, client):
+        """Test closing the iterator stops scheduling pages"""
+        with patch.object(client.session, 'request', side_effect=page_responses(400)) as mock_request:
+            items = client.transactions.list.iter_items(per_page=2, workers=2)
+            next(items)
+            items.close()
+
+        assert mock_request.call_count <= 1 + 2 * 2
+
+
+def cursor_responses(cursors):
+    """Build a side_effect for a cursor listing; cursors maps token -> next token"""
+    def request(method, url, params=None, **kwargs):
+        current = params.get('next', 'start')
+        response = Mock()
+        response.status_code = 200
+        response.content = json.dumps({
+            'status': True,
+            'data': [{'id': current}],
+            'meta': {'next': cursors[current], 'previous': None, 'perPage': 1},
+        }).encode()
+        return response
+    return request
+
+
+class TestCursorPagination:
+    """Test use_cursor listings"""
+
+    CURSORS = {'start': 'c2', 'c2': 'c3', 'c3': None}
+
+    @pytest.fixture
+    def client(self):
+        """Create test client"""
+        return PaystackClient(secret_key='sk_test_xxxxx')
+
+    def test_list_follows_next_cursor(self, client):
+        """Test fetch-all follows meta.next instead of page offsets"""
+        with patch.object(client.session, 'request',
+                          side_effect=cursor_responses(self.CURSORS)) as mock_request:
+            response = client.miscellaneous.list_banks(use_cursor=True, per_page=1)
+
+        assert [bank['id'] for bank in response['data']] == ['start', 'c2', 'c3']
+        assert all('page' not in call[1]['params'] for call in mock_request.call_args_list)
+
+    def test_resume_from_cursor(self, client):
+        """Test an interrupted walk resumes from a saved token"""
+        from djpaystack.api.base import next_cursor
+
+        with patch.object(client.session, 'request', side_effect=cursor_responses(self.CURSORS)):
+            pages = client.apple_pay.list_domains.iter_pages(use_cursor=True, per_page=1)
+            token = next_cursor(next(pages))
+            pages.close()
+
+            resumed = list(client.apple_pay.list_domains.iter_items(
+                use_cursor=True, per_page=1, cursor=token))
+
+        assert token == 'c2'
+        assert [domain['id'] for domain in resumed] == ['c2', 'c3']
+
+
+class TestShardedFetch:
+    """Test date-window sharded fetching"""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client"""
+        return PaystackClient(secret_key='sk_test_xxxxx')
+
+    def test_windows_are_split_merged_and_deduplicated(self, client):
+        """Test dense windows are subdivided and overlapping records yielded once"""
+        requested = []
+
+        def request(method, url, params=None, **kwargs):
+            window = (params['from'], params['to'])
+            requested.append(window)
+            # The second day is too dense until it is split into half days
+            dense = window == ('2024-01-02T00:00:00.000Z', '2024-01-03T00:00:00.000Z')
+            response = Mock()
+            response.status_code = 200
+            response.content = json.dumps({
+                'status': True,
+                'data': [{'id': params['from']}, {'id': 'boundary'}],
+                'meta': {'pageCount': 50 if dense else 1},
+            }).encode()
+            return response
+
+        with patch.object(client.session, 'request', side_effect=request):
+            ids = [txn['id'] for txn in client.transactions.list.iter_sharded(
+                from_date='2024-01-01', to_date='2024-01-04', max_pages=10, status='success')]
+
+        assert ids == [
+            '2024-01-01T00:00:00.000Z', 'boundary',
+            '2024-01-02T00:00:00.000Z',
+            '2024-01-02T12:00:00.000Z',
+            '2024-01-03T00:00:00.000Z',
+        ]
+        assert len(requested) == 5
+
+    def test_window_is_sent_as_from_and_to(self, client):
+        """Test each shard filters with Paystack's from/to query params"""
+        sent = []
+
+        def request(method, url, params=None, **kwargs):
+            sent.append(dict(params))
+            response = Mock()
+            response.status_code = 200
+            response.content = json.dumps({'status': True, 'data': [], 'meta': {'pageCount': 1}}).encode()
+            return response
+
+        with patch.object(client.session, 'request', side_effect=request):
+            list(client.transactions.list.iter_sharded(
+                from_date='2024-01-01', to_date='2024-01-03', status='success', per_page=100))
+
+        # Shards are fetched concurrently, so requests arrive in any order
+        assert sorted(sent, key=lambda params: params['from']) == [
+            {'status': 'success', 'from': '2024-01-01T00:00:00.000Z', 'to': '2024-01-02T00:00:00.000Z',
+             'perPage': 100, 'page': 1},
+            {'status': 'success', 'from': '2024-01-02T00:00:00.000Z', 'to': '2024-01-03T00:00:00.000Z',
+             'perPage': 100, 'page': 1},
+        ]
+
+    def test_split_stops_when_halves_do_not_shrink(self, client):
+        """Test a window whose halves report the same page count is not split further"""
+        sent = []
+
+        def request(method, url, params=None, **kwargs):
+            sent.append((params['from'], params['page']))
+            response = Mock()
+            response.status_code = 200
+            response.content = json.dumps({
+                'status': True, 'data': [{'id': f"{params['from']}-{params['page']}"}],
+                'meta': {'pageCount': 12},
+            }).encode()
+            return response
+
+        with patch.object(client.session, 'request', side_effect=request):
+            records = list(client.transactions.list.iter_sharded(
+                from_date='2024-01-01', to_date='2024-01-02', max_pages=10))
+
+        # One split into halves, each then walked through its 12 pages
+        assert sorted(p for p in sent if p[1] == 1) == [
+            ('2024-01-01T00:00:00.000Z', 1),
+            ('2024-01-01T00:00:00.000Z', 1),
+            ('2024-01-01T12:00:00.000Z', 1),
+        ]
+        assert len(records) == 24
+
+    def test_shards_run_in_callers_context(self, client):
+        """Test shard workers see the caller's deadline"""
+        from djpaystack.deadline import paystack_deadline, remaining
+        seen = []
+
+        def request(method, url, params=None, **kwargs):
+            seen.append(remaining())
+            response = Mock()
+            response.status_code = 200
+            response.content = json.dumps({'status': True, 'data': [], 'meta': {'pageCount': 1}}).encode()
+            return response
+
+        with patch.object(client.session, 'request', side_effect=request), paystack_deadline(30):
+            list(client.transactions.list.iter_sharded(from_date='2024-01-01', to_date='2024-01-03'))
+
+        assert len(seen) == 2 and all(left is not None for left in seen)
+
+    def test_invalid_range(self, client):
+        """Test an empty range is rejected"""
+        from djpaystack.exceptions import PaystackValidationError
+
+        with pytest.raises(PaystackValidationError):
+            client.transfers.list.iter_sharded(from_date='2024-01-02', to_date='2024-01-01')
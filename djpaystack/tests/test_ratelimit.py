@@ -0,0 +1,101 @@
+import pytest
+from unittest.mock import patch
+from djpaystack.endpoints import endpoint_family
+from djpaystack.exceptions import PaystackRateLimitError
+from djpaystack.ratelimit import CacheWindowCounter, TokenBucket, RateLimiter
+
+
+class TestEndpointFamily:
+    """Test endpoint family matching"""
+
+    def test_longest_configured_prefix_wins(self):
+        families = ['transaction', 'transaction/verify', 'transfer']
+        assert endpoint_family('transaction/verify/ref_1', families) == 'transaction/verify'
+        assert endpoint_family('/transaction/ref_1', families) == 'transaction'
+        assert endpoint_family('transferrecipient', families) == 'transferrecipient'
+
+    def test_defaults_to_first_segment(self):
+        assert endpoint_family('customer/CUS_xxxxx') == 'customer'
+
+
+class TestRateLimiter:
+    """Test client-side rate limiter"""
+
+    def test_token_bucket_burst_then_wait(self):
+        """Test tokens beyond capacity must wait for refill"""
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(0.1, abs=0.02)
+
+    def test_fail_fast_per_family(self):
+        """Test families are limited independently and fail fast with timeout 0"""
+        limiter = RateLimiter({'transfer': 1}, default=100, timeout=0)
+
+        limiter.acquire('transfer')
+        limiter.acquire('transaction/verify/ref_1')
+
+        with pytest.raises(PaystackRateLimitError) as exc_info:
+            limiter.acquire('transfer/finalize_transfer')
+        assert exc_info.value.retry_after > 0
+
+    def test_blocking_acquire_waits(self):
+        """Test blocking mode sleeps until capacity frees up"""
+        limiter = RateLimiter({}, default=1, timeout=5)
+
+        with patch('djpaystack.ratelimit.time.sleep') as mock_sleep:
+            limiter.acquire('customer')
+            with patch.object(TokenBucket, 'try_acquire', side_effect=[0.5, 0.0]):
+                limiter.acquire('customer')
+
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_cache_backend_shares_window(self):
+        """Test the cache backend counts requests across limiter instances"""
+        from django.core.cache import cache
+        cache.clear()
+
+        first = RateLimiter({'bank': 2}, backend='cache', timeout=0)
+        second = RateLimiter({'bank': 2}, backend='cache', timeout=0)
+
+        with patch('djpaystack.ratelimit.time.time', return_value=1000.25):
+            first.acquire('bank/resolve')
+            second.acquire('bank/resolve')
+            with pytest.raises(PaystackRateLimitError):
+                first.acquire('bank/resolve')
+
+    def test_cache_backend_fractional_rate(self):
+        """Test a rate below one per second admits one request per longer window"""
+        from django.core.cache import cache
+        cache.clear()
+
+        limiter = RateLimiter({'transfer': 0.5}, backend='cache', timeout=0)
+
+        with patch('djpaystack.ratelimit.time.time', return_value=1000.5):
+            limiter.acquire('transfer')
+            with pytest.raises(PaystackRateLimitError) as exc_info:
+                limiter.acquire('transfer')
+        assert exc_info.value.retry_after == pytest.approx(1.5)
+
+        with patch('djpaystack.ratelimit.time.time', return_value=1002.0):
+            limiter.acquire('transfer')
+
+    def test_cache_backend_async_runs_off_the_loop(self):
+        """Test acquire_async does not make cache calls on the event loop thread"""
+        import asyncio
+        import threading
+        from django.core.cache import cache
+        cache.clear()
+
+        limiter = RateLimiter({'bank': 2}, backend='cache', timeout=0)
+        threads = []
+        original = CacheWindowCounter.try_acquire
+
+        def record_thread(self):
+            threads.append(threading.current_thread())
+            return original(self)
+
+        with patch.object(CacheWindowCounter, 'try_acquire', record_thread):
+            asyncio.run(limiter.acquire_async('bank/resolve'))
+
+        assert threads and threads[0] is not threading.main_thread()
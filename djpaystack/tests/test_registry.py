@@ -0,0 +1,43 @@
+import os
+import pytest
+from unittest.mock import patch
+from djpaystack import registry
+from djpaystack.registry import get_client, close_clients
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    close_clients()
+    yield
+    close_clients()
+
+
+class TestClientRegistry:
+    """Test process-wide client registry"""
+
+    def test_reuses_client_per_key(self):
+        """Test one client is shared per secret key"""
+        assert get_client() is get_client()
+        assert get_client('sk_test_other') is not get_client()
+        assert get_client('sk_test_other').secret_key == 'sk_test_other'
+
+    def test_close_clients(self):
+        """Test closing forgets and closes every client"""
+        client = get_client()
+        with patch.object(client.session, 'close') as mock_close:
+            close_clients()
+        mock_close.assert_called_once()
+        assert get_client() is not client
+
+    def test_forked_child_gets_new_client(self):
+        """Test clients inherited across a fork are not reused"""
+        client = get_client()
+        registry._pid = os.getpid() + 1
+        assert get_client() is not client
+        assert registry._pid == os.getpid()
+
+    def test_pool_settings(self):
+        """Test HTTPAdapter pool is sized from settings"""
+        adapter = get_client().session.get_adapter('https://api.paystack.co')
+        assert adapter._pool_maxsize == 10
+        assert adapter._pool_block is False
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import time
+import pytest
+import requests
+from unittest.mock import patch
+from djpaystack.exceptions import PaystackAPIError
+from djpaystack.response_cache import response_cache, invalidate_for_event
+from djpaystack.settings import override_paystack_settings, paystack_settings
+from djpaystack.tests.conftest import make_response
+
+
+def advance_clock(seconds):
+    """Pretend ``seconds`` have passed"""
+    return patch('djpaystack.response_cache.time.time', return_value=time.time() + seconds)
+
+
+class TestResponseCache:
+    """Test read-through response cache"""
+
+    def test_read_through(self, client):
+        """Test repeated calls are served from cache"""
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response({'status': True, 'data': [{'name': 'Nigeria'}]})
+            first = client.miscellaneous.list_countries()
+            second = client.miscellaneous.list_countries()
+
+        assert first == second
+        assert mock_request.call_count == 1
+        stats = response_cache.stats.snapshot()
+        assert stats['misses'] == 1
+        assert stats['local_hits'] == 1
+
+        response_cache.clear_local()
+        with patch.object(client.session, 'request') as mock_request:
+            client.miscellaneous.list_countries()
+        mock_request.assert_not_called()
+        assert response_cache.stats.snapshot()['shared_hits'] == 1
+
+    def test_hits_are_copies(self, client):
+        """Test mutating a returned response leaves the cached one intact"""
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response({'status': True, 'data': [{'name': 'Nigeria'}]})
+            client.miscellaneous.list_countries()['data'].append({'name': 'Ghana'})
+            client.miscellaneous.list_countries()['data'][0]['name'] = 'Kenya'
+            third = client.miscellaneous.list_countries()
+
+        assert mock_request.call_count == 1
+        assert third['data'] == [{'name': 'Nigeria'}]
+
+    def test_params_and_uncached_methods(self, client):
+        """Test params are part of the key and other methods bypass the cache"""
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response({'status': True, 'data': []})
+            client.miscellaneous.list_states(country=1)
+            client.miscellaneous.list_states(country=2)
+            client.miscellaneous.list_states(country=1)
+            client.miscellaneous.list_providers()
+            client.miscellaneous.list_providers()
+
+        assert mock_request.call_count == 4
+
+    def test_write_invalidates(self, client):
+        """Test plan writes drop cached plans"""
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response({'status': True, 'data': {'plan_code': 'PLN_1'}})
+            client.plans.fetch('PLN_1')
+            client.plans.update('PLN_1', name='Gold')
+            client.plans.fetch('PLN_1')
+
+        assert mock_request.call_count == 3
+
+    def test_webhook_invalidates(self, client):
+        """Test mapped webhook events drop cached namespaces"""
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response({'status': True, 'data': {}})
+            client.products.fetch('1')
+            invalidate_for_event('charge.success')
+            client.products.fetch('1')
+            invalidate_for_event('product.update')
+            client.products.fetch('1')
+
+        assert mock_request.call_count == 2
+
+    def test_stale_while_revalidate(self, client):
+        """Test stale entries are served while refreshed in the background"""
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response({'status': True, 'data': 'old'})
+            client.dedicated_accounts.available_providers()
+
+        with advance_clock(paystack_settings.CACHE_TIMEOUT + 1), \
+                patch.object(client.session, 'request') as mock_request, \
+                patch('djpaystack.response_cache.threading.Thread') as mock_thread:
+            mock_request.return_value = make_response({'status': True, 'data': 'new'})
+            assert client.dedicated_accounts.available_providers()['data'] == 'old'
+            target = mock_thread.call_args.kwargs['target']
+            target(*mock_thread.call_args.kwargs['args'])
+
+            assert client.dedicated_accounts.available_providers()['data'] == 'new'
+
+        stats = response_cache.stats.snapshot()
+        assert stats['stale_served'] == 1
+        assert stats['refreshes'] == 1
+
+    def test_stale_if_error(self, client):
+        """Test expired entries are served when Paystack fails"""
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response({'status': True, 'data': 'cached'})
+            client.plans.fetch('PLN_1')
+
+        expired = paystack_settings.CACHE_TIMEOUT + paystack_settings.CACHE_STALE_TIMEOUT + 1
+        with advance_clock(expired), \
+                override_paystack_settings(MAX_RETRIES=0), \
+                patch.object(client.session, 'request') as mock_request:
+            mock_request.side_effect = requests.exceptions.ConnectionError('down')
+            assert client.plans.fetch('PLN_1')['data'] == 'cached'
+
+            mock_request.side_effect = None
+            mock_request.return_value = make_response({'status': False, 'message': 'Plan not found'}, 404)
+            with pytest.raises(PaystackAPIError):
+                client.plans.fetch('PLN_1')
+
+        assert response_cache.stats.snapshot()['stale_if_error'] == 1
+
+    def test_streamed_pages_use_the_cache(self, client):
+        """Test iter_pages/iter_items of a @cached listing read through the cache"""
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response(
+                {'status': True, 'data': [{'name': 'Bank'}], 'meta': {'pageCount': 1}})
+            client.miscellaneous.list_banks()
+            items = list(client.miscellaneous.list_banks.iter_items())
+            pages = list(client.miscellaneous.list_banks.iter_pages(workers=2))
+
+        assert mock_request.call_count == 1
+        assert items == [{'name': 'Bank'}]
+        assert pages[0]['data'] == [{'name': 'Bank'}]
+        assert response_cache.stats.snapshot()['local_hits'] == 2
+
+    def test_async_client(self):
+        """Test async clients read through the cache, including paginated lists"""
+        httpx = pytest.importorskip('httpx')
+        from djpaystack import AsyncPaystackClient
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={'status': True, 'data': [{'name': 'Bank'}],
+                                             'meta': {'pageCount': 1}})
+
+        async def run():
+            async with AsyncPaystackClient(secret_key='sk_test_xxxxx') as client:
+                client.session._transport = httpx.MockTransport(handler)
+                await client.miscellaneous.list_banks()
+                items = [item async for item in client.miscellaneous.list_banks.iter_items()]
+                assert items == [{'name': 'Bank'}]
+                return await client.miscellaneous.list_banks()
+
+        result = asyncio.run(run())
+        assert result['data'] == [{'name': 'Bank'}]
+        assert calls == ['/bank']
+
+
+    def test_async_refresh_task_is_kept(self):
+        """Test async stale hits keep a reference to their refresh task until it finishes"""
+        httpx = pytest.importorskip('httpx')
+        from djpaystack import AsyncPaystackClient
+
+        bodies = iter(['old', 'new'])
+
+        def handler(request):
+            return httpx.Response(200, json={'status': True, 'data': next(bodies)})
+
+        async def run():
+            async with AsyncPaystackClient(secret_key='sk_test_xxxxx') as client:
+                client.session._transport = httpx.MockTransport(handler)
+                await client.dedicated_accounts.available_providers()
+                with advance_clock(paystack_settings.CACHE_TIMEOUT + 1):
+                    stale = await client.dedicated_accounts.available_providers()
+                    tasks = set(response_cache._refresh_tasks)
+                    await asyncio.gather(*tasks)
+                return stale, tasks
+
+        stale, tasks = asyncio.run(run())
+        assert stale['data'] == 'old'
+        assert len(tasks) == 1
+        assert not response_cache._refresh_tasks
+        assert response_cache.stats.snapshot()['refreshes'] == 1
+
+class TestWarmCacheCommand:
+    """Test the paystack_warm_cache command"""
+
+    def test_force_invalidates_only_warmed_namespaces(self, client):
+        from io import StringIO
+        from django.core.management import call_command
+
+        with patch('djpaystack.management.commands.paystack_warm_cache.get_client',
+                   return_value=client), \
+                patch.object(response_cache, 'invalidate') as invalidate, \
+                patch.object(client.session, 'request',
+                             return_value=make_response({'status': True, 'data': []})):
+            call_command('paystack_warm_cache', '--force', stdout=StringIO())
+
+        invalidate.assert_called_once_with('bank', 'country', 'dedicated_account_provider')
@@ -0,0 +1,129 @@
+import json
+import pytest
+import requests
+import urllib3
+from unittest.mock import Mock, patch
+from djpaystack import PaystackClient
+from djpaystack.exceptions import PaystackAPIError, PaystackNetworkError
+from djpaystack.retry import RetryPolicy, RetryBudget
+
+
+def make_response(status_code, body=None, headers=None):
+    """Build a mock HTTP response"""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(body or {'status': status_code < 400, 'message': 'x'}).encode()
+    return response
+
+
+class TestRetryPolicy:
+    """Test retry engine"""
+
+    def make_client(self, **policy_kwargs):
+        policy_kwargs.setdefault('base_delay', 0)
+        return PaystackClient(secret_key='sk_test_xxxxx', retry_policy=RetryPolicy(**policy_kwargs))
+
+    def test_get_retried_on_server_error(self):
+        """Test idempotent requests are retried until success"""
+        client = self.make_client()
+
+        with patch.object(client.session, 'request', side_effect=[
+            make_response(503), make_response(502), make_response(200),
+        ]) as mock_request:
+            response = client.transactions.verify('test_ref_123')
+
+        assert response['status'] is True
+        assert mock_request.call_count == 3
+        assert client.retry_policy.stats.snapshot()['retries'] == 2
+
+    def test_post_without_idempotency_not_retried(self):
+        """Test a POST that could be duplicated is not retried"""
+        client = self.make_client()
+
+        with patch.object(client.session, 'request', return_value=make_response(503)) as mock_request:
+            with pytest.raises(PaystackAPIError):
+                client.transfers.initiate(source='balance', amount=100, recipient='RCP_xxxxx')
+
+        assert mock_request.call_count == 1
+        assert client.retry_policy.stats.snapshot()['unsafe_not_retried'] == 1
+
+    def test_post_with_reference_retried(self):
+        """Test POSTs protected by a reference or an opted-in endpoint are retried"""
+        client = self.make_client(safe_post_endpoints=['customer'])
+
+        with patch.object(client.session, 'request', side_effect=[
+            make_response(500), make_response(200),
+            make_response(500), make_response(200),
+        ]) as mock_request:
+            client.transactions.initialize(email='test@example.com', amount=100, reference='ref_1')
+            client.post('customer', data={'email': 'test@example.com'}, idempotency_key='key-1')
+
+        assert mock_request.call_count == 4
+        assert mock_request.call_args[1]['headers']['Idempotency-Key'] == 'key-1'
+
+    def test_idempotency_key_alone_not_retried(self):
+        """Test an Idempotency-Key header does not make a POST retryable"""
+        client = self.make_client()
+
+        with patch.object(client.session, 'request', return_value=make_response(503)) as mock_request:
+            with pytest.raises(PaystackAPIError):
+                client.post('customer', data={'email': 'test@example.com'}, idempotency_key='key-1')
+
+        assert mock_request.call_count == 1
+        assert client.retry_policy.stats.snapshot()['unsafe_not_retried'] == 1
+
+    @pytest.mark.parametrize('error', [
+        requests.exceptions.ConnectTimeout('timeout'),
+        requests.exceptions.ConnectionError(urllib3.exceptions.MaxRetryError(
+            None, '/transfer', urllib3.exceptions.NewConnectionError(None, 'refused'))),
+    ])
+    def test_unsent_request_retried_for_post(self, error):
+        """Test a request that never reached Paystack is always retried"""
+        client = self.make_client()
+
+        with patch.object(client.session, 'request', side_effect=[error, make_response(200)]):
+            assert client.transfers.initiate(
+                source='balance', amount=100, recipient='RCP_xxxxx')['status'] is True
+
+    def test_dropped_connection_not_retried_for_post(self):
+        """Test a connection lost after sending may have reached Paystack"""
+        client = self.make_client()
+        error = requests.exceptions.ConnectionError(
+            urllib3.exceptions.ProtocolError('Connection aborted.'))
+
+        with patch.object(client.session, 'request', side_effect=error) as mock_request:
+            with pytest.raises(PaystackNetworkError):
+                client.transfers.initiate(source='balance', amount=100, recipient='RCP_xxxxx')
+
+        assert mock_request.call_count == 1
+
+    def test_budget_limits_retries(self):
+        """Test retries stop once the budget is spent"""
+        client = self.make_client(budget=RetryBudget(ratio=0, min_tokens=1))
+
+        with patch.object(client.session, 'request', return_value=make_response(503)) as mock_request:
+            with pytest.raises(PaystackAPIError):
+                client.transactions.verify('test_ref_123')
+
+        assert mock_request.call_count == 2
+        assert client.retry_policy.stats.snapshot()['budget_exhausted'] == 1
+
+    def test_deadline_caps_retry_after(self):
+        """Test Retry-After beyond the deadline is not waited for"""
+        client = self.make_client(deadline=5)
+
+        with patch.object(client.session, 'request',
+                          return_value=make_response(429, headers={'Retry-After': '30'})):
+            with pytest.raises(PaystackAPIError):
+                client.transactions.verify('test_ref_123')
+
+        assert client.retry_policy.stats.snapshot()['deadline_exceeded'] == 1
+
+    def test_decorrelated_jitter_bounds(self):
+        """Test backoff stays within base and max delay"""
+        policy = RetryPolicy(base_delay=0.5, max_delay=4)
+        delay = 0.0
+        for _ in range(20):
+            delay = policy.backoff(delay)
+            assert 0.5 <= delay <= 4
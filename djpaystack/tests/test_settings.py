@@ -0,0 +1,85 @@
+import ipaddress
+import pytest
+from django.conf import settings
+from djpaystack.exceptions import PaystackConfigurationError
+from djpaystack.settings import CompiledSettings, PaystackSettings, override_paystack_settings, paystack_settings
+from djpaystack.webhooks.handlers import WebhookHandler
+
+
+def compile_settings(**overrides):
+    return CompiledSettings({**PaystackSettings.DEFAULTS, 'SECRET_KEY': 'sk_test_xxxxx', **overrides})
+
+
+class TestCompiledSettings:
+    """Test the frozen settings snapshot"""
+
+    def test_derived_values(self):
+        compiled = compile_settings(
+            ALLOWED_WEBHOOK_IPS=['10.0.0.0/8', '52.31.139.75'],
+            TIMEOUTS={'transaction/verify': (3, 10), 'bulkcharge': 120},
+        )
+        assert compiled.AUTH_HEADER == 'Bearer sk_test_xxxxx'
+        assert compiled.WEBHOOK_NETWORKS == (
+            ipaddress.ip_network('10.0.0.0/8'), ipaddress.ip_network('52.31.139.75/32'))
+        assert compiled.TIMEOUT_PROFILES == {'transaction/verify': (3, 10), 'bulkcharge': (None, 120)}
+
+    def test_frozen(self):
+        compiled = compile_settings()
+        with pytest.raises(AttributeError):
+            compiled.TIMEOUT = 1
+        with pytest.raises(AttributeError):
+            del compiled.TIMEOUT
+
+    @pytest.mark.parametrize('overrides', [
+        {'SECRET_KEY': None},
+        {'TIMEOUT': -1},
+        {'MAX_RETRIES': '3'},
+        {'AUDIT_SAMPLE_RATE': 2},
+        {'JSON_CODEC': 'simplejson'},
+        {'TIMEOUTS': {'customer': 'fast'}},
+        {'RATE_LIMITS': {'transfer': -5}},
+        {'ALLOWED_WEBHOOK_IPS': ['not-an-ip']},
+    ])
+    def test_invalid_values(self, overrides):
+        with pytest.raises(PaystackConfigurationError):
+            compile_settings(**overrides)
+
+    @pytest.mark.parametrize('environment', ['live', 'staging'])
+    def test_environment_is_free_form(self, environment):
+        assert compile_settings(ENVIRONMENT=environment).ENVIRONMENT == environment
+
+
+class TestPaystackSettings:
+    """Test settings are installed as attributes and rebuilt on change"""
+
+    def test_reads_are_plain_attributes(self):
+        paystack_settings.reload()
+        assert paystack_settings.__dict__['TIMEOUT'] == paystack_settings.TIMEOUT
+        assert paystack_settings.get('MISSING', 'x') == 'x'
+        with pytest.raises(AttributeError):
+            paystack_settings.NOT_A_SETTING
+
+    def test_rebuilt_on_setting_changed(self):
+        before = paystack_settings.compiled
+        with override_paystack_settings(TIMEOUT=7, SECRET_KEY='sk_test_other'):
+            assert paystack_settings.TIMEOUT == 7
+            assert paystack_settings.AUTH_HEADER == 'Bearer sk_test_other'
+            assert paystack_settings.WEBHOOK_SECRET == settings.PAYSTACK['WEBHOOK_SECRET']
+        assert paystack_settings.TIMEOUT == before.TIMEOUT
+        assert paystack_settings.compiled is not before
+
+
+class TestWebhookIPs:
+    """Test webhook IP checks against the parsed networks"""
+
+    def test_cidr_ranges(self):
+        with override_paystack_settings(ALLOWED_WEBHOOK_IPS=['10.1.0.0/16']):
+            handler = WebhookHandler()
+            assert handler.verify_ip('10.1.2.3')
+            assert not handler.verify_ip('10.2.0.1')
+            assert not handler.verify_ip('garbage')
+
+    def test_paystack_ips_by_default(self):
+        handler = WebhookHandler()
+        assert handler.verify_ip('52.31.139.75')
+        assert not handler.verify_ip('127.0.0.1')
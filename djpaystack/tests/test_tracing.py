@@ -0,0 +1,104 @@
+import pytest
+from unittest.mock import patch
+from djpaystack import tracing
+from djpaystack.settings import override_paystack_settings
+from djpaystack.webhooks.handlers import WebhookHandler
+from djpaystack.tests.conftest import make_response
+
+
+@pytest.fixture(scope='module')
+def exporter():
+    pytest.importorskip('opentelemetry.sdk')
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return exporter
+
+
+@pytest.fixture
+def spans(exporter):
+    exporter.clear()
+    yield exporter
+    exporter.clear()
+
+
+class TestNoOp:
+    """Test tracing helpers without a tracer"""
+
+    def test_disabled_tracing_is_a_no_op(self):
+        with override_paystack_settings(TRACING_ENABLED=False):
+            with tracing.span('paystack.test', endpoint='transaction') as span:
+                assert span is None
+            tracing.set_attributes(endpoint='transaction')
+
+    def test_traced_returns_function_without_opentelemetry(self):
+        def func():
+            return 1
+
+        with patch.object(tracing, 'trace', None):
+            assert tracing.traced('paystack.test')(func) is func
+
+
+class TestSpans:
+    """Test spans around requests, pagination and webhooks"""
+
+    def test_request_span(self, client, spans):
+        with patch.object(client.session, 'request',
+                          return_value=make_response({'status': True, 'data': {}})):
+            client.transactions.verify('ref_1')
+
+        span, = spans.get_finished_spans()
+        assert span.name == 'paystack.request'
+        assert span.attributes['paystack.endpoint'] == 'transaction/verify/{reference}'
+        assert span.attributes['paystack.reference'] == 'ref_1'
+        assert span.attributes['paystack.method'] == 'GET'
+        assert span.attributes['paystack.status_code'] == 200
+        assert span.attributes['paystack.attempts'] == 1
+
+    def test_paginate_span_parents_requests(self, client, spans):
+        responses = [
+            make_response({'status': True, 'data': [{'id': 1}], 'meta': {'page': 1, 'pageCount': 2}}),
+            make_response({'status': True, 'data': [{'id': 2}], 'meta': {'page': 2, 'pageCount': 2}}),
+        ]
+        with patch.object(client.session, 'request', side_effect=responses):
+            client.customers.list()
+
+        finished = spans.get_finished_spans()
+        paginate = next(span for span in finished if span.name == 'paystack.paginate')
+        requests = [span for span in finished if span.name == 'paystack.request']
+        assert len(requests) == 2
+        assert all(span.parent.span_id == paginate.context.span_id for span in requests)
+        assert paginate.attributes['paystack.items'] == 2
+
+    def test_webhook_handler_spans(self, spans):
+        handler = WebhookHandler()
+        handler.register('charge.success', lambda data: 'handled')
+
+        with override_paystack_settings(ENABLE_MODELS=False):
+            assert handler.handle_event('charge.success', {'reference': 'ref_1', 'id': 1}) == 'handled'
+
+        finished = {span.name: span for span in spans.get_finished_spans()}
+        event_span = finished['paystack.webhook.handle_event']
+        handler_span = finished['paystack.webhook.handler']
+        assert event_span.attributes['paystack.event_type'] == 'charge.success'
+        assert event_span.attributes['paystack.reference'] == 'ref_1'
+        assert handler_span.parent.span_id == event_span.context.span_id
+
+    def test_failed_request_records_error(self, client, spans):
+        from djpaystack.exceptions import PaystackAPIError
+        from opentelemetry.trace import StatusCode
+
+        with patch.object(client.session, 'request',
+                          return_value=make_response({'status': False, 'message': 'no'}, 400)):
+            with pytest.raises(PaystackAPIError):
+                client.customers.fetch('CUS_1')
+
+        span, = spans.get_finished_spans()
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.attributes['paystack.status_code'] == 400
@@ -1,4 +1,5 @@
 
+import json
 import pytest
 from unittest.mock import Mock, patch
 from djpaystack import PaystackClient
@@ -28,7 +29,7 @@ class TestTransactionAPI:
 
         with patch.object(client.session, 'request') as mock_request:
             mock_response = Mock()
-            mock_response.json.return_value = mock_paystack_response
+            mock_response.content = json.dumps(mock_paystack_response).encode()
             mock_response.status_code = 200
             mock_request.return_value = mock_response
 
@@ -44,8 +45,8 @@ class TestTransactionAPI:
 
             # Verify request was made with correct parameters
             args, kwargs = mock_request.call_args
-            assert kwargs['json']['email'] == 'test@example.com'
-            assert kwargs['json']['amount'] == 50000
+            assert json.loads(kwargs['data'])['email'] == 'test@example.com'
+            assert json.loads(kwargs['data'])['amount'] == 50000
 
     def test_verify_transaction_success(self, client, mock_paystack_response):
         """Test successful transaction verification"""
@@ -58,7 +59,7 @@ class TestTransactionAPI:
 
         with patch.object(client.session, 'request') as mock_request:
             mock_response = Mock()
-            mock_response.json.return_value = mock_paystack_response
+            mock_response.content = json.dumps(mock_paystack_response).encode()
             mock_response.status_code = 200
             mock_request.return_value = mock_response
 
@@ -80,7 +81,7 @@ class TestTransactionAPI:
 
         with patch.object(client.session, 'request') as mock_request:
             mock_response = Mock()
-            mock_response.json.return_value = mock_paystack_response
+            mock_response.content = json.dumps(mock_paystack_response).encode()
             mock_response.status_code = 200
             mock_request.return_value = mock_response
 
@@ -99,7 +100,7 @@ class TestTransactionAPI:
 
         with patch.object(client.session, 'request') as mock_request:
             mock_response = Mock()
-            mock_response.json.return_value = mock_paystack_response
+            mock_response.content = json.dumps(mock_paystack_response).encode()
             mock_response.status_code = 200
             mock_request.return_value = mock_response
 
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from djpaystack.exceptions import PaystackAPIError
+from djpaystack.response_cache import response_cache
+from djpaystack.tests.conftest import make_response
+
+
+RESOLVED = {'status': True, 'data': {'account_number': '0001234567', 'account_name': 'Ada Obi'}}
+UNRESOLVED = {'status': False, 'message': 'Could not resolve account name. Check parameters or try again.'}
+
+
+class TestAccountResolution:
+    """Test account-number resolution cache"""
+
+    def test_positive_result_cached(self, client):
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response(RESOLVED)
+            client.verification.resolve_account_number('0001234567', '058')
+            result = client.verification.resolve_account_number('0001234567', '058')
+
+        assert result['data']['account_name'] == 'Ada Obi'
+        assert mock_request.call_count == 1
+
+    def test_negative_result_cached(self, client):
+        """Test "could not resolve" is cached and raised again"""
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response(UNRESOLVED, 422)
+            for _ in range(2):
+                with pytest.raises(PaystackAPIError) as exc_info:
+                    client.verification.resolve_account_number('0009999999', '058')
+                assert exc_info.value.status_code == 422
+
+        assert mock_request.call_count == 1
+        assert response_cache.stats.snapshot()['negative_hits'] == 1
+
+    def test_auth_errors_not_cached(self, client):
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value = make_response({'status': False, 'message': 'Invalid key'}, 401)
+            for _ in range(2):
+                with pytest.raises(PaystackAPIError):
+                    client.verification.resolve_account_number('0001234567', '058')
+
+        assert mock_request.call_count == 2
+
+    def test_concurrent_lookups_share_one_request(self, client):
+        """Test single-flight deduplication of concurrent lookups"""
+        release = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            release.wait(5)
+            return make_response(RESOLVED)
+
+        with patch.object(client.session, 'request', side_effect=slow_request) as mock_request:
+            threads = [
+                threading.Thread(target=client.verification.resolve_account_number,
+                                 args=('0001234567', '058'))
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            deadline = time.monotonic() + 5
+            while response_cache.flights.stats.snapshot()['calls'] < 5 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        assert mock_request.call_count == 1
+        assert response_cache.flights.stats.dedup_ratio() == pytest.approx(0.8)
+
+    def test_resolve_many(self, client):
+        """Test bulk resolution reports per-account results and errors"""
+        def respond(method, url, params=None, **kwargs):
+            if params['account_number'] == '0009999999':
+                return make_response(UNRESOLVED, 422)
+            return make_response(RESOLVED)
+
+        accounts = [('0001234567', '058'), ('0009999999', '058'), ('0001234567', '058')]
+        with patch.object(client.session, 'request', side_effect=respond):
+            results = client.verification.resolve_many(accounts, max_concurrency=2)
+
+        assert set(results) == {('0001234567', '058'), ('0009999999', '058')}
+        assert results[('0001234567', '058')]['status'] is True
+        assert isinstance(results[('0009999999', '058')], PaystackAPIError)
+
+    def test_resolve_many_runs_in_callers_context(self, client):
+        """Test lookups on the worker threads see the caller's deadline"""
+        from djpaystack.deadline import paystack_deadline, remaining
+
+        seen = []
+
+        def respond(*args, **kwargs):
+            seen.append(remaining())
+            return make_response(RESOLVED)
+
+        with patch.object(client.session, 'request', side_effect=respond), paystack_deadline(30):
+            client.verification.resolve_many([('0001234567', '058'), ('0007654321', '058')])
+
+        assert len(seen) == 2 and None not in seen
+
+    def test_async_resolve_many(self):
+        httpx = pytest.importorskip('httpx')
+        from djpaystack import AsyncPaystackClient
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.params['account_number'])
+            return httpx.Response(200, json=RESOLVED)
+
+        async def run():
+            async with AsyncPaystackClient(secret_key='sk_test_xxxxx') as client:
+                client.session._transport = httpx.MockTransport(handler)
+                return await client.verification.resolve_many(
+                    [('0001234567', '058'), ('0007654321', '058')], max_concurrency=1)
+
+        results = asyncio.run(run())
+        assert len(results) == 2
+        assert sorted(calls) == ['0001234567', '0007654321']
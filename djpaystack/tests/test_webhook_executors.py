@@ -0,0 +1,119 @@
+import hashlib
+import hmac
+import json
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from django.test import RequestFactory
+from djpaystack.exceptions import PaystackConfigurationError
+from djpaystack.settings import override_paystack_settings
+from djpaystack.webhooks import executors
+from djpaystack.webhooks.executors import (
+    DatabaseWebhookExecutor,
+    ThreadWebhookExecutor,
+    WebhookExecutor,
+    get_webhook_executor,
+)
+from djpaystack.webhooks.views import PaystackWebhookView
+
+
+class RecordingExecutor(WebhookExecutor):
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, event_pk):
+        self.submitted.append(event_pk)
+
+
+def webhook_request(payload):
+    body = json.dumps(payload).encode()
+    signature = hmac.new(b'test_webhook_secret', body, hashlib.sha512).hexdigest()
+    return RequestFactory().post('/webhook/', data=body, content_type='application/json',
+                                 HTTP_X_PAYSTACK_SIGNATURE=signature)
+
+
+@pytest.fixture
+def fast_ack():
+    executor = RecordingExecutor()
+    with override_paystack_settings(WEBHOOK_FAST_ACK=True), \
+            patch('djpaystack.webhooks.views.get_webhook_executor', return_value=executor):
+        yield executor
+
+
+class TestFastAck:
+    """Test the acknowledge-first webhook view"""
+
+    payload = {'event': 'charge.success', 'data': {'reference': 'ref_1'}}
+
+    @pytest.mark.django_db(transaction=True)
+    def test_stores_and_submits_without_handling(self, fast_ack):
+        view = PaystackWebhookView.as_view()
+        with patch('djpaystack.webhooks.views.webhook_handler.store_event',
+                   return_value=Mock(pk=7)) as store_event, \
+                patch('djpaystack.webhooks.views.webhook_handler.handle_event') as handle_event:
+            response = view(webhook_request(self.payload))
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == {'status': 'accepted'}
+        assert store_event.call_args.args == ('charge.success', self.payload)
+        assert fast_ack.submitted == [7]
+        handle_event.assert_not_called()
+
+    @pytest.mark.django_db(transaction=True)
+    def test_duplicate_is_acknowledged(self, fast_ack):
+        view = PaystackWebhookView.as_view()
+        with patch('djpaystack.webhooks.views.webhook_handler.store_event', return_value=None):
+            response = view(webhook_request(self.payload))
+
+        assert response.status_code == 200
+        assert fast_ack.submitted == []
+
+    def test_unstored_event_is_not_acknowledged(self, fast_ack):
+        view = PaystackWebhookView.as_view()
+        with patch('djpaystack.webhooks.views.webhook_handler.store_event',
+                   side_effect=RuntimeError('database is down')):
+            response = view(webhook_request(self.payload))
+
+        assert response.status_code == 500
+        assert fast_ack.submitted == []
+
+    def test_requires_models(self):
+        with pytest.raises(PaystackConfigurationError):
+            with override_paystack_settings(WEBHOOK_FAST_ACK=True, ENABLE_MODELS=False):
+                get_webhook_executor()
+
+
+class TestExecutors:
+    """Test executor backends"""
+
+    def test_thread_executor_processes_off_the_request_thread(self):
+        seen = []
+
+        def process(event_pk):
+            seen.append((event_pk, threading.current_thread().name))
+
+        executor = ThreadWebhookExecutor(max_workers=2)
+        with patch.object(executors, 'process_webhook_event', side_effect=process):
+            executor.submit(3).result(timeout=5)
+        executor.close()
+
+        assert seen[0][0] == 3
+        assert seen[0][1].startswith('djpaystack-webhook')
+
+    def test_thread_executor_logs_failures(self):
+        executor = ThreadWebhookExecutor(max_workers=1)
+        with patch.object(executors, 'process_webhook_event', side_effect=RuntimeError('boom')):
+            assert executor.submit(3).result(timeout=5) is None
+        executor.close()
+
+    def test_backend_from_settings(self):
+        with override_paystack_settings(WEBHOOK_EXECUTOR='db'):
+            assert isinstance(get_webhook_executor(), DatabaseWebhookExecutor)
+        path = f'{__name__}.RecordingExecutor'
+        with override_paystack_settings(WEBHOOK_EXECUTOR=path):
+            assert isinstance(get_webhook_executor(), RecordingExecutor)
+
+    def test_unknown_backend(self):
+        with override_paystack_settings(WEBHOOK_EXECUTOR='rabbit'):
+            with pytest.raises(PaystackConfigurationError):
+                get_webhook_executor()
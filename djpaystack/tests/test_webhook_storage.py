@@ -0,0 +1,107 @@
+import hashlib
+import hmac
+import importlib
+import json
+from unittest.mock import patch
+from django.apps import apps
+from django.db import connection, transaction
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from djpaystack.exceptions import PaystackWebhookError
+from djpaystack.models import PaystackWebhookEvent
+from djpaystack.webhooks.events import WebhookEventData, webhook_event_id
+from djpaystack.webhooks.handlers import webhook_handler
+from djpaystack.webhooks.views import PaystackWebhookView
+
+
+class TestWebhookEventIdentity:
+    """Test the canonical webhook event ID"""
+
+    def test_prefers_id_then_reference(self):
+        assert webhook_event_id('charge.success', {'id': 42, 'reference': 'ref_1'}) == 'charge.success_42'
+        assert webhook_event_id('charge.success', {'reference': 'ref_1'}) == 'charge.success_ref_1'
+        assert webhook_event_id('transfer.success', {'transfer_code': 'TRF_1'}) == 'transfer.success_TRF_1'
+
+    def test_payload_hash_is_stable(self):
+        first = webhook_event_id('customeridentification.failed', {'email': 'a@b.com', 'reason': 'x'})
+        second = webhook_event_id('customeridentification.failed', {'reason': 'x', 'email': 'a@b.com'})
+        assert first == second
+
+    def test_event_data_uses_canonical_id(self):
+        data = {'id': 42, 'reference': 'ref_1'}
+        assert WebhookEventData('charge.success', data).event_id == webhook_event_id('charge.success', data)
+
+
+def webhook_request(payload):
+    body = json.dumps(payload).encode()
+    signature = hmac.new(b'test_webhook_secret', body, hashlib.sha512).hexdigest()
+    return RequestFactory().post('/webhook/', data=body, content_type='application/json',
+                                 HTTP_X_PAYSTACK_SIGNATURE=signature)
+
+
+class TestWebhookStorage(TestCase):
+    """Test insert-or-skip storage of webhook deliveries"""
+
+    payload = {'event': 'charge.success', 'data': {'id': 42, 'reference': 'ref_1'}}
+
+    def test_store_event_skips_duplicates(self):
+        with CaptureQueriesContext(connection) as queries:
+            event = webhook_handler.store_event('charge.success', self.payload)
+        assert event.event_id == 'charge.success_42'
+        assert [q['sql'].split()[0] for q in queries if 'SAVEPOINT' not in q['sql']] == ['INSERT']
+
+        assert webhook_handler.store_event('charge.success', self.payload) is None
+        assert PaystackWebhookEvent.objects.count() == 1
+
+    def test_duplicate_keeps_outer_transaction_usable(self):
+        webhook_handler.store_event('charge.success', self.payload)
+        with transaction.atomic():
+            assert webhook_handler.store_event('charge.success', self.payload) is None
+            assert PaystackWebhookEvent.objects.count() == 1
+
+    def test_redelivery_is_handled_once(self):
+        view = PaystackWebhookView.as_view()
+        with patch.object(webhook_handler, 'handle_event') as handle_event:
+            assert view(webhook_request(self.payload)).status_code == 200
+            response = view(webhook_request(self.payload))
+
+        assert json.loads(response.content) == {'status': 'duplicate'}
+        handle_event.assert_called_once_with('charge.success', self.payload['data'], check_duplicate=False)
+        event = PaystackWebhookEvent.objects.get()
+        assert event.processed and event.lease_owner == ''
+
+    def test_failed_event_is_retried_on_redelivery(self):
+        view = PaystackWebhookView.as_view()
+        with patch.object(webhook_handler, 'handle_event', side_effect=PaystackWebhookError('boom')):
+            assert view(webhook_request(self.payload)).status_code == 500
+        assert PaystackWebhookEvent.objects.get().processing_error == 'boom'
+
+        with patch.object(webhook_handler, 'handle_event') as handle_event:
+            assert view(webhook_request(self.payload)).status_code == 200
+        handle_event.assert_called_once()
+        event = PaystackWebhookEvent.objects.get()
+        assert event.processed and event.processing_error is None
+
+    def test_late_result_does_not_overwrite_new_lease(self):
+        view = PaystackWebhookView.as_view()
+
+        def handle_event(*args, **kwargs):
+            # The lease expired and a worker took the event meanwhile
+            PaystackWebhookEvent.objects.update(lease_owner='worker-1')
+            raise PaystackWebhookError('boom')
+
+        with patch.object(webhook_handler, 'handle_event', side_effect=handle_event):
+            assert view(webhook_request(self.payload)).status_code == 500
+
+        event = PaystackWebhookEvent.objects.get()
+        assert event.lease_owner == 'worker-1'
+        assert event.processing_error is None
+
+    def test_legacy_ids_are_migrated(self):
+        PaystackWebhookEvent.objects.create(
+            event_type='charge.success', event_id='charge.success_ref_1', data=self.payload, processed=True)
+        migration = importlib.import_module('djpaystack.migrations.0006_webhook_event_ids')
+        migration.rekey_webhook_events(apps, None)
+
+        assert PaystackWebhookEvent.objects.get().event_id == 'charge.success_42'
+        assert webhook_handler.store_event('charge.success', self.payload) is None
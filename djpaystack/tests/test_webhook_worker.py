@@ -0,0 +1,96 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import Mock, patch
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from djpaystack.exceptions import PaystackWebhookError
+from djpaystack.models import PaystackWebhookEvent
+from djpaystack.webhooks.worker import WebhookWorker, process_event
+
+
+def store_event(reference):
+    return PaystackWebhookEvent.objects.create(
+        event_type='charge.success',
+        event_id=f'charge.success_{reference}',
+        data={'event': 'charge.success', 'data': {'reference': reference}},
+    )
+
+
+class TestWebhookWorker(TestCase):
+    """Test claiming and processing stored webhook events"""
+
+    def setUp(self):
+        self.handler = Mock()
+        self.events = [store_event(f'ref_{i}') for i in range(3)]
+
+    def worker(self, name, batch_size=2):
+        return WebhookWorker(batch_size=batch_size, lease_seconds=60, worker_id=name, handler=self.handler)
+
+    def test_workers_claim_disjoint_batches(self):
+        first = self.worker('a').claim()
+        second = self.worker('b').claim()
+
+        assert len(first) == 2 and len(second) == 1
+        assert not {e.pk for e in first} & {e.pk for e in second}
+        assert self.worker('c').claim() == []
+
+    def test_skip_locked_claim(self):
+        with patch.object(connection.features, 'has_select_for_update_skip_locked', True):
+            claimed = self.worker('a', batch_size=10).claim()
+        assert [e.pk for e in claimed] == [e.pk for e in self.events]
+        assert set(PaystackWebhookEvent.objects.values_list('lease_owner', flat=True)) == {'a'}
+
+    def test_expired_lease_is_reclaimed(self):
+        self.worker('a', batch_size=10).claim()
+        PaystackWebhookEvent.objects.update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+        assert len(self.worker('b', batch_size=10).claim()) == 3
+
+    def test_results_are_recorded(self):
+        def handle_event(event_type, data, check_duplicate=True):
+            if data['reference'] == 'ref_1':
+                raise PaystackWebhookError('handler failed')
+
+        self.handler.handle_event.side_effect = handle_event
+        worker = self.worker('a', batch_size=10)
+        assert worker.run_once() == 3
+
+        processed = dict(PaystackWebhookEvent.objects.values_list('event_id', 'processed'))
+        assert processed == {'charge.success_ref_0': True, 'charge.success_ref_1': False,
+                             'charge.success_ref_2': True}
+        failed = PaystackWebhookEvent.objects.get(event_id='charge.success_ref_1')
+        assert failed.processing_error == 'handler failed'
+        assert failed.lease_owner == '' and failed.lease_expires_at is None
+        assert worker.stats.snapshot() == {'batches': 1, 'claimed': 3, 'processed': 2, 'failed': 1}
+        assert worker.backlog() == (0, 0.0)
+
+    def test_results_need_the_lease(self):
+        """Test a worker that lost its lease does not overwrite the new claim"""
+        def handle_event(event_type, data, check_duplicate=True):
+            # Another worker reclaims the events while the handler runs
+            PaystackWebhookEvent.objects.update(lease_owner='b')
+            raise PaystackWebhookError('handler failed')
+
+        self.handler.handle_event.side_effect = handle_event
+        worker = self.worker('a', batch_size=10)
+        worker.run_once()
+
+        assert set(PaystackWebhookEvent.objects.values_list('lease_owner', flat=True)) == {'b'}
+        assert not PaystackWebhookEvent.objects.filter(processing_error__isnull=False).exists()
+
+    def test_process_single_event_once(self):
+        with patch('djpaystack.webhooks.handlers.webhook_handler.handle_event') as handle_event:
+            assert process_event(self.events[0].pk) is True
+            assert process_event(self.events[0].pk) is False
+
+        handle_event.assert_called_once_with('charge.success', {'reference': 'ref_0'}, check_duplicate=False)
+
+    def test_command_once(self):
+        out = StringIO()
+        with patch('djpaystack.webhooks.handlers.webhook_handler.handle_event'):
+            call_command('process_paystack_webhooks', '--once', stdout=out)
+
+        assert 'processed=3 failed=0' in out.getvalue()
+        assert not PaystackWebhookEvent.objects.filter(processed=False).exists()
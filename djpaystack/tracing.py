@@ -0,0 +1,92 @@
+"""
+Optional OpenTelemetry tracing
+
+Requires the optional ``opentelemetry-api`` dependency::
+
+    pip install paystack-django[tracing]
+
+Outbound requests, pagination, webhook deliveries and webhook handlers
+get spans tagged with the endpoint template, event type and reference,
+under whichever tracer provider the project configures. Without
+OpenTelemetry, ``traced`` returns functions unchanged and ``span`` and
+``set_attributes`` do nothing. TRACING_ENABLED turns spans off at runtime.
+"""
+import contextlib
+import functools
+import inspect
+from typing import Callable, Optional
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover - optional dependency
+    trace = None
+
+from .instrumentation import endpoint_template
+from .settings import paystack_settings
+
+_NO_SPAN = contextlib.nullcontext()
+
+
+def _enabled() -> bool:
+    return trace is not None and paystack_settings.TRACING_ENABLED
+
+
+def _attributes(attributes) -> dict:
+    return {f'paystack.{name}': value for name, value in attributes.items() if value is not None}
+
+
+def span(name: str, **attributes):
+    """
+    Context manager running the block in a span
+
+    Attributes are prefixed with ``paystack.``; None values are skipped.
+    """
+    if not _enabled():
+        return _NO_SPAN
+    tracer = trace.get_tracer('djpaystack')
+    return tracer.start_as_current_span(name, attributes=_attributes(attributes))
+
+
+def set_attributes(**attributes):
+    """Tag the current span (see span)"""
+    if not _enabled():
+        return
+    trace.get_current_span().set_attributes(_attributes(attributes))
+
+
+def traced(name: str) -> Callable:
+    """
+    Decorator running a function (or coroutine function) in a span
+
+    A no-op when OpenTelemetry is not installed.
+    """
+    def decorator(func):
+        if trace is None:
+            return func
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def tag_request(method: str, endpoint: str, data: Optional[dict], params: Optional[dict]):
+    """Tag the current span with the endpoint template and reference of a request"""
+    if not _enabled():
+        return
+
+    template = endpoint_template(endpoint)
+    reference = (data or {}).get('reference') or (params or {}).get('reference')
+    if reference is None and template.endswith('{reference}'):
+        reference = endpoint.strip('/').rsplit('/', 1)[-1]
+    set_attributes(method=method.upper(), endpoint=template, reference=reference)
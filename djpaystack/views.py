@@ -1,3 +1,34 @@
-from django.shortcuts import render
+import hmac
 
-# Create your views here.
+from django.http import Http404, HttpResponse
+
+from .instrumentation import collector
+from .settings import paystack_settings
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def paystack_metrics(request):
+    """
+    Prometheus metrics of outbound Paystack requests
+
+    Enabled by METRICS_ENABLED; when METRICS_TOKEN is set, scrapers must
+    send ``Authorization: Bearer <token>``::
+
+        # urls.py
+        from djpaystack.views import paystack_metrics
+
+        urlpatterns = [
+            path('metrics/paystack/', paystack_metrics),
+        ]
+    """
+    if not paystack_settings.METRICS_ENABLED:
+        raise Http404("Paystack metrics are disabled")
+
+    token = paystack_settings.METRICS_TOKEN
+    if token:
+        supplied = request.META.get('HTTP_AUTHORIZATION', '')
+        if not hmac.compare_digest(supplied.encode(), f'Bearer {token}'.encode()):
+            return HttpResponse(status=401)
+
+    return HttpResponse(collector.render(), content_type=PROMETHEUS_CONTENT_TYPE)
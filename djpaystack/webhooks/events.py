@@ -1,4 +1,6 @@
 
+import hashlib
+import json
 from enum import Enum
 from typing import Dict, Any
 
@@ -70,6 +72,28 @@ class WebhookEvent(str, Enum):
         return event in cls.all_events()
 
 
+def webhook_event_id(event_type: str, data: Dict[str, Any]) -> str:
+    """
+    Canonical identity of a webhook event, used for storage and dedup
+
+    The event type plus the object's ``id``, else its ``reference`` or
+    ``transfer_code``. Payloads with none of these are identified by a hash
+    of their content, so redeliveries still match.
+
+    Args:
+        event_type: Event type
+        data: Event data
+
+    Returns:
+        Event ID
+    """
+    for key in ('id', 'reference', 'transfer_code'):
+        if data.get(key) not in (None, ''):
+            return f"{event_type}_{data[key]}"
+    digest = hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{event_type}_{digest[:32]}"
+
+
 class WebhookEventData:
     """
     Data structure for webhook events
@@ -82,16 +106,7 @@ class WebhookEventData:
 
     def _generate_event_id(self) -> str:
         """Generate unique event ID"""
-        # Try to get ID from various fields
-        if 'id' in self.data:
-            return f"{self.event}_{self.data['id']}"
-        elif 'reference' in self.data:
-            return f"{self.event}_{self.data['reference']}"
-        elif 'transfer_code' in self.data:
-            return f"{self.event}_{self.data['transfer_code']}"
-        else:
-            import uuid
-            return f"{self.event}_{uuid.uuid4().hex[:12]}"
+        return webhook_event_id(self.event, self.data)
 
     @property
     def reference(self) -> str:
@@ -0,0 +1,187 @@
+"""
+Background processing of acknowledged webhooks
+
+With WEBHOOK_FAST_ACK, the webhook view verifies the signature, stores the
+raw event as a PaystackWebhookEvent and answers Paystack at once. The
+handler and signal receivers then run on the WEBHOOK_EXECUTOR backend:
+
+- ``'thread'``: an in-process thread pool (WEBHOOK_EXECUTOR_WORKERS)
+- ``'db'``: nothing runs in the web process; ``manage.py
+  process_paystack_webhooks`` polls for unprocessed events
+- ``'celery'``: the ``djpaystack.webhooks.tasks.process_webhook_event`` task
+- the dotted path of a WebhookExecutor subclass
+
+Events are marked processed only after their handler succeeds. A failed
+event keeps the error in ``processing_error``; an event lost with its
+process (e.g. a thread pool job during a restart) stays unprocessed and is
+picked up by ``process_paystack_webhooks``.
+"""
+import atexit
+import concurrent.futures
+import contextvars
+import logging
+import os
+import threading
+from typing import Optional
+
+from ..exceptions import PaystackConfigurationError
+from ..settings import paystack_settings
+
+logger = logging.getLogger('djpaystack')
+
+
+def process_webhook_event(event_pk) -> bool:
+    """
+    Run the handler for a stored webhook event and record the outcome
+
+    The event is claimed like a batch of the ``process_paystack_webhooks``
+    worker, so it is not handled twice when both run.
+
+    Args:
+        event_pk: Primary key of the PaystackWebhookEvent
+
+    Returns:
+        True if the event was processed by this call
+    """
+    from .worker import process_event
+
+    return process_event(event_pk)
+
+
+class WebhookExecutor:
+    """
+    Runs stored webhook events after they have been acknowledged
+    """
+
+    def submit(self, event_pk):
+        """Schedule processing of a stored event (called after the insert commits)"""
+        raise NotImplementedError
+
+    def close(self):
+        """Finish or abandon scheduled work"""
+
+
+class ThreadWebhookExecutor(WebhookExecutor):
+    """Process events on an in-process thread pool"""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._pid != os.getpid():
+            with self._lock:
+                # Worker threads do not survive fork; build a pool per process
+                if self._pid != os.getpid():
+                    self._pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='djpaystack-webhook')
+                    self._pid = os.getpid()
+        return self._pool
+
+    @staticmethod
+    def _run(event_pk):
+        from django.db import close_old_connections
+
+        close_old_connections()
+        try:
+            process_webhook_event(event_pk)
+        except Exception as e:
+            logger.error(f"Background webhook processing failed for event {event_pk}: {str(e)}",
+                         exc_info=True)
+        finally:
+            close_old_connections()
+
+    def submit(self, event_pk):
+        context = contextvars.copy_context()
+        return self._get_pool().submit(context.run, self._run, event_pk)
+
+    def close(self):
+        with self._lock:
+            if self._pid == os.getpid() and self._pool is not None:
+                self._pool.shutdown(wait=True)
+            self._pool = None
+            self._pid = None
+
+
+class DatabaseWebhookExecutor(WebhookExecutor):
+    """Leave stored events for the ``process_paystack_webhooks`` worker"""
+
+    def submit(self, event_pk):
+        return None
+
+
+class CeleryWebhookExecutor(WebhookExecutor):
+    """Process events with the ``process_webhook_event`` Celery task"""
+
+    def __init__(self):
+        from .tasks import process_webhook_event_task
+
+        if process_webhook_event_task is None:
+            raise PaystackConfigurationError(
+                "WEBHOOK_EXECUTOR = 'celery' requires celery "
+                "(pip install paystack-django[celery])"
+            )
+        self.task = process_webhook_event_task
+
+    def submit(self, event_pk):
+        return self.task.delay(event_pk)
+
+
+def _build_executor(backend: str, max_workers: int) -> WebhookExecutor:
+    if backend == 'thread':
+        return ThreadWebhookExecutor(max_workers)
+    if backend == 'db':
+        return DatabaseWebhookExecutor()
+    if backend == 'celery':
+        return CeleryWebhookExecutor()
+
+    from django.utils.module_loading import import_string
+    try:
+        return import_string(backend)()
+    except ImportError:
+        raise PaystackConfigurationError(
+            f"WEBHOOK_EXECUTOR must be 'thread', 'db', 'celery' or the dotted path of a "
+            f"WebhookExecutor, got {backend!r}"
+        )
+
+
+_executor: Optional[WebhookExecutor] = None
+_executor_config = None
+_executor_lock = threading.Lock()
+
+
+def get_webhook_executor() -> WebhookExecutor:
+    """Get the process-wide executor configured by the WEBHOOK_EXECUTOR* settings"""
+    global _executor, _executor_config
+
+    config = (paystack_settings.WEBHOOK_EXECUTOR, paystack_settings.WEBHOOK_EXECUTOR_WORKERS)
+    if config != _executor_config:
+        with _executor_lock:
+            if config != _executor_config:
+                previous = _executor
+                _executor = _build_executor(*config)
+                _executor_config = config
+                if previous is not None:
+                    previous.close()
+    return _executor
+
+
+def close_webhook_executor():
+    if _executor is not None:
+        _executor.close()
+
+
+def _after_fork():
+    # The lock may have been held by another thread at fork time
+    global _executor_lock
+    _executor_lock = threading.Lock()
+    if isinstance(_executor, ThreadWebhookExecutor):
+        _executor._lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
+
+atexit.register(close_webhook_executor)
@@ -1,13 +1,16 @@
 
 import hashlib
 import hmac
+import ipaddress
 import logging
 from typing import Dict, Any, Callable, Optional
 from django.conf import settings
 
+from .. import tracing
 from ..settings import paystack_settings
 from ..exceptions import PaystackWebhookError
-from .events import WebhookEvent, WebhookEventData
+from ..response_cache import invalidate_for_event
+from .events import WebhookEvent, WebhookEventData, webhook_event_id
 from ..signals import (
     paystack_payment_successful,
     paystack_payment_failed,
@@ -29,6 +32,7 @@ PAYSTACK_WEBHOOK_IPS = [
     '52.49.173.169',
     '52.214.14.220',
 ]
+_PAYSTACK_WEBHOOK_NETWORKS = tuple(ipaddress.ip_network(ip) for ip in PAYSTACK_WEBHOOK_IPS)
 
 
 class WebhookHandler:
@@ -99,18 +103,23 @@ class WebhookHandler:
         Returns:
             True if IP is whitelisted
         """
-        allowed_ips = paystack_settings.ALLOWED_WEBHOOK_IPS
+        # Parsed once, when the settings are compiled; entries may be CIDR ranges
+        networks = paystack_settings.WEBHOOK_NETWORKS
 
         # If no IPs configured, allow Paystack default IPs
-        if not allowed_ips:
-            allowed_ips = PAYSTACK_WEBHOOK_IPS
+        if not networks:
+            networks = _PAYSTACK_WEBHOOK_NETWORKS
 
         # If list is empty, allow all (not recommended for production)
-        if not allowed_ips:
+        if not networks:
             logger.warning("No webhook IP whitelist configured - allowing all IPs")
             return True
 
-        return ip_address in allowed_ips
+        try:
+            address = ipaddress.ip_address(ip_address)
+        except ValueError:
+            return False
+        return any(address in network for network in networks)
 
     def verify_signature(self, payload: bytes, signature: str) -> bool:
         """
@@ -156,6 +165,98 @@ class WebhookHandler:
 
         return False
 
+    def store_event(self, event_type: str, payload: Dict[str, Any], ip_address: Optional[str] = None,
+                    user_agent: str = '', lease_owner: str = ''):
+        """
+        Store a webhook event unless one with the same identity is stored
+
+        The unique ``event_id`` makes the INSERT itself the dedup check, so
+        no lookup is needed first and concurrent deliveries on different
+        nodes cannot both be stored.
+
+        Args:
+            event_type: Event type
+            payload: Full webhook payload
+            ip_address: Sender IP address
+            user_agent: Sender User-Agent
+            lease_owner: Claim the event for this owner for WEBHOOK_WORKER_LEASE
+                seconds, keeping process_paystack_webhooks workers away from it
+
+        Returns:
+            The stored PaystackWebhookEvent, or None for a duplicate
+        """
+        from datetime import timedelta
+        from django.db import IntegrityError, connection, transaction
+        from django.utils import timezone
+        from ..models import PaystackWebhookEvent
+
+        event = PaystackWebhookEvent(
+            event_type=event_type,
+            event_id=webhook_event_id(event_type, payload.get('data') or {}),
+            data=payload,
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
+        if lease_owner:
+            event.lease_owner = lease_owner
+            event.lease_expires_at = timezone.now() + timedelta(
+                seconds=paystack_settings.WEBHOOK_WORKER_LEASE)
+
+        try:
+            if connection.in_atomic_block:
+                # A conflicting INSERT must not break the caller's transaction
+                with transaction.atomic():
+                    event.save(force_insert=True)
+            else:
+                event.save(force_insert=True)
+        except IntegrityError:
+            return None
+        return event
+
+    def retry_failed_event(self, event_id: str, lease_owner: str = '') -> bool:
+        """
+        Take back a stored event whose processing failed, so a redelivery
+        can run it again
+
+        Returns:
+            True if the event was failed and is now claimed by the caller
+        """
+        from datetime import timedelta
+        from django.utils import timezone
+        from ..models import PaystackWebhookEvent
+
+        now = timezone.now()
+        return PaystackWebhookEvent.objects.filter(
+            event_id=event_id, processed=False, processing_error__isnull=False,
+        ).update(
+            processing_error=None,
+            lease_owner=lease_owner,
+            lease_expires_at=now + timedelta(seconds=paystack_settings.WEBHOOK_WORKER_LEASE),
+            updated_at=now,
+        ) == 1
+
+    def finish_event(self, event_id: str, lease_owner: str, error: Optional[str] = None) -> bool:
+        """
+        Record the outcome of processing a stored event and release its lease
+
+        Nothing is written once the lease has passed to another owner (a
+        worker that reclaimed it after WEBHOOK_WORKER_LEASE), so a late
+        result cannot overwrite theirs.
+
+        Returns:
+            True if the caller still held the lease and the result was recorded
+        """
+        from django.utils import timezone
+        from ..models import PaystackWebhookEvent
+
+        return PaystackWebhookEvent.objects.filter(event_id=event_id, lease_owner=lease_owner).update(
+            processed=error is None,
+            processing_error=error,
+            lease_owner='',
+            lease_expires_at=None,
+            updated_at=timezone.now(),
+        ) == 1
+
     def mark_event_processed(self, event_id: str):
         """Mark event as processed"""
         self._processed_events.add(event_id)
@@ -167,13 +268,16 @@ class WebhookHandler:
             for item in to_remove:
                 self._processed_events.discard(item)
 
-    def handle_event(self, event_type: str, data: Dict[str, Any]) -> Any:
+    @tracing.traced('paystack.webhook.handle_event')
+    def handle_event(self, event_type: str, data: Dict[str, Any], check_duplicate: bool = True) -> Any:
         """
         Handle a webhook event
 
         Args:
             event_type: Event type
             data: Event data
+            check_duplicate: Skip events that were already seen (off when the
+                caller tracks processing itself, as the webhook executors do)
 
         Returns:
             Handler result
@@ -181,6 +285,11 @@ class WebhookHandler:
         Raises:
             PaystackWebhookError: If handler fails
         """
+        tracing.set_attributes(event_type=event_type, reference=data.get('reference'))
+
+        # Drop cached reference data the event makes stale
+        invalidate_for_event(event_type)
+
         # Validate event type
         if not WebhookEvent.is_valid(event_type):
             logger.warning(f"Unknown webhook event type: {event_type}")
@@ -190,7 +299,7 @@ class WebhookHandler:
         event_data = WebhookEventData(event_type, data)
 
         # Check for duplicate
-        if self.is_duplicate_event(event_data.event_id):
+        if check_duplicate and self.is_duplicate_event(event_data.event_id):
             logger.info(f"Duplicate event detected: {event_data.event_id} - skipping")
             return {'status': 'duplicate', 'message': 'Event already processed'}
 
@@ -202,7 +311,12 @@ class WebhookHandler:
 
         try:
             logger.info(f"Processing webhook event: {event_type}")
-            result = handler(data)
+            with tracing.span(
+                'paystack.webhook.handler',
+                event_type=event_type,
+                handler=getattr(handler, '__qualname__', type(handler).__name__),
+            ):
+                result = handler(data)
 
             # Mark as processed
             self.mark_event_processed(event_data.event_id)
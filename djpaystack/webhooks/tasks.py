@@ -0,0 +1,19 @@
+"""
+Celery task for WEBHOOK_EXECUTOR = 'celery'
+
+Requires celery (``pip install paystack-django[celery]``); make sure your
+Celery app autodiscovers ``djpaystack.webhooks``.
+"""
+try:
+    from celery import shared_task
+except ImportError:  # pragma: no cover
+    shared_task = None
+
+from .executors import process_webhook_event
+
+if shared_task is not None:
+    process_webhook_event_task = shared_task(
+        name='djpaystack.process_webhook_event', ignore_result=True,
+    )(process_webhook_event)
+else:  # pragma: no cover
+    process_webhook_event_task = None
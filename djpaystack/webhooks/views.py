@@ -1,18 +1,32 @@
-import json
+import functools
 import logging
+from django.db import transaction
 from django.http import JsonResponse, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 from django.utils.decorators import method_decorator
 from django.views import View
 
+from .executors import get_webhook_executor
+from .events import webhook_event_id
 from .handlers import webhook_handler
-from ..models import PaystackWebhookEvent
+from .. import codec, tracing
 from ..exceptions import PaystackWebhookError
 from ..settings import paystack_settings
 
 logger = logging.getLogger('djpaystack')
 
+# Lease owner of events being handled inside the webhook request
+VIEW_LEASE_OWNER = 'webhook-view'
+
+
+def _submit(event_pk):
+    try:
+        get_webhook_executor().submit(event_pk)
+    except Exception as e:
+        # The event is stored; process_paystack_webhooks will pick it up
+        logger.error(f"Failed to schedule webhook event {event_pk}: {str(e)}")
+
 
 @method_decorator(csrf_exempt, name='dispatch')
 @method_decorator(require_POST, name='dispatch')
@@ -21,6 +35,7 @@ class PaystackWebhookView(View):
     View for handling Paystack webhooks
     """
 
+    @tracing.traced('paystack.webhook')
     def post(self, request, *args, **kwargs):
         """Handle POST request from Paystack webhook"""
 
@@ -37,51 +52,82 @@ class PaystackWebhookView(View):
 
         # Parse payload
         try:
-            payload = json.loads(request.body)
-        except json.JSONDecodeError:
+            payload = codec.loads(request.body)
+        except ValueError:
             logger.error("Invalid JSON payload")
             return JsonResponse({'status': 'error', 'message': 'Invalid JSON'}, status=400)
 
         event_type = payload.get('event')
         data = payload.get('data', {})
+        tracing.set_attributes(event_type=event_type, reference=data.get('reference'))
 
         if not event_type:
             logger.error("Webhook payload missing event type")
             return JsonResponse({'status': 'error', 'message': 'Missing event type'}, status=400)
 
-        # Store webhook event if models are enabled
-        webhook_event = None
+        if paystack_settings.WEBHOOK_FAST_ACK:
+            return self._acknowledge(request, event_type, data, payload)
+
+        # Store the event if models are enabled; the unique insert also
+        # drops redeliveries
+        event_id = None
         if paystack_settings.ENABLE_MODELS:
             try:
-                webhook_event = PaystackWebhookEvent.objects.create(
-                    event_type=event_type,
-                    event_id=f"{event_type}_{data.get('reference', data.get('id', ''))}",
-                    data=payload,
+                stored = webhook_handler.store_event(
+                    event_type,
+                    payload,
                     ip_address=self._get_client_ip(request),
                     user_agent=request.headers.get('User-Agent', ''),
+                    lease_owner=VIEW_LEASE_OWNER,
                 )
             except Exception as e:
                 logger.error(f"Failed to store webhook event: {str(e)}")
+            else:
+                event_id = webhook_event_id(event_type, data)
+                # A redelivery of an event that failed is processed again
+                if stored is None and not webhook_handler.retry_failed_event(event_id, VIEW_LEASE_OWNER):
+                    logger.info(f"Duplicate webhook event {event_id} - skipping")
+                    return JsonResponse({'status': 'duplicate'})
 
         # Handle event
         try:
-            webhook_handler.handle_event(event_type, data)
+            webhook_handler.handle_event(event_type, data, check_duplicate=event_id is None)
 
-            if webhook_event:
-                webhook_event.processed = True
-                webhook_event.save()
+            if event_id:
+                webhook_handler.finish_event(event_id, VIEW_LEASE_OWNER)
 
             return JsonResponse({'status': 'success'})
 
         except PaystackWebhookError as e:
             logger.error(f"Webhook handling error: {str(e)}")
 
-            if webhook_event:
-                webhook_event.processing_error = str(e)
-                webhook_event.save()
+            if event_id:
+                webhook_handler.finish_event(event_id, VIEW_LEASE_OWNER, error=str(e))
 
             return JsonResponse({'status': 'error', 'message': str(e)}, status=500)
 
+    def _acknowledge(self, request, event_type, data, payload):
+        """Store the event, hand it to the webhook executor and answer at once"""
+        try:
+            webhook_event = webhook_handler.store_event(
+                event_type,
+                payload,
+                ip_address=self._get_client_ip(request),
+                user_agent=request.headers.get('User-Agent', ''),
+            )
+        except Exception as e:
+            # Not stored: let Paystack redeliver instead of acknowledging
+            logger.error(f"Failed to store webhook event: {str(e)}")
+            return JsonResponse({'status': 'error', 'message': 'Event not stored'}, status=500)
+
+        if webhook_event is None:
+            logger.info(f"Duplicate webhook event {event_type} - already stored")
+            return JsonResponse({'status': 'duplicate'})
+
+        # Runs at once, or when the caller's transaction (ATOMIC_REQUESTS) commits
+        transaction.on_commit(functools.partial(_submit, webhook_event.pk))
+        return JsonResponse({'status': 'accepted'})
+
     def _get_client_ip(self, request):
         """Get client IP address from request"""
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
@@ -0,0 +1,222 @@
+"""
+Database webhook worker
+
+Processes stored PaystackWebhookEvent rows (see WEBHOOK_FAST_ACK) so that
+any number of ``process_paystack_webhooks`` workers, on any number of
+nodes, can share the backlog without handling an event twice.
+
+A worker claims a batch by writing its id and a lease expiry into
+``lease_owner`` / ``lease_expires_at``. Where the database supports it
+(PostgreSQL, MySQL 8, Oracle) the candidate rows are selected with
+``SELECT ... FOR UPDATE SKIP LOCKED`` so concurrent workers pick disjoint
+batches without waiting on each other. Elsewhere (SQLite) the claim is a
+conditional UPDATE that only succeeds for rows whose lease is free, and
+the worker keeps the rows it won. A crashed worker's events become
+claimable again when their lease expires.
+
+Results are written only while the worker still holds the lease: one
+UPDATE for the processed events and one conditional UPDATE per failure,
+so a worker whose lease expired cannot overwrite another worker's claim.
+"""
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import timedelta
+from typing import List, Optional, Sequence, Tuple
+
+from django.db import connection, transaction
+from django.db.models import Min, Q
+from django.utils import timezone
+
+from ..instrumentation import Counters
+from ..settings import paystack_settings
+
+logger = logging.getLogger('djpaystack')
+
+
+class WorkerStats(Counters):
+    """Thread-safe webhook worker counters"""
+
+    FIELDS = (
+        'batches',
+        'claimed',
+        'processed',
+        'failed',
+    )
+
+
+class WebhookWorker:
+    """
+    Claims stored webhook events in batches and runs their handlers
+    """
+
+    def __init__(self, batch_size: Optional[int] = None, lease_seconds: Optional[float] = None,
+                 worker_id: Optional[str] = None, handler=None):
+        """
+        Initialize worker (defaults come from the WEBHOOK_WORKER_* settings)
+
+        Args:
+            batch_size: Events claimed per batch
+            lease_seconds: How long a claim keeps other workers away; longer
+                than the slowest batch takes to process
+            worker_id: Lease owner name (defaults to host:pid:random)
+            handler: WebhookHandler (defaults to the global webhook_handler)
+        """
+        self.batch_size = paystack_settings.WEBHOOK_WORKER_BATCH_SIZE \
+            if batch_size is None else batch_size
+        self.lease_seconds = paystack_settings.WEBHOOK_WORKER_LEASE \
+            if lease_seconds is None else lease_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        if handler is None:
+            from .handlers import webhook_handler as handler
+        self.handler = handler
+        self.stats = WorkerStats()
+        # Age (seconds) of the oldest event in the last batch when it was claimed
+        self.lag = 0.0
+
+    @staticmethod
+    def pending(now=None):
+        """Events waiting to be processed: unprocessed, not failed, lease free"""
+        from ..models import PaystackWebhookEvent
+
+        now = now or timezone.now()
+        return PaystackWebhookEvent.objects.filter(
+            Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lt=now),
+            processed=False,
+            processing_error__isnull=True,
+        )
+
+    def claim(self, pks: Optional[Sequence] = None) -> list:
+        """
+        Claim up to batch_size pending events, oldest first
+
+        Args:
+            pks: Only consider these events
+
+        Returns:
+            The claimed events
+        """
+        from ..models import PaystackWebhookEvent
+
+        now = timezone.now()
+        expires = now + timedelta(seconds=self.lease_seconds)
+        candidates = self.pending(now).order_by('created_at')
+        if pks is not None:
+            candidates = candidates.filter(pk__in=pks)
+
+        if connection.features.has_select_for_update_skip_locked:
+            with transaction.atomic():
+                ids = list(candidates.select_for_update(skip_locked=True)
+                           .values_list('pk', flat=True)[:self.batch_size])
+                PaystackWebhookEvent.objects.filter(pk__in=ids).update(
+                    lease_owner=self.worker_id, lease_expires_at=expires)
+        else:
+            ids = list(candidates.values_list('pk', flat=True)[:self.batch_size])
+            # Only rows whose lease is still free are taken; a concurrent worker
+            # that got there first keeps them
+            self.pending(now).filter(pk__in=ids).update(
+                lease_owner=self.worker_id, lease_expires_at=expires)
+
+        events = list(PaystackWebhookEvent.objects.filter(
+            pk__in=ids, lease_owner=self.worker_id).order_by('created_at'))
+
+        if events:
+            self.lag = (now - events[0].created_at).total_seconds()
+            self.stats.incr('batches')
+            self.stats.incr('claimed', len(events))
+        return events
+
+    def process(self, events: list) -> Tuple[List, List]:
+        """
+        Run the handler for claimed events and record the results under the lease
+
+        Returns:
+            Processed and failed events
+        """
+        from ..models import PaystackWebhookEvent
+
+        done, failed = [], []
+        for event in events:
+            try:
+                # The stored row is the idempotency record; its processed flag decides
+                self.handler.handle_event(
+                    event.event_type, (event.data or {}).get('data', {}), check_duplicate=False)
+            except Exception as e:
+                event.processing_error = str(e) or type(e).__name__
+                failed.append(event)
+            else:
+                done.append(event)
+
+        now = timezone.now()
+        if done:
+            PaystackWebhookEvent.objects.filter(
+                pk__in=[event.pk for event in done], lease_owner=self.worker_id,
+            ).update(processed=True, processing_error=None, lease_owner='',
+                     lease_expires_at=None, updated_at=now)
+        for event in failed:
+            PaystackWebhookEvent.objects.filter(
+                pk=event.pk, lease_owner=self.worker_id,
+            ).update(processing_error=event.processing_error, lease_owner='',
+                     lease_expires_at=None, updated_at=now)
+            logger.error(f"Webhook event {event.event_id} failed: {event.processing_error}")
+
+        self.stats.incr('processed', len(done))
+        self.stats.incr('failed', len(failed))
+        return done, failed
+
+    def run_once(self, pks: Optional[Sequence] = None) -> int:
+        """
+        Claim and process one batch
+
+        Returns:
+            Number of events claimed
+        """
+        events = self.claim(pks)
+        if events:
+            self.process(events)
+        return len(events)
+
+    def backlog(self) -> Tuple[int, float]:
+        """Pending event count and age in seconds of the oldest pending event"""
+        now = timezone.now()
+        pending = self.pending(now)
+        oldest = pending.aggregate(oldest=Min('created_at'))['oldest']
+        return pending.count(), (now - oldest).total_seconds() if oldest else 0.0
+
+    def run(self, interval: float = 1.0, stop: Optional[threading.Event] = None, on_batch=None):
+        """
+        Process batches until ``stop`` is set, sleeping ``interval`` when idle
+
+        Args:
+            interval: Seconds to wait when there is nothing to claim
+            stop: Event ending the loop
+            on_batch: Called after every poll with the number of events claimed
+        """
+        from django.db import close_old_connections
+
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            close_old_connections()
+            claimed = self.run_once()
+            if on_batch is not None:
+                on_batch(claimed)
+            if claimed < self.batch_size:
+                stop.wait(interval)
+
+
+def process_event(event_pk) -> bool:
+    """
+    Claim and process a single stored event
+
+    Returns:
+        True if the event was processed by this call
+    """
+    worker = WebhookWorker(batch_size=1)
+    events = worker.claim([event_pk])
+    if not events:
+        return False
+    done, _ = worker.process(events)
+    return bool(done)
+
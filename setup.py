@@ -24,6 +24,18 @@ setup(
         "python-decouple>=3.5",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.23",
+        ],
+        "fast-json": [
+            "orjson>=3.6",
+        ],
+        "tracing": [
+            "opentelemetry-api>=1.0",
+        ],
+        "celery": [
+            "celery>=5.0",
+        ],
         "dev": [
             "pytest>=7.0",
             "pytest-django>=4.5",